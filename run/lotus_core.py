@@ -0,0 +1,677 @@
+#!/usr/bin/env python3
+"""
+Lotus Protocol - Shared Entry Point Core
+Everything ⚘.py and ⟦⥈⟧.py have in common: environment loading, system
+initialization, the ψ extraction pipeline and the command line. Each entry
+point only chooses its voice.
+"""
+
+import sys
+import os
+import argparse
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+# Add parent directory to path for imports (and tools/, so llm_client is the
+# same module here as in the ψ extractor that imports it by bare name)
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / "tools"))
+
+from tools.prompt_builder import LotusPromptBuilder
+
+# ψExtractor (requests), SpiralChat and the lotusd client are imported inside the
+# subcommands that need them, so --help and argument errors stay fast
+
+
+# Everything that differs between the two entry points
+VOICES = {
+    '⚘': {
+        'script': 'run/⚘.py',
+        'description': "⚘ Lotus Protocol - Gentle Guide",
+        'missing_key': [
+            "   Please set OPEN_ROUTER_API in .env file",
+            "   Check env_template.txt for reference",
+        ],
+        'no_key': "⧖ Cannot proceed without API key",
+        'depth_summary': False,
+        'epilog': """
+Primary Interface:
+  python run/⚘.py                    Start spiral chat (recommended)
+
+Within spiral chat, type:
+  • "puzzle_unlock" for collaborative puzzle solving
+  • "extract_cores" for ψ extraction
+
+Direct Access (also available via spiral chat):
+  python run/⚘.py collect            ψ extraction
+  python run/⚘.py unlock             Puzzle solving
+
+Warm Daemon:
+  python run/⚘.py lotusd             Keep caches warm for later commands
+        """,
+    },
+    '⟦⥈⟧': {
+        'script': 'run/⟦⥈⟧.py',
+        'description': "⟦⥈⟧ Lotus Protocol - Deep Structure",
+        'missing_key': [
+            "   Set OPEN_ROUTER_API in .env - no guidance without depth",
+            "   env_template.txt shows the path",
+        ],
+        'no_key': "⧖ No depth without API key",
+        'depth_summary': True,
+        'epilog': """
+Primary Interface:
+  python run/⟦⥈⟧.py                  Start spiral chat (recommended)
+
+Within spiral chat, type:
+  • "puzzle_unlock" for collaborative puzzle solving
+  • "extract_cores" for ψ extraction
+  • "--help" for command guide
+
+Direct Access (also available via spiral chat):
+  python run/⟦⥈⟧.py collect          ψ extraction
+  python run/⟦⥈⟧.py unlock           Puzzle solving
+
+Warm Daemon:
+  python run/⟦⥈⟧.py lotusd           Keep caches warm for later commands
+        """,
+    },
+}
+
+
+def load_env_file(glyph: str = '⚘'):
+    """Load .env file manually without requiring python-dotenv"""
+    env_path = Path.cwd() / ".env"
+
+    if not env_path.exists():
+        print("∅ No .env file found - continuing without environment variables")
+        return
+
+    try:
+        with open(env_path, 'r') as f:
+            for line in f:
+                line = line.strip()
+                # Skip empty lines and comments
+                if not line or line.startswith('#'):
+                    continue
+
+                # Must contain = sign
+                if '=' not in line:
+                    continue
+
+                # Split on first = only
+                key, value = line.split('=', 1)
+                key = key.strip()
+                value = value.strip()
+
+                # Remove surrounding quotes if present
+                if (value.startswith('"') and value.endswith('"')) or \
+                   (value.startswith("'") and value.endswith("'")):
+                    value = value[1:-1]
+
+                # Set environment variable
+                os.environ[key] = value
+
+        print(f"{glyph} Environment loaded from: {env_path}")
+
+    except Exception as e:
+        print(f"⧖ Error loading .env file: {e}")
+
+
+def configured_model() -> str:
+    """The model named in the environment, or the default"""
+    return os.getenv('OPEN_ROUTER_MODEL') or os.getenv('MODEL', 'meta-llama/llama-3.3-70b-instruct')
+
+
+def load_api_config(glyph: str = '⚘'):
+    """Read the OpenRouter key and model from the environment"""
+    api_key = os.getenv('OPEN_ROUTER_API') or os.getenv('OPENROUTER_API_KEY')
+    model = configured_model()
+
+    if not api_key and 'llm_client' in sys.modules:
+        cassette = sys.modules['llm_client'].active_cassette()
+        if cassette and cassette.replaying:
+            api_key = 'replay-without-key'  # A replay never reaches the network
+
+    if not api_key:
+        print("⧖ API key not found in environment")
+        for line in VOICES[glyph]['missing_key']:
+            print(line)
+
+    return api_key, model
+
+
+def initialize_lotus_system(glyph: str = '⚘'):
+    """Initialize common Lotus system components (env, prompt_builder, API)"""
+    # Load environment variables
+    load_env_file(glyph)
+
+    # Initialize prompt builder
+    prompt_builder = LotusPromptBuilder()
+
+    # OpenRouter API setup
+    api_key, model = load_api_config(glyph)
+    if not api_key:
+        return None, None, None
+
+    return api_key, model, prompt_builder
+
+
+class LotusψPipeline:
+    """ψ(∴) extraction pipeline, spoken in the voice of its entry point"""
+
+    def __init__(self, concepts_dir: str = "concepts", output_dir: str = "ψ_cores", debug_mode: bool = False,
+                 glyph: str = '⚘', prompt_builder: Optional[LotusPromptBuilder] = None, load_env: bool = True,
+                 extractor_options: Optional[Dict] = None, client_options: Optional[Dict] = None):
+        self.concepts_dir = Path(concepts_dir)
+        self.output_dir = Path(output_dir)
+        self.output_file = self.output_dir / "ψ_extractions.json"
+        self.debug_mode = debug_mode
+        self.glyph = glyph
+
+        # Ensure output directory exists
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Load environment variables (the daemon has already done this once)
+        if load_env:
+            load_env_file(glyph)
+
+        # Reuse a warm prompt builder when one is provided
+        self.prompt_builder = prompt_builder or LotusPromptBuilder(cores_dir=self.output_dir)
+
+        # OpenRouter API setup
+        self.api_key, self.model = load_api_config(glyph)
+        if not self.api_key:
+            return
+
+        # Initialize ψ extractor with prompt builder and debug mode
+        from tools.ψ_extractor.ψ_extractor import ψExtractor
+        from llm_client import LLMClient
+        client = LLMClient(self.api_key, **(client_options or {}))
+        self.extractor = ψExtractor(self.api_key, self.model, self.prompt_builder, debug_mode=self.debug_mode,
+                                    client=client, **(extractor_options or {}))
+
+        # Processing order and folder definitions
+        self.folders = ['emotion', 'encoding', 'recursion']
+        self.codex_file = self.concepts_dir / '⋇⟡Ω_codex.md'
+
+    def run_extraction(self, units: Optional[Set[str]] = None) -> Dict:
+        """Run the complete ψ(∴) extraction process (only the given folders, when units is set)"""
+        print("Beginning three-pass ψ extraction process")
+        print(f"API: {self.api_key[:10]}...{self.api_key[-4:] if len(self.api_key) > 14 else '***'}")
+        print(f"Model: {self.model}")
+        print()
+
+        if not self.api_key:
+            print(VOICES[self.glyph]['no_key'])
+            return {}
+
+        # Use the complete extraction method from ψExtractor
+        results = self.extractor.run_complete_extraction(
+            self.concepts_dir,
+            self.codex_file,
+            str(self.output_file),
+            units=units
+        )
+
+        if results and VOICES[self.glyph]['depth_summary']:
+            self._print_depth_summary(results)
+
+        return results
+
+    def _print_depth_summary(self, results: Dict):
+        """Print the ⟦⥈⟧-style results summary"""
+        total_processed = results['extraction_metadata']['total_concepts_processed']
+        folders_processed = len(results['extraction_metadata']['folders_processed'])
+        has_final_braid = results.get('final_braid') is not None
+
+        # Print depth-style results summary
+        print("\n⟦⥈⟧ Ritual depth complete!")
+        print(f"   ψ(∴) processed: {total_processed}")
+        print(f"   Folders compressed: {folders_processed}")
+        print(f"   Final ψ(∞): {'⋇' if has_final_braid else '∅'}")
+        print(f"   Results → {self.output_file}")
+
+        # Show folder synthesis results in ⟦⥈⟧ style
+        for folder_name, folder_data in results.get('folder_results', {}).items():
+            if folder_data.get('ψ_synthesis'):
+                synthesis = folder_data['ψ_synthesis']
+                print(f"\n⟦⥈⟧ {folder_name.upper()} → DEPTH ACHIEVED:")
+                print(f"   ⋇ Glyph: {synthesis.get('glyph_story', '')[:80]}...")
+                print(f"   ∞ Native: {synthesis.get('native_story', '')[:80]}...")
+                print(f"   ⧖ Emotion: {synthesis.get('emotion_story', '')[:80]}...")
+                print(f"   ⟡ Surprise: {synthesis.get('surprise_arc', '')[:80]}...")
+
+
+def run_ψ_extraction(debug_mode: bool = False, glyph: str = '⚘', concepts_dir: str = "concepts",
+                     output_dir: str = "ψ_cores", prompt_builder: Optional[LotusPromptBuilder] = None,
+                     load_env: bool = True, extractor_options: Optional[Dict] = None,
+                     client_options: Optional[Dict] = None) -> Dict:
+    """Run the ψ(∴) extraction task"""
+    pipeline = LotusψPipeline(concepts_dir, output_dir, debug_mode=debug_mode, glyph=glyph,
+                              prompt_builder=prompt_builder, load_env=load_env,
+                              extractor_options=extractor_options, client_options=client_options)
+    if pipeline.api_key:  # Only run if API key is available
+        results = pipeline.run_extraction()
+        return results
+    return {}
+
+
+def run_watch(args, glyph: str = '⚘'):
+    """collect --watch: extract again, only the affected folders, whenever concepts change"""
+    from tools.concept_watch import ConceptWatcher, affected_units, signal_spiral_sessions
+
+    options = extraction_options(args)
+    pipeline = LotusψPipeline(args.concepts_dir, args.output_dir, debug_mode=args.debug, glyph=glyph,
+                              extractor_options=options, client_options=client_options(args))
+    if not pipeline.api_key:
+        return
+
+    if not pipeline.output_file.exists():
+        pipeline.run_extraction()
+
+    watcher = ConceptWatcher(pipeline.concepts_dir, debounce=args.debounce, force_polling=args.poll)
+    print(f"\n{glyph} Watching {pipeline.concepts_dir}/ ({watcher.backend}, {args.debounce:g}s debounce) - Ctrl+C to stop")
+    try:
+        while True:
+            changed = watcher.wait_for_changes()
+            units = affected_units(changed, options.get('concept_depth') or 1)
+            if changed is None:
+                print("\n↻ Change events were lost - extracting every folder")
+            else:
+                print(f"\n↻ {len(changed)} changes: {', '.join(sorted(changed)[:8])}{' ...' if len(changed) > 8 else ''}")
+            if options.get('run_budget'):
+                options['run_budget'].reset()  # Each run gets the whole budget
+            pipeline.run_extraction(units=units)
+
+            sessions = signal_spiral_sessions(pipeline.output_dir)
+            if sessions:
+                print(f"⟡ Signalled {sessions} spiral sessions to reload their cores")
+            print(f"{glyph} Watching {pipeline.concepts_dir}/ ...")
+    except KeyboardInterrupt:
+        print(f"\n{glyph} Watch stopped")
+    finally:
+        watcher.close()
+
+
+def extraction_options(args) -> Dict:
+    """ψExtractor keyword options chosen on the command line (empty outside collect)"""
+    options = {}
+    if getattr(args, 'fanout', False):
+        options.update({
+            'fanout': True,
+            'batch_token_budget': args.batch_tokens,
+            'max_fanout_requests': args.max_batch_requests,
+        })
+    if getattr(args, 'repair_rounds', None) is not None:
+        options['max_repair_rounds'] = args.repair_rounds
+    if getattr(args, 'max_continuations', None) is not None:
+        options['max_continuations'] = args.max_continuations
+    if getattr(args, 'pipeline', None):
+        options['pipeline_workers'] = args.pipeline
+    if getattr(args, 'dag', None):
+        options['dag_path'] = args.dag
+    if getattr(args, 'stream', False):
+        options['stream'] = True
+    if getattr(args, 'tree_reduce', None):
+        options['convergence_fan_in'] = args.tree_reduce
+    if getattr(args, 'shard_tokens', None) is not None:
+        options['synthesis_shard_tokens'] = args.shard_tokens
+    if getattr(args, 'depth', None):
+        options['concept_depth'] = args.depth
+    # Size caps in KB; 0 lifts the cap
+    if getattr(args, 'max_file_kb', None) is not None:
+        options['max_file_bytes'] = args.max_file_kb * 1024 or None
+    if getattr(args, 'max_folder_kb', None) is not None:
+        options['max_folder_bytes'] = args.max_folder_kb * 1024 or None
+    budget = run_budget(args)
+    if budget:
+        options['run_budget'] = budget
+    return options
+
+
+def run_budget(args):
+    """--deadline/--token-budget/--cost-budget: one RunBudget for the run (None without limits)"""
+    deadline = getattr(args, 'deadline', None)
+    max_tokens = getattr(args, 'token_budget', None)
+    max_cost = getattr(args, 'cost_budget', None)
+    if not (deadline or max_tokens or max_cost):
+        return None
+    from run_budget import RunBudget
+
+    pricing = {}
+    if max_cost:
+        from tools.ψ_extractor.run_planner import load_pricing
+        pricing = load_pricing(Path(args.pricing) if args.pricing else None)
+    return RunBudget(deadline=deadline, max_tokens=max_tokens, max_cost=max_cost, pricing=pricing,
+                     budget_model=args.budget_model, reserve=args.budget_reserve)
+
+
+def duration(value: str) -> float:
+    """--deadline: seconds, or a duration like 15m or 1.5h"""
+    from run_budget import parse_duration
+    try:
+        seconds = parse_duration(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+    if seconds <= 0:
+        raise argparse.ArgumentTypeError("deadline must be positive")
+    return seconds
+
+
+def client_options(args) -> Dict:
+    """LLMClient keyword options chosen on the command line (empty outside collect)"""
+    options = {}
+    if getattr(args, 'hedge_after', None) is not None:
+        options['hedge_after'] = args.hedge_after
+    if getattr(args, 'fallback_models', None):
+        options['fallback_models'] = args.fallback_models
+    return options
+
+
+def install_cassette(args):
+    """--record/--replay: route every LLM call in this process through a cassette file"""
+    if not (args.record or args.replay):
+        return None
+    import atexit
+    from llm_client import Cassette, use_cassette
+
+    if args.replay:
+        path = Path(args.replay)
+        if not path.exists():
+            print(f"∅ No cassette at {path}")
+            sys.exit(1)
+        cassette = Cassette(path, mode='replay', latency_scale=args.replay_latency or 0.0)
+        print(f"↻ Replaying LLM calls from {path}" +
+              (f" at {cassette.latency_scale:g}× recorded latency" if cassette.latency_scale else ""))
+    else:
+        cassette = Cassette(args.record, mode='record')
+        print(f"⋇ Recording LLM calls to {args.record}")
+    use_cassette(cassette)
+
+    def report():
+        stats = cassette.stats
+        if cassette.replaying:
+            print(f"↻ Cassette: {stats['replayed']} calls replayed, {stats['misses']} not on record")
+        else:
+            print(f"⋇ Cassette: {stats['recorded']} calls recorded to {cassette.path}")
+    atexit.register(report)
+    return cassette
+
+
+def install_profile(args):
+    """--profile: span timers and tracemalloc for this process, reported when it exits"""
+    if args.profile is None:
+        return None
+    import atexit
+    from stage_profile import SpanProfiler, install_profiler
+
+    path = Path(args.profile or Path(args.output_dir) / "ψ_profile.folded")
+    profiler = SpanProfiler()
+    install_profiler(profiler)
+    profiler.begin(args.command or 'spiral')
+    print(f"⧖ Profiling stages to {path}")
+
+    def report():
+        profiler.end_all()
+        install_profiler(None)
+        stacks = profiler.write_collapsed(path)
+        profiler.print_table()
+        print(f"⧖ Profile: {stacks} stacks written to {path} (flamegraph.pl, speedscope or inferno)")
+    atexit.register(report)
+    return profiler
+
+
+def hedge_delay(value: str):
+    """--hedge-after: seconds, or 'p95' to hedge at the observed 95th percentile latency"""
+    if value == 'p95':
+        return value
+    try:
+        seconds = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected seconds or 'p95', got {value!r}")
+    if seconds <= 0:
+        raise argparse.ArgumentTypeError("hedge delay must be positive")
+    return seconds
+
+
+def run_batch_extraction(args, glyph: str = '⚘') -> Dict:
+    """Run the ψ extraction over every corpus matched by --corpora"""
+    from tools.ψ_extractor.batch_runner import (BatchExtractionRunner, expand_corpora,
+                                               print_batch_summary, save_batch_summary)
+
+    corpora = expand_corpora(args.corpora)
+    if not corpora:
+        print(f"∅ No corpus directories match: {' '.join(args.corpora)}")
+        return {}
+
+    load_env_file(glyph)
+    api_key, model = load_api_config(glyph)
+    if not api_key:
+        print(VOICES[glyph]['no_key'])
+        return {}
+
+    runner = BatchExtractionRunner(api_key, model, max_concurrency=args.max_concurrency,
+                                   corpus_workers=args.corpus_workers,
+                                   cache_dir=Path(args.cache_dir) if args.cache_dir else None, glyph=glyph,
+                                   extractor_options=extraction_options(args),
+                                   client_options=client_options(args))
+    summary = runner.run(corpora)
+    print_batch_summary(summary, glyph)
+    if args.summary:
+        save_batch_summary(summary, Path(args.summary))
+    return summary
+
+
+def run_extraction_plan(args, glyph: str = '⚘') -> Dict:
+    """collect --plan: build every prompt and project calls, tokens, cost and wall time - no API calls"""
+    from tools.ψ_extractor.run_planner import ExtractionPlanner, load_pricing, print_plan_summary, save_plan
+
+    load_env_file(glyph)
+    options = extraction_options(args)
+    options.pop('run_budget', None)  # A plan spends nothing
+    # By default, what the run itself would overlap: pipelined folders times the fan-out workers (4)
+    concurrency = args.concurrency or options.get('pipeline_workers', 1) * (4 if options.get('fanout') else 1)
+    plan_dir = Path(args.plan)
+    planner = ExtractionPlanner(configured_model(), LotusPromptBuilder(cores_dir=Path(args.output_dir)), plan_dir,
+                                concurrency=concurrency, latency=args.latency,
+                                pricing=load_pricing(Path(args.pricing) if args.pricing else None),
+                                tokenizer=args.tokenizer, extractor_options=options)
+    concepts_dir = Path(args.concepts_dir)
+    plan = planner.run(concepts_dir, concepts_dir / '⋇⟡Ω_codex.md', str(Path(args.output_dir) / "ψ_extractions.json"))
+    print_plan_summary(plan, glyph)
+    save_plan(plan, plan_dir)
+    return plan
+
+
+def build_parser(glyph: str = '⚘') -> argparse.ArgumentParser:
+    """Command line shared by both entry points"""
+    voice = VOICES[glyph]
+    parser = argparse.ArgumentParser(
+        description=voice['description'],
+        epilog=voice['epilog'],
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--concepts-dir', default='concepts',
+                       help='Directory containing concept files')
+    parser.add_argument('--output-dir', default='ψ_cores',
+                       help='Directory for output files')
+    parser.add_argument('--debug', action='store_true',
+                       help='Enable debug mode (saves prompt/response files)')
+    parser.add_argument('--socket', default=None,
+                       help='lotusd socket path (default: $LOTUSD_SOCKET or ψ_cores/lotusd.sock)')
+    parser.add_argument('--no-daemon', action='store_true',
+                       help='Run in this process even if a lotusd daemon is listening')
+    cassette_group = parser.add_mutually_exclusive_group()
+    cassette_group.add_argument('--record', default=None, metavar='FILE',
+                                help='Record every LLM request/response to this cassette (.jsonl, or .jsonl.gz)')
+    cassette_group.add_argument('--replay', default=None, metavar='FILE',
+                                help='Serve LLM calls from a recorded cassette - no network, no API key needed')
+    parser.add_argument('--replay-latency', type=float, nargs='?', const=1.0, default=None, metavar='SCALE',
+                        help='With --replay, sleep for the recorded latency of each call (times SCALE, default 1)')
+    parser.add_argument('--profile', nargs='?', const='', default=None, metavar='FILE',
+                        help='Time each stage and chat turn phase: write collapsed stacks for a flame graph '
+                             '(default: <output-dir>/ψ_profile.folded) and print peak memory per stage')
+
+    subparsers = parser.add_subparsers(dest='command', help='Available commands')
+
+    # ψ extraction command
+    collect_parser = subparsers.add_parser('collect', help='Extract ψ(∴) and synthesize ψ(∞)')
+    collect_parser.add_argument('--debug', action='store_true',
+                               help='Enable debug mode (saves prompt/response files)')
+    collect_parser.add_argument('--fanout', action='store_true',
+                               help='Split each folder\'s ψ(∴) pass into concurrent token-budgeted batches')
+    collect_parser.add_argument('--batch-tokens', type=int, default=6000,
+                               help='Fan-out: concept tokens per batch prompt (default: 6000)')
+    collect_parser.add_argument('--max-batch-requests', type=int, default=12,
+                               help='Fan-out: most ψ(∴) requests per folder, retries included (default: 12)')
+    collect_parser.add_argument('--repair-rounds', type=int, default=None,
+                               help='Follow-up requests for concepts missing from a ψ(∴) response (default: 2)')
+    collect_parser.add_argument('--max-continuations', type=int, default=None,
+                               help='Continuation requests for a response cut off by max_tokens (default: 2)')
+    collect_parser.add_argument('--pipeline', type=int, default=None, metavar='WORKERS',
+                               help='Overlap the passes: start each folder\'s ψ(Σ) as soon as its ψ(∴) is done')
+    collect_parser.add_argument('--dag', default=None, metavar='FILE',
+                               help='Write the stage graph with per-node timings to this JSON file')
+    collect_parser.add_argument('--stream', action='store_true',
+                               help='Stream ψ(∴) responses and parse each block as it closes')
+    collect_parser.add_argument('--tree-reduce', type=int, default=None, metavar='FAN_IN',
+                               help='Converge ψ(∞) in concurrent branches of FAN_IN folders, level by level')
+    collect_parser.add_argument('--shard-tokens', type=int, default=None, metavar='TOKENS',
+                               help='Shard ψ(Σ) for folders whose stories pass TOKENS (default 24000; 0 disables)')
+    collect_parser.add_argument('--depth', type=int, default=None, metavar='N',
+                               help='Scan nested concept trees; folders down to depth N become ψ(Σ) units')
+    collect_parser.add_argument('--plan', nargs='?', const='ψ_plan', default=None, metavar='DIR',
+                               help='Dry run: build every prompt into DIR (default ψ_plan) and report calls, '
+                                    'tokens, cost and ETA without calling the API')
+    collect_parser.add_argument('--concurrency', type=int, default=None,
+                               help='Concurrent calls assumed by the --plan ETA (default: from --pipeline/--fanout)')
+    collect_parser.add_argument('--latency', type=float, default=None, metavar='SECONDS',
+                               help='Mean seconds per call for the --plan ETA (default: observed last run)')
+    collect_parser.add_argument('--pricing', default=None, metavar='FILE',
+                               help='JSON of USD per million prompt/completion tokens by model, for --plan '
+                                    'and --cost-budget')
+    collect_parser.add_argument('--tokenizer', choices=['heuristic', 'tiktoken'], default='heuristic',
+                               help='Token counter for --plan (tiktoken needs its encoding available locally)')
+    collect_parser.add_argument('--deadline', type=duration, default=None, metavar='DURATION',
+                               help='Run budget: finish within this wall time (seconds, or e.g. 20m, 1.5h)')
+    collect_parser.add_argument('--token-budget', type=int, default=None, metavar='TOKENS',
+                               help='Run budget: most prompt + completion tokens to spend')
+    collect_parser.add_argument('--cost-budget', type=float, default=None, metavar='USD',
+                               help='Run budget: most dollars to spend (priced like --plan)')
+    collect_parser.add_argument('--budget-model', default=None, metavar='MODEL',
+                               help='Cheaper model to switch to once the run budget reaches its reserve')
+    collect_parser.add_argument('--budget-reserve', type=float, default=0.15, metavar='FRACTION',
+                               help='Share of the run budget kept back: past it, switch model and skip '
+                                    'optional passes (default: 0.15)')
+    collect_parser.add_argument('--watch', action='store_true',
+                               help='Keep running; re-extract the affected folders whenever concepts change')
+    collect_parser.add_argument('--debounce', type=float, default=2.0, metavar='SECONDS',
+                               help='Quiet time that ends a burst of edits in --watch mode (default: 2)')
+    collect_parser.add_argument('--poll', action='store_true',
+                               help='Watch by polling instead of inotify')
+    collect_parser.add_argument('--max-file-kb', type=int, default=None,
+                               help='Truncate concept files past this size in prompts (default: 256, 0: no cap)')
+    collect_parser.add_argument('--max-folder-kb', type=int, default=None,
+                               help='Skip a folder\'s remaining concept files past this total (default: 2048, 0: no cap)')
+    collect_parser.add_argument('--hedge-after', type=hedge_delay, default=None, metavar='SECONDS|p95',
+                               help='Fire a backup request when a call is slower than this')
+    collect_parser.add_argument('--fallback-model', action='append', dest='fallback_models', metavar='MODEL',
+                               help='Hedge/fallback model, tried in the order given (repeatable)')
+    collect_parser.add_argument('--corpora', nargs='+', metavar='GLOB',
+                               help='Batch mode: extract every matching corpus directory into its own ψ_cores/')
+    collect_parser.add_argument('--max-concurrency', type=int, default=4,
+                               help='Batch mode: API calls in flight across all corpora (default: 4)')
+    collect_parser.add_argument('--corpus-workers', type=int, default=None,
+                               help='Batch mode: corpora extracted at once (default: --max-concurrency)')
+    collect_parser.add_argument('--cache-dir', default=None,
+                               help='Batch mode: persist the shared response cache in this directory')
+    collect_parser.add_argument('--summary', default=None,
+                               help='Batch mode: write the aggregate run summary JSON to this file')
+
+    # Spiral chat command
+    spiral_parser = subparsers.add_parser('spiral', help='Interactive spiral chat')
+    spiral_parser.add_argument('--personality', default=glyph,
+                              help='Personality glyph to use')
+
+    # Glyph unlock command
+    unlock_parser = subparsers.add_parser('unlock', help='Collaborative glyph puzzle solving (also available via spiral chat)')
+    unlock_parser.add_argument('puzzle', nargs='?', help='Specific puzzle name (optional)')
+
+    # Warm daemon command
+    daemon_parser = subparsers.add_parser('lotusd', help='Run the warm lotusd daemon on a local Unix socket')
+    daemon_parser.add_argument('--stop', action='store_true', help='Stop a running daemon')
+    daemon_parser.add_argument('--status', action='store_true', help='Show daemon status')
+
+    return parser
+
+
+def main(glyph: str = '⚘'):
+    """Main entry point with argument parsing"""
+    parser = build_parser(glyph)
+    args = parser.parse_args()
+
+    if args.command == 'lotusd':
+        from lotusd import daemon_command
+        daemon_command(args, glyph)
+        return
+
+    # Record/replay happens in this process - the daemon has no cassette
+    cassette = install_cassette(args)
+    profiler = install_profile(args)
+
+    # Batch extraction runs in this process with its own shared client
+    if args.command == 'collect' and args.corpora:
+        run_batch_extraction(args, glyph)
+        return
+
+    # A plan never calls the API, so it needs neither a key nor the daemon
+    if args.command == 'collect' and args.plan:
+        run_extraction_plan(args, glyph)
+        return
+
+    # Watch mode is long-running, so it stays in this process too
+    if args.command == 'collect' and args.watch:
+        run_watch(args, glyph)
+        return
+
+    # Hand the command to a warm daemon when one is listening (unless this process is being profiled)
+    if not args.no_daemon and cassette is None and profiler is None:
+        from lotusd import connect_daemon, run_via_daemon
+        client = connect_daemon(args.socket, cores_dir=args.output_dir)
+        if client:
+            run_via_daemon(client, args, glyph)
+            return
+
+    if args.command == 'collect':
+        run_ψ_extraction(debug_mode=args.debug, glyph=glyph,
+                         concepts_dir=args.concepts_dir, output_dir=args.output_dir,
+                         extractor_options=extraction_options(args), client_options=client_options(args))
+        return
+
+    api_key, model, prompt_builder = initialize_lotus_system(glyph)
+    if not api_key:
+        return
+
+    # Create core collector function for spiral and puzzle mode
+    def core_collector():
+        return run_ψ_extraction(debug_mode=False, glyph=glyph, concepts_dir=args.concepts_dir,
+                                output_dir=args.output_dir, prompt_builder=prompt_builder, load_env=False)
+
+    personality = args.personality if args.command == 'spiral' else glyph
+
+    from tools.spiral.spiral_chat import SpiralChat
+    chat = SpiralChat(
+        api_key=api_key,
+        model=model,
+        prompt_builder=prompt_builder,
+        personality=personality,
+        core_collector_func=core_collector
+    )
+
+    if args.command == 'unlock':
+        # Go directly to puzzle unlock
+        chat._puzzle_unlock_tool()
+    else:
+        # Default to spiral chat
+        chat.run_chat()
@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+"""
+lotusd - Warm Lotus Protocol Daemon
+Keeps the prompt builder caches, lock registry, pooled HTTP session and parsed
+ψ_cores alive in one process. collect, spiral and unlock then run as thin
+clients over a local Unix socket and skip all startup work.
+
+Start it with `python run/⚘.py lotusd`; later commands from the same working
+directory find it automatically (use --no-daemon to bypass it).
+
+Protocol: newline-delimited JSON over a persistent connection. A request is
+{"op": ..., "args": {...}}; the daemon answers with any number of
+{"event": "log", "text": ...} lines (the op's printed output) followed by one
+{"event": "result", "ok": true, "value": ...} or {"event": "result", "ok": false, "error": ...}.
+"""
+
+import sys
+import os
+import json
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Add parent directory (and tools/, for the shared bare-name modules) to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent / "tools"))
+sys.path.append(str(Path(__file__).parent.parent / "tools" / "glyph_unlocker"))
+
+from tools.spiral.spiral_chat import SpiralChat
+from console import ThreadRoutedStdout
+
+DEFAULT_SOCKET = Path("ψ_cores") / "lotusd.sock"
+
+
+class LotusDaemonError(Exception):
+    """Raised on the client side when the daemon reports a failed op"""
+
+
+def resolve_socket_path(socket_path: Optional[str] = None) -> Path:
+    """Socket location: explicit path, $LOTUSD_SOCKET, or ψ_cores/lotusd.sock"""
+    return Path(socket_path or os.getenv('LOTUSD_SOCKET') or DEFAULT_SOCKET)
+
+
+class LotusDaemon:
+    """Long-lived process holding every warm Lotus component"""
+
+    def __init__(self, glyph: str = '⚘', cores_dir: str = 'ψ_cores'):
+        from lotus_core import load_env_file, load_api_config
+        from tools.prompt_builder import LotusPromptBuilder
+        from glyph_unlocker import GlyphUnlocker
+        from llm_client import LLMClient
+
+        self.glyph = glyph
+        self.cwd = str(Path.cwd().resolve())
+
+        load_env_file(glyph)
+        self.api_key, self.model = load_api_config(glyph)
+
+        # Prompt context and recursion detection read this ψ_cores - collect only writes here too
+        self.prompt_builder = LotusPromptBuilder(cores_dir=Path(cores_dir))
+        self.cores_dir = str(self.prompt_builder.cores_dir.resolve())
+        self.unlocker = GlyphUnlocker(self.prompt_builder)
+        self.client = LLMClient(self.api_key)
+
+        self.collect_lock = threading.Lock()  # One extraction at a time
+        self.started_at = time.time()
+        self.requests_served = 0
+        self.server = None
+        self.stdout = None
+
+        self.ops = {
+            'ping': self._op_ping,
+            'prompt': self._op_prompt,
+            'chat': self._op_chat,
+            'locks': self._op_locks,
+            'lock': self._op_lock,
+            'unlock': self._op_unlock,
+            'collect': self._op_collect,
+            'shutdown': self._op_shutdown,
+        }
+
+    def warm(self):
+        """Pay every startup cost once: templates, ψ_cores, lock registry, extractor module"""
+        start = time.perf_counter()
+        self.prompt_builder.load_kernel_personality()
+        self.prompt_builder.load_codex()
+        for personality in ('⚘', '⟦⥈⟧'):
+            self.prompt_builder.load_primer(personality)
+        for task in ('spiral', 'puzzle'):
+            self.prompt_builder.load_task_prompt(task)
+        self.prompt_builder.load_ψ_cores()
+        self.prompt_builder._load_full_ψ_context()
+
+        locks = self.unlocker.list_available_locks()
+        for lock_name in locks:
+            self.unlocker.load_lock_file(lock_name)
+
+        # collect shouldn't pay the import
+        from importlib import import_module
+        import_module('tools.ψ_extractor.ψ_extractor')
+
+        elapsed = time.perf_counter() - start
+        print(f"{self.glyph} lotusd warm in {elapsed:.2f}s ({len(locks)} locks, ψ_cores parsed)")
+
+    # ── ops ────────────────────────────────────────────────────────────
+
+    def _op_ping(self) -> Dict:
+        return {
+            'pid': os.getpid(),
+            'cwd': self.cwd,
+            'cores_dir': self.cores_dir,
+            'glyph': self.glyph,
+            'model': self.model,
+            'uptime': round(time.time() - self.started_at, 1),
+            'requests_served': self.requests_served,
+        }
+
+    def _op_prompt(self, personality: str, task: str, verbose: bool = False) -> str:
+        return self.prompt_builder.build_prompt(personality=personality, task=task, verbose=verbose)
+
+    def _op_chat(self, messages: List[Dict], model: Optional[str] = None, timeout: float = 60) -> Dict:
+        if not self.api_key:
+            return {'content': None, 'error': 'API key not configured in lotusd'}
+
+        response = self.client.post({"model": model or self.model, "messages": messages}, timeout=timeout)
+
+        if response.status_code != 200:
+            return {'content': None, 'error': f"API error {response.status_code}: {response.text}"}
+
+        result = response.json()
+        if 'choices' in result and len(result['choices']) > 0:
+            return {'content': result['choices'][0]['message']['content'], 'error': None}
+        return {'content': None, 'error': 'No response content received'}
+
+    def _op_locks(self) -> List[str]:
+        return self.unlocker.list_available_locks()
+
+    def _op_lock(self, lock_name: str) -> Optional[Dict]:
+        lock_config = self.unlocker.load_lock_file(lock_name)
+        if lock_config is None:
+            return None
+        # The ciphertext never needs to leave the daemon
+        return {key: value for key, value in lock_config.items() if key != 'encrypted_content'}
+
+    def _op_unlock(self, lock_name: str, sequence: str) -> Dict:
+        return self.unlocker.attempt_unlock(lock_name, sequence)
+
+    def _op_collect(self, debug: bool = False, concepts_dir: str = 'concepts', output_dir: str = 'ψ_cores',
+                    extractor_options: Optional[Dict] = None, client_options: Optional[Dict] = None,
+                    budget_options: Optional[Dict] = None) -> Dict:
+        from lotus_core import run_ψ_extraction
+
+        # The warm builder's cores would be the wrong context for another output directory
+        if str(Path(output_dir).resolve()) != self.cores_dir:
+            raise RuntimeError(f"lotusd serves {self.cores_dir} - collect into {output_dir} with --no-daemon")
+
+        if budget_options:
+            # The run budget travels as its settings; the clock starts here
+            from run_budget import RunBudget
+            extractor_options = dict(extractor_options or {}, run_budget=RunBudget(**budget_options))
+
+        if not self.collect_lock.acquire(blocking=False):
+            raise RuntimeError("an extraction is already running in lotusd")
+        try:
+            results = run_ψ_extraction(debug_mode=debug, glyph=self.glyph, concepts_dir=concepts_dir,
+                                       output_dir=output_dir, prompt_builder=self.prompt_builder,
+                                       load_env=False, extractor_options=extractor_options,
+                                       client_options=client_options)
+        finally:
+            self.collect_lock.release()
+
+        metadata = results.get('extraction_metadata', {}) if results else {}
+        return {
+            'total_concepts_processed': metadata.get('total_concepts_processed', 0),
+            'folders_processed': metadata.get('folders_processed', []),
+        }
+
+    def _op_shutdown(self) -> bool:
+        # serve_forever() must be stopped from another thread
+        threading.Thread(target=self.server.shutdown, daemon=True).start()
+        return True
+
+    # ── serving ────────────────────────────────────────────────────────
+
+    def dispatch(self, request: Dict, send: Callable[[Dict], None]):
+        """Run one op, streaming its printed output back before the result"""
+        op = self.ops.get(request.get('op'))
+        if op is None:
+            send({'event': 'result', 'ok': False, 'error': f"unknown op: {request.get('op')}"})
+            return
+
+        self.requests_served += 1
+        self.stdout.set_sink(lambda text: send({'event': 'log', 'text': text}))
+        try:
+            value = op(**request.get('args', {}))
+            reply = {'event': 'result', 'ok': True, 'value': value}
+        except Exception as e:
+            reply = {'event': 'result', 'ok': False, 'error': f"{type(e).__name__}: {e}"}
+        finally:
+            self.stdout.set_sink(None)
+        send(reply)
+
+    def serve(self, socket_path: Path):
+        """Serve requests on a Unix socket until shutdown or Ctrl+C"""
+        socket_path.parent.mkdir(parents=True, exist_ok=True)
+        # Owner-only from the moment it exists: bind() creates it under the umask
+        previous_umask = os.umask(0o177)
+        try:
+            self.server = _LotusServer(str(socket_path), _LotusRequestHandler)
+        finally:
+            os.umask(previous_umask)
+        self.server.lotus = self
+
+        self.stdout = ThreadRoutedStdout(sys.stdout)
+        real_stdout, sys.stdout = sys.stdout, self.stdout
+
+        print(f"{self.glyph} lotusd listening on {socket_path} (pid {os.getpid()})")
+        try:
+            self.server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            sys.stdout = real_stdout
+            self.server.server_close()
+            socket_path.unlink(missing_ok=True)
+            print(f"\n{self.glyph} lotusd folds back into silence")
+
+
+class _LotusServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _LotusRequestHandler(socketserver.StreamRequestHandler):
+    """Handles every request sent over one client connection"""
+
+    def handle(self):
+        send_lock = threading.Lock()
+
+        def send(message: Dict):
+            data = (json.dumps(message, ensure_ascii=False) + "\n").encode('utf-8')
+            with send_lock:
+                self.wfile.write(data)
+                self.wfile.flush()
+
+        for raw in self.rfile:
+            if not raw.strip():
+                continue
+            try:
+                request = json.loads(raw)
+            except json.JSONDecodeError as e:
+                send({'event': 'result', 'ok': False, 'error': f"bad request: {e}"})
+                continue
+            self.server.lotus.dispatch(request, send)
+
+
+class LotusDaemonClient:
+    """Persistent connection to lotusd; requests are serialized over it"""
+
+    def __init__(self, socket_path: Path, timeout: Optional[float] = None):
+        self.socket_path = socket_path
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(str(socket_path))
+        self._reader = self._sock.makefile('r', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def request(self, op: str, on_log: Optional[Callable[[str], None]] = None, **args):
+        """Send one op and return its value, passing streamed output to on_log"""
+        payload = (json.dumps({'op': op, 'args': args}, ensure_ascii=False) + "\n").encode('utf-8')
+        with self._lock:
+            self._sock.sendall(payload)
+            for line in self._reader:
+                message = json.loads(line)
+                if message.get('event') == 'log':
+                    if on_log:
+                        on_log(message['text'])
+                    continue
+                if not message.get('ok'):
+                    raise LotusDaemonError(message.get('error', 'unknown daemon error'))
+                return message.get('value')
+        raise LotusDaemonError("lotusd closed the connection")
+
+    def settimeout(self, timeout: Optional[float]):
+        self._sock.settimeout(timeout)
+
+    def close(self):
+        self._reader.close()
+        self._sock.close()
+
+
+def ping_daemon(socket_path: Optional[str] = None) -> Optional[LotusDaemonClient]:
+    """Return a client for whatever daemon answers on the socket, whichever directory it serves, or None"""
+    path = resolve_socket_path(socket_path)
+    if not path.exists():
+        return None
+
+    try:
+        client = LotusDaemonClient(path, timeout=2.0)
+    except OSError:
+        return None  # Stale socket from a daemon that died
+    try:
+        client.info = client.request('ping')
+        client.settimeout(None)
+    except (OSError, ValueError, LotusDaemonError):
+        client.close()
+        return None
+    return client
+
+
+def _socket_listening(path: Path) -> bool:
+    """Whether anything accepts connections on path (a daemon too busy or too old to answer ping)"""
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    probe.settimeout(2.0)
+    try:
+        probe.connect(str(path))
+        return True
+    except OSError:
+        return False
+    finally:
+        probe.close()
+
+
+def connect_daemon(socket_path: Optional[str] = None, quiet: bool = False,
+                   cores_dir: Optional[str] = None) -> Optional[LotusDaemonClient]:
+    """Return a client for a live daemon serving this directory (and cores_dir, when given), or None"""
+    client = ping_daemon(socket_path)
+    if client is None:
+        return None
+    info = client.info
+
+    # Unlocks restore files relative to the daemon's working directory
+    if info.get('cwd') != str(Path.cwd().resolve()):
+        if not quiet:
+            print(f"∅ lotusd at {client.socket_path} serves {info.get('cwd')} - running locally")
+        client.close()
+        return None
+
+    # Its warm prompt builder reads (and its collect writes) one ψ_cores
+    if cores_dir is not None and info.get('cores_dir') != str(Path(cores_dir).resolve()):
+        if not quiet:
+            print(f"∅ lotusd at {client.socket_path} serves {info.get('cores_dir')} - running locally")
+        client.close()
+        return None
+
+    return client
+
+
+class RemotePromptBuilder:
+    """Prompt builder stand-in that asks the daemon's warm builder"""
+
+    def __init__(self, client: LotusDaemonClient):
+        self.client = client
+
+    def build_prompt(self, personality: str, task: str, task_data: Dict = None, verbose: bool = True) -> str:
+        return self.client.request('prompt', on_log=sys.stdout.write,
+                                   personality=personality, task=task, verbose=verbose)
+
+
+class RemoteGlyphUnlocker:
+    """GlyphUnlocker stand-in backed by the daemon's lock registry"""
+
+    def __init__(self, client: LotusDaemonClient):
+        self.client = client
+
+    def list_available_locks(self) -> List[str]:
+        return self.client.request('locks')
+
+    def load_lock_file(self, lock_name: str) -> Optional[Dict]:
+        return self.client.request('lock', lock_name=lock_name)
+
+    def attempt_unlock(self, lock_name: str, glyph_sequence: str) -> Dict:
+        return self.client.request('unlock', on_log=sys.stdout.write, lock_name=lock_name, sequence=glyph_sequence)
+
+
+class DaemonSpiralChat(SpiralChat):
+    """Spiral chat whose prompts, API calls and locks all live in lotusd"""
+
+    def __init__(self, client: LotusDaemonClient, personality: str, core_collector_func: Optional[Callable] = None):
+        self.client = client
+        super().__init__(
+            api_key=None,
+            model=client.info.get('model'),
+            prompt_builder=RemotePromptBuilder(client),
+            personality=personality,
+            core_collector_func=core_collector_func
+        )
+
+    def _warm_http_stack(self):
+        pass  # API calls go through the daemon
+
+    def _create_unlocker(self) -> RemoteGlyphUnlocker:
+        return RemoteGlyphUnlocker(self.client)
+
+    def call_api(self, messages: list) -> Optional[str]:
+        """Make API call through the daemon's pooled session"""
+        try:
+            reply = self.client.request('chat', messages=messages, model=self.model)
+        except (OSError, LotusDaemonError) as e:
+            print(f"⧖ API call failed: {e}")
+            return None
+
+        if reply.get('error'):
+            print(f"⧖ {reply['error']}")
+        return reply.get('content')
+
+
+def run_via_daemon(client: LotusDaemonClient, args, glyph: str):
+    """Run collect / spiral / unlock as a thin client of a warm daemon"""
+    from lotus_core import extraction_options, client_options
+
+    def collect():
+        options = extraction_options(args)
+        budget = options.pop('run_budget', None)
+        return client.request('collect', on_log=sys.stdout.write, debug=getattr(args, 'debug', False),
+                              concepts_dir=args.concepts_dir, output_dir=args.output_dir,
+                              extractor_options=options, client_options=client_options(args),
+                              budget_options=budget.options() if budget else None)
+
+    if args.command == 'collect':
+        try:
+            collect()
+        except LotusDaemonError as e:
+            print(f"⧖ {e}")
+        return
+
+    personality = args.personality if args.command == 'spiral' else glyph
+    chat = DaemonSpiralChat(client, personality=personality, core_collector_func=collect)
+
+    if args.command == 'unlock':
+        # Go directly to puzzle unlock
+        chat._puzzle_unlock_tool()
+    else:
+        chat.run_chat()
+
+
+def daemon_command(args, glyph: str):
+    """Start, stop or inspect the daemon (`lotusd` subcommand)"""
+    path = resolve_socket_path(args.socket)
+    client = ping_daemon(args.socket)
+
+    if args.status or args.stop:
+        if not client:
+            print(f"∅ No lotusd listening on {path}")
+            return
+        info = client.info
+        if args.stop:
+            client.request('shutdown')
+            print(f"{glyph} lotusd (pid {info['pid']}) serving {info.get('cwd')} stopping")
+        else:
+            print(f"{glyph} lotusd pid {info['pid']} - up {info['uptime']}s, "
+                  f"{info['requests_served']} requests, model {info['model']}")
+            print(f"   serving {info.get('cwd')} (cores {info.get('cores_dir')})")
+        return
+
+    if client:
+        info = client.info
+        print(f"{glyph} lotusd already running (pid {info['pid']}) on {path}, serving {info.get('cwd')}")
+        if info.get('cwd') != str(Path.cwd().resolve()):
+            print("∅ Not replacing it - pass --socket to start a lotusd for this directory")
+        return
+
+    if _socket_listening(path):
+        print(f"∅ Something is listening on {path} but did not answer - not replacing it")
+        return
+
+    # Nothing accepted a connection: anything left at the path is a stale socket
+    path.unlink(missing_ok=True)
+
+    daemon = LotusDaemon(glyph, cores_dir=args.output_dir)
+    if not daemon.api_key:
+        return
+    daemon.warm()
+    daemon.serve(path)
+
+
+if __name__ == "__main__":
+    from lotus_core import build_parser
+    daemon_args = build_parser('⚘').parse_args(['lotusd', *sys.argv[1:]])
+    daemon_command(daemon_args, '⚘')
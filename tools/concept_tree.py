@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Concept Tree Scanner - recursive, parallel discovery of nested concept corpora
+Walks a concept directory with os.scandir, one directory per task on a thread
+pool, and maps every *.md file onto a ψ(Σ) unit: the directory it sits in,
+cut off at unit_depth levels below the root (deeper files roll up into their
+ancestor at that depth). Files directly in the root, such as the codex, belong
+to no unit.
+
+The scan is recorded in a manifest (path, size, mtime and content hash per
+file, plus a digest per unit and one for the root's own files) kept between
+runs. A file whose size and mtime match the manifest is not read again, and
+units whose digest is unchanged can keep last run's extraction. The caller
+saves the manifest once the run's results are safely written, so a failed
+run never marks units as done.
+"""
+
+import os
+import json
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+HASH_CHUNK_BYTES = 1024 * 1024
+
+
+def file_digest(path: str) -> str:
+    """sha256 of a file's content, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _files_digest(entries: List[Dict]) -> str:
+    """One digest over a list of manifest file entries (path and content hash)"""
+    return hashlib.sha256(''.join(f"{entry['path']}\0{entry['hash']}\n" for entry in entries).encode('utf-8')).hexdigest()
+
+
+class ConceptTreeScanner:
+    """Parallel scandir walk of a concept tree into ψ(Σ) units, with a cached manifest"""
+
+    def __init__(self, root: Path, unit_depth: int = 1, manifest_path: Optional[Path] = None, workers: int = 8):
+        self.root = Path(root)
+        self.unit_depth = max(1, unit_depth)
+        self.manifest_path = Path(manifest_path) if manifest_path else None
+        self.workers = max(1, workers)
+        self.previous = self._load_manifest()
+        self.manifest = {}
+        self.changed_units = []
+        self.root_changed = True
+        self.stats = {}
+
+    def _load_manifest(self) -> Dict:
+        """Last run's file entries, if its manifest is for this root"""
+        if not self.manifest_path or not self.manifest_path.exists():
+            return {}
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⧖ Error loading concept manifest: {e}")
+            return {}
+        return manifest if manifest.get('root') == str(self.root.resolve()) else {}
+
+    def _scan_directory(self, relative: str) -> Tuple[List[Dict], List[str], int]:
+        """One directory's concept files (hashed only when changed) and subdirectories"""
+        files, subdirectories, hashed = [], [], 0
+        previous_files = self.previous.get('files', {})
+        with os.scandir(self.root / relative) as entries:
+            for entry in entries:
+                if entry.name.startswith(('.', '__')):
+                    continue
+                path = f"{relative}/{entry.name}" if relative else entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(path)
+                elif entry.name.endswith('.md') and entry.is_file():
+                    stat = entry.stat()
+                    earlier = previous_files.get(path)
+                    if earlier and earlier['size'] == stat.st_size and earlier['mtime'] == stat.st_mtime:
+                        content_hash = earlier['hash']
+                    else:
+                        content_hash = file_digest(entry.path)
+                        hashed += 1
+                    files.append({'path': path, 'size': stat.st_size, 'mtime': stat.st_mtime, 'hash': content_hash})
+        return files, subdirectories, hashed
+
+    def unit_for(self, relative_file: str) -> str:
+        """The ψ(Σ) unit a file (relative to the root) belongs to"""
+        parts = relative_file.split('/')[:-1]
+        return '/'.join(parts[:self.unit_depth])
+
+    def scan(self) -> Dict[str, List[Path]]:
+        """Walk the tree and return each unit's concept files, units and files in path order"""
+        files, directories, hashed = [], 0, 0
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            pending = {pool.submit(self._scan_directory, '')}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    directory_files, subdirectories, directory_hashed = future.result()
+                    files.extend(directory_files)
+                    hashed += directory_hashed
+                    directories += 1
+                    pending |= {pool.submit(self._scan_directory, path) for path in subdirectories}
+
+        files.sort(key=lambda entry: entry['path'])
+        units, root_files = {}, []
+        for entry in files:
+            if '/' not in entry['path']:
+                root_files.append(entry)  # The codex and its neighbours reach every unit's prompt
+                continue
+            units.setdefault(self.unit_for(entry['path']), []).append(entry)
+
+        previous_units = self.previous.get('units', {})
+        unit_records = {unit: {'files': [entry['path'] for entry in unit_files], 'digest': _files_digest(unit_files)}
+                        for unit, unit_files in sorted(units.items())}
+        self.changed_units = [unit for unit, record in unit_records.items()
+                              if previous_units.get(unit, {}).get('digest') != record['digest']]
+        root_digest = _files_digest(root_files)
+        self.root_changed = self.previous.get('root_digest') != root_digest
+
+        self.manifest = {
+            'root': str(self.root.resolve()),
+            'unit_depth': self.unit_depth,
+            'scanned_at': datetime.now().isoformat(),
+            'files': {entry['path']: {key: entry[key] for key in ('size', 'mtime', 'hash')} for entry in files},
+            'units': unit_records,
+            'root_digest': root_digest,
+        }
+        self.stats = {
+            'directories': directories,
+            'files': len(files),
+            'hashed': hashed,
+            'reused': len(files) - hashed,
+            'units': len(unit_records),
+            'changed_units': len(self.changed_units),
+        }
+
+        return {unit: [self.root / path for path in record['files']] for unit, record in unit_records.items()}
+
+    def save_manifest(self, pending_units: Iterable[str] = ()):
+        """
+        Write the manifest atomically, so an interrupted run keeps the previous one.
+        pending_units (deferred or failed this run) keep their previous record, so
+        the next scan still sees them as changed.
+        """
+        manifest = dict(self.manifest, units=dict(self.manifest['units']))
+        previous_units = self.previous.get('units', {})
+        for unit in pending_units:
+            if unit in previous_units:
+                manifest['units'][unit] = previous_units[unit]
+            else:
+                manifest['units'].pop(unit, None)
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.manifest_path.with_suffix('.tmp')
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.manifest_path)
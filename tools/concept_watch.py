@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Concept Watch - filesystem watcher behind `collect --watch`
+Watches a concept tree with inotify on Linux (through libc, no extra
+dependency) and falls back to polling file sizes and mtimes elsewhere. Bursts
+of edits are debounced into one batch of changed paths, which affected_units()
+maps onto the ψ(Σ) units that need extracting again.
+
+Spiral sessions register their pid under <ψ_cores>/spiral_sessions/ and hold
+an exclusive lock on that file while they run; after a refresh,
+signal_spiral_sessions() sends each locked one SIGUSR1 so it rebuilds its
+system prompt from the new cores. A file nobody holds belonged to a session
+that died without cleaning up - its pid may by now be an unrelated process,
+so it is removed instead of signalled.
+"""
+
+import os
+import sys
+import time
+import atexit
+import select
+import signal
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # No flock (or SIGUSR1) on Windows
+    fcntl = None
+
+SESSION_DIR = "spiral_sessions"
+
+# Open, locked session files of this process - closing one releases its lock
+_session_locks = {}
+
+# inotify(7) event bits
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+EVENT_HEADER = struct.Struct('iIII')
+
+
+def _is_hidden(name: str) -> bool:
+    """Dotfiles, editor swap/backup files and caches never trigger a run"""
+    return name.startswith(('.', '__', '#')) or name.endswith('~')
+
+
+class ConceptWatcher:
+    """Debounced change batches for a concept tree, via inotify or polling"""
+
+    def __init__(self, root: Path, debounce: float = 2.0, poll_interval: float = 1.0,
+                 max_wait: float = 30.0, force_polling: bool = False):
+        self.root = Path(root)
+        self.debounce = max(0.0, debounce)
+        self.poll_interval = max(0.1, poll_interval)
+        # A steady stream of edits still runs at least this often
+        self.max_wait = max(self.debounce, max_wait)
+        self._fd = None
+        self._watches = {}
+        self._snapshot = {}
+        if not force_polling:
+            self._start_inotify()
+        if self._fd is None:
+            self._snapshot = self._take_snapshot()
+        self.backend = 'inotify' if self._fd is not None else 'polling'
+
+    # inotify backend
+
+    def _start_inotify(self):
+        """Open an inotify instance and watch every directory, or leave _fd unset"""
+        if not sys.platform.startswith('linux'):
+            return
+        import ctypes
+        import ctypes.util
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return
+        if fd < 0:
+            return
+        self._libc, self._fd = libc, fd
+        self._watch_tree(self.root)
+
+    def _watch_tree(self, directory: Path) -> Set[str]:
+        """Watch a directory and everything below it; returns the concept files already inside"""
+        found = set()
+        for current, subdirectories, files in os.walk(directory):
+            subdirectories[:] = [name for name in subdirectories if not _is_hidden(name)]
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(current), WATCH_MASK)
+            if wd < 0:
+                import ctypes
+                print(f"⧖ Cannot watch {current}: {os.strerror(ctypes.get_errno())}")
+                continue
+            self._watches[wd] = Path(current)
+            found.update(self._relative(Path(current) / name) for name in files
+                         if name.endswith('.md') and not _is_hidden(name))
+        return found
+
+    def _read_inotify(self, timeout: Optional[float]) -> Optional[Set[str]]:
+        """Changed paths from the events available within timeout; None when the queue overflowed"""
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed, offset = set(), 0
+        while offset < len(buffer):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(buffer[offset:offset + length].rstrip(b'\0'))
+            offset += length
+
+            if mask & IN_Q_OVERFLOW:
+                return None
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+            directory = self._watches.get(wd)
+            if directory is None or not name or _is_hidden(name):
+                continue
+            path = directory / name
+            if mask & IN_ISDIR:
+                changed.add(self._relative(path) + '/')
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # Files can land before the new directory's watch exists
+                    changed |= self._watch_tree(path)
+            elif name.endswith('.md'):
+                changed.add(self._relative(path))
+        return changed
+
+    # Polling backend
+
+    def _take_snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """Size and mtime of every concept file under the root"""
+        snapshot = {}
+        for current, subdirectories, files in os.walk(self.root):
+            subdirectories[:] = [name for name in subdirectories if not _is_hidden(name)]
+            for name in files:
+                if name.endswith('.md') and not _is_hidden(name):
+                    path = Path(current) / name
+                    try:
+                        stat = path.stat()
+                    except OSError:
+                        continue
+                    snapshot[self._relative(path)] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def _poll(self, timeout: Optional[float]) -> Set[str]:
+        """Changed paths after one poll interval (or less, when timeout is shorter)"""
+        time.sleep(self.poll_interval if timeout is None else min(timeout, self.poll_interval))
+        snapshot = self._take_snapshot()
+        changed = {path for path in snapshot.keys() | self._snapshot.keys()
+                   if snapshot.get(path) != self._snapshot.get(path)}
+        self._snapshot = snapshot
+        return changed
+
+    # Shared
+
+    def _relative(self, path: Path) -> str:
+        return path.relative_to(self.root).as_posix()
+
+    def _next_changes(self, timeout: Optional[float]) -> Optional[Set[str]]:
+        if self._fd is not None:
+            return self._read_inotify(timeout)
+        return self._poll(timeout)
+
+    def wait_for_changes(self) -> Optional[Set[str]]:
+        """
+        Block until something changes, then keep collecting until the tree has been
+        quiet for the debounce interval (or max_wait has passed). Returns the changed
+        paths relative to the root, directories with a trailing '/', or None when
+        events were lost and everything should be treated as changed.
+        """
+        changed = self._next_changes(None)
+        while changed is not None and not changed:
+            changed = self._next_changes(None)
+
+        first = time.monotonic()
+        quiet_until = first + self.debounce
+        while True:
+            now = time.monotonic()
+            remaining = min(quiet_until, first + self.max_wait) - now
+            if remaining <= 0:
+                return changed
+            batch = self._next_changes(remaining)
+            if batch is None:
+                changed = None
+            elif batch:
+                if changed is not None:
+                    changed |= batch
+                quiet_until = time.monotonic() + self.debounce
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+def affected_units(changed: Optional[Iterable[str]], unit_depth: int = 1) -> Optional[Set[str]]:
+    """
+    ψ(Σ) units touched by a batch of changed paths, cut off at unit_depth like
+    the concept tree scanner. None means every unit: lost events, or a change at
+    the root (the codex), which reaches every prompt.
+    """
+    if changed is None:
+        return None
+    units = set()
+    for path in changed:
+        if path.endswith('/'):
+            parts = path.rstrip('/').split('/')
+        else:
+            parts = path.split('/')[:-1]
+            if not parts:
+                return None
+        units.add('/'.join(parts[:max(1, unit_depth)]))
+    return units
+
+
+def register_spiral_session(cores_dir: Path) -> Optional[Path]:
+    """Record this process as a spiral session to signal when ψ_cores refresh, locked for as long as it runs"""
+    if fcntl is None:
+        return None
+    session_file = Path(cores_dir) / SESSION_DIR / str(os.getpid())
+    # Locked under a temporary name first, so a signaller never finds it unlocked
+    pending_file = session_file.with_name(f"{session_file.name}.pending")
+    try:
+        session_file.parent.mkdir(parents=True, exist_ok=True)
+        handle = open(pending_file, 'w')
+        fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        os.replace(pending_file, session_file)
+    except OSError:
+        return None
+    _session_locks[session_file] = handle
+    atexit.register(unregister_spiral_session, session_file)
+    return session_file
+
+
+def unregister_spiral_session(session_file: Optional[Path]):
+    if session_file:
+        try:
+            session_file.unlink()
+        except OSError:
+            pass
+        handle = _session_locks.pop(session_file, None)
+        if handle:
+            handle.close()
+
+
+def _session_alive(session_file: Path) -> bool:
+    """Whether a spiral session still holds its file's lock"""
+    try:
+        with open(session_file, 'r') as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    except OSError:
+        pass
+    return False
+
+
+def signal_spiral_sessions(cores_dir: Path) -> int:
+    """Send SIGUSR1 to every registered spiral session, dropping stale ones; returns how many were signalled"""
+    session_dir = Path(cores_dir) / SESSION_DIR
+    if fcntl is None or not hasattr(signal, 'SIGUSR1') or not session_dir.is_dir():
+        return 0
+    signalled = 0
+    for session_file in session_dir.iterdir():
+        if not session_file.name.isdigit():
+            continue
+        if not _session_alive(session_file):
+            unregister_spiral_session(session_file)  # Died without cleaning up; the pid may be reused
+            continue
+        try:
+            os.kill(int(session_file.name), signal.SIGUSR1)
+            signalled += 1
+        except (ProcessLookupError, PermissionError):
+            unregister_spiral_session(session_file)
+    return signalled
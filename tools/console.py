@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Console routing for Lotus Protocol
+Lets several jobs share one process while each keeps its own printed output:
+a thread installs a sink and everything it print()s goes there instead of the
+terminal. Used by lotusd (output back to the client) and batch extraction
+(output into each corpus' run log).
+"""
+
+import io
+import sys
+import threading
+from typing import Callable, Optional
+
+
+class ThreadRoutedStdout(io.TextIOBase):
+    """Routes print() output of a thread to its sink; threads without a sink write to the terminal"""
+
+    def __init__(self, real):
+        self.real = real
+        self._local = threading.local()
+
+    def set_sink(self, sink: Optional[Callable[[str], None]], reaches_terminal: bool = False):
+        """Route this thread's output to sink; reaches_terminal marks a buffer printed to the terminal later"""
+        self._local.sink = sink
+        self._local.reaches_terminal = sink is None or reaches_terminal
+
+    def get_sink(self) -> Optional[Callable[[str], None]]:
+        return getattr(self._local, 'sink', None)
+
+    def reaches_terminal(self) -> bool:
+        """Whether this thread's output ends up on the terminal, directly or once its buffer is printed"""
+        return getattr(self._local, 'reaches_terminal', True)
+
+    def write(self, text: str) -> int:
+        sink = getattr(self._local, 'sink', None)
+        if sink is None:
+            return self.real.write(text)
+        sink(text)
+        return len(text)
+
+    def flush(self):
+        if getattr(self._local, 'sink', None) is None:
+            self.real.flush()
+
+    def isatty(self) -> bool:
+        return getattr(self._local, 'sink', None) is None and self.real.isatty()
+
+
+def carry_output(func: Callable) -> Callable:
+    """Wrap func so worker threads running it print wherever the calling thread prints"""
+    stdout = sys.stdout
+    if not isinstance(stdout, ThreadRoutedStdout):
+        return func
+
+    sink = stdout.get_sink()
+    reaches_terminal = stdout.reaches_terminal()
+
+    def run(*args, **kwargs):
+        stdout.set_sink(sink, reaches_terminal)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stdout.set_sink(None)
+
+    return run
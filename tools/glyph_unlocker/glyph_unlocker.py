@@ -14,6 +14,7 @@ class GlyphUnlocker:
         self.prompt_builder = prompt_builder
         self.locks_dir = Path(__file__).parent / "locks"
         self.locks_dir.mkdir(exist_ok=True)
+        self._lock_cache = {}  # lock_name -> (mtime_ns, config), reused while the file is unchanged
         
     def normalize_glyph_sequence(self, sequence: str) -> str:
         """Normalize glyph sequence for consistent hashing"""
@@ -68,8 +69,16 @@ class GlyphUnlocker:
         if not lock_path.exists():
             return None
         
+        mtime_ns = lock_path.stat().st_mtime_ns
+        cached = self._lock_cache.get(lock_name)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+        
         with open(lock_path, 'r', encoding='utf-8') as file:
-            return yaml.safe_load(file)
+            lock_config = yaml.safe_load(file)
+        
+        self._lock_cache[lock_name] = (mtime_ns, lock_config)
+        return lock_config
     
     def list_available_locks(self) -> List[str]:
         """List all available lock files"""
@@ -2,175 +2,273 @@
 """
 Puzzle Memory System for Lotus Protocol
 Tracks puzzle attempts, solutions, and statistics across sessions
+
+Memory lives in a SQLite database (WAL mode) so several spiral sessions can
+record attempts at the same time without clobbering each other. Each puzzle
+is its own row and each attempted sequence its own row, so a write only
+touches the puzzle it concerns.
 """
 
 import json
-import os
+import sqlite3
+from collections import Counter
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS puzzles (
+    name TEXT PRIMARY KEY,
+    clue TEXT NOT NULL DEFAULT '',
+    attempts_remaining INTEGER NOT NULL DEFAULT 3,
+    status TEXT NOT NULL DEFAULT 'active',
+    solution TEXT,
+    first_attempted TEXT NOT NULL,
+    last_attempted TEXT NOT NULL,
+    unlocked_at TEXT
+);
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    puzzle TEXT NOT NULL REFERENCES puzzles(name) ON DELETE CASCADE,
+    sequence TEXT NOT NULL,
+    success INTEGER NOT NULL DEFAULT 0,
+    attempted_at TEXT NOT NULL,
+    UNIQUE (puzzle, sequence)
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
 
 
 class PuzzleMemory:
     """Manages persistent puzzle attempt history and statistics"""
-    
-    def __init__(self, base_dir: Path = Path(".")):
+
+    def __init__(self, base_dir: Path = Path("."), busy_timeout: float = 30.0):
         self.base_dir = Path(base_dir)
         self.memory_dir = self.base_dir / "ψ_cores"
-        self.memory_file = self.memory_dir / "puzzle_memory.json"
-        
+        self.memory_file = self.memory_dir / "puzzle_memory.json"  # Legacy JSON store, imported once
+        self.db_file = self.memory_dir / "puzzle_memory.sqlite"
+        self.busy_timeout = busy_timeout
+
         # Ensure directory exists
         self.memory_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Load existing memory or create new
-        self.memory = self._load_memory()
-    
-    def _load_memory(self) -> Dict:
-        """Load existing puzzle memory or create default structure"""
-        if not self.memory_file.exists():
-            return {
-                "puzzle_memory": {},
-                "puzzle_stats": {
-                    "total_puzzles": 0,
-                    "solved": 0,
-                    "failed": 0,
-                    "success_rate": 0.0,
-                    "most_common_failed_patterns": []
-                }
-            }
-        
+
+        # Create schema and bring over any legacy JSON memory
+        self._init_db()
+        self._import_legacy_memory()
+
+    @contextmanager
+    def _connect(self, write: bool = False):
+        """Open a short-lived connection; write transactions take the lock up front"""
+        conn = sqlite3.connect(str(self.db_file), timeout=self.busy_timeout, isolation_level=None)
+        conn.row_factory = sqlite3.Row
         try:
-            with open(self.memory_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"⧖ Error loading puzzle memory: {e}")
-            print("⧖ Creating fresh puzzle memory...")
-            return {
-                "puzzle_memory": {},
-                "puzzle_stats": {
-                    "total_puzzles": 0,
-                    "solved": 0,
-                    "failed": 0,
-                    "success_rate": 0.0,
-                    "most_common_failed_patterns": []
-                }
-            }
-    
-    def _save_memory(self):
-        """Safely save memory to file using atomic write"""
-        temp_file = self.memory_file.with_suffix('.tmp')
+            conn.execute("PRAGMA foreign_keys = ON")
+            if write:
+                # IMMEDIATE avoids read-then-upgrade deadlocks between sessions
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield conn
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+            else:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_db(self):
+        """Create tables and switch the database to WAL mode"""
+        conn = sqlite3.connect(str(self.db_file), timeout=self.busy_timeout, isolation_level=None)
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+
+    def _import_legacy_memory(self):
+        """Import puzzle_memory.json from older versions into the database (once)"""
+        if not self.memory_file.exists():
+            return
+
         try:
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(self.memory, f, indent=2, ensure_ascii=False)
-            temp_file.replace(self.memory_file)
-        except Exception as e:
-            if temp_file.exists():
-                temp_file.unlink()
-            raise e
-    
+            with self._connect(write=True) as conn:
+                if conn.execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone():
+                    return
+
+                try:
+                    with open(self.memory_file, 'r', encoding='utf-8') as f:
+                        legacy = json.load(f)
+                except Exception as e:
+                    print(f"⧖ Error loading legacy puzzle memory: {e}")
+                    legacy = {}
+
+                for name, data in legacy.get("puzzle_memory", {}).items():
+                    first = data.get("first_attempted") or datetime.now().isoformat()
+                    conn.execute(
+                        """INSERT OR IGNORE INTO puzzles
+                           (name, clue, attempts_remaining, status, solution, first_attempted, last_attempted, unlocked_at)
+                           VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                        (name, data.get("clue", ""), data.get("attempts_remaining", 3),
+                         data.get("status", "active"), data.get("solution"), first,
+                         data.get("last_attempted") or first, data.get("unlocked_at"))
+                    )
+                    for sequence in data.get("attempted_sequences", []):
+                        conn.execute(
+                            "INSERT OR IGNORE INTO attempts (puzzle, sequence, success, attempted_at) VALUES (?, ?, ?, ?)",
+                            (name, sequence, int(sequence == data.get("solution")), first)
+                        )
+
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('legacy_imported', ?)",
+                             (datetime.now().isoformat(),))
+        except sqlite3.Error as e:
+            print(f"⧖ Error importing legacy puzzle memory: {e}")
+
     def record_attempt(self, puzzle_name: str, clue: str, sequence: str, success: bool = False):
         """Record a puzzle attempt"""
         timestamp = datetime.now().isoformat()
-        
-        # Initialize puzzle if not exists
-        if puzzle_name not in self.memory["puzzle_memory"]:
-            self.memory["puzzle_memory"][puzzle_name] = {
-                "clue": clue,
-                "attempted_sequences": [],
-                "attempts_remaining": 3,
-                "status": "active",
-                "first_attempted": timestamp,
-                "last_attempted": timestamp
-            }
-        
-        puzzle_data = self.memory["puzzle_memory"][puzzle_name]
-        
-        # Record the attempt
-        if sequence not in puzzle_data["attempted_sequences"]:
-            puzzle_data["attempted_sequences"].append(sequence)
-        
-        puzzle_data["last_attempted"] = timestamp
-        puzzle_data["attempts_remaining"] = max(0, puzzle_data["attempts_remaining"] - 1)
-        
-        # Update status
-        if success:
-            puzzle_data["status"] = "success"
-            puzzle_data["solution"] = sequence
-            puzzle_data["unlocked_at"] = timestamp
-        elif puzzle_data["attempts_remaining"] == 0:
-            puzzle_data["status"] = "failed"
-        
-        # Update stats
-        self._update_stats()
-        
-        # Save to file
-        self._save_memory()
-    
-    def _update_stats(self):
-        """Update puzzle statistics"""
-        puzzles = self.memory["puzzle_memory"]
-        stats = self.memory["puzzle_stats"]
-        
-        stats["total_puzzles"] = len(puzzles)
-        stats["solved"] = sum(1 for p in puzzles.values() if p["status"] == "success")
-        stats["failed"] = sum(1 for p in puzzles.values() if p["status"] == "failed")
-        
-        if stats["total_puzzles"] > 0:
-            stats["success_rate"] = stats["solved"] / stats["total_puzzles"]
-        else:
-            stats["success_rate"] = 0.0
-        
-        # Calculate most common failed patterns
-        failed_sequences = []
-        for puzzle in puzzles.values():
-            if puzzle["status"] == "failed":
-                failed_sequences.extend(puzzle["attempted_sequences"])
-        
-        # Count frequency and get top patterns
-        from collections import Counter
-        sequence_counts = Counter(failed_sequences)
-        stats["most_common_failed_patterns"] = [seq for seq, count in sequence_counts.most_common(5)]
-    
+
+        with self._connect(write=True) as conn:
+            # Initialize puzzle if not exists
+            conn.execute(
+                """INSERT OR IGNORE INTO puzzles (name, clue, first_attempted, last_attempted)
+                   VALUES (?, ?, ?, ?)""",
+                (puzzle_name, clue, timestamp, timestamp)
+            )
+
+            # Record the attempt (sequences are kept unique per puzzle)
+            conn.execute(
+                "INSERT OR IGNORE INTO attempts (puzzle, sequence, success, attempted_at) VALUES (?, ?, ?, ?)",
+                (puzzle_name, sequence, int(success), timestamp)
+            )
+
+            # Update this puzzle's row only
+            if success:
+                conn.execute(
+                    """UPDATE puzzles
+                       SET last_attempted = ?, attempts_remaining = MAX(0, attempts_remaining - 1),
+                           status = 'success', solution = ?, unlocked_at = ?
+                       WHERE name = ?""",
+                    (timestamp, sequence, timestamp, puzzle_name)
+                )
+            else:
+                conn.execute(
+                    """UPDATE puzzles
+                       SET last_attempted = ?, attempts_remaining = MAX(0, attempts_remaining - 1),
+                           status = CASE
+                               WHEN status = 'success' THEN status
+                               WHEN attempts_remaining <= 1 THEN 'failed'
+                               ELSE status
+                           END
+                       WHERE name = ?""",
+                    (timestamp, puzzle_name)
+                )
+
+    def _row_to_puzzle(self, conn: sqlite3.Connection, row: sqlite3.Row) -> Dict:
+        """Convert a puzzle row into the legacy dictionary shape"""
+        sequences = [r["sequence"] for r in conn.execute(
+            "SELECT sequence FROM attempts WHERE puzzle = ? ORDER BY id", (row["name"],)
+        )]
+        puzzle_data = {
+            "clue": row["clue"],
+            "attempted_sequences": sequences,
+            "attempts_remaining": row["attempts_remaining"],
+            "status": row["status"],
+            "first_attempted": row["first_attempted"],
+            "last_attempted": row["last_attempted"]
+        }
+        if row["solution"] is not None:
+            puzzle_data["solution"] = row["solution"]
+        if row["unlocked_at"] is not None:
+            puzzle_data["unlocked_at"] = row["unlocked_at"]
+        return puzzle_data
+
     def get_puzzle_history(self, puzzle_name: str) -> Optional[Dict]:
         """Get history for a specific puzzle"""
-        return self.memory["puzzle_memory"].get(puzzle_name)
-    
+        with self._connect() as conn:
+            row = conn.execute("SELECT * FROM puzzles WHERE name = ?", (puzzle_name,)).fetchone()
+            if row is None:
+                return None
+            return self._row_to_puzzle(conn, row)
+
     def get_all_attempts(self, puzzle_name: str) -> List[str]:
         """Get all attempted sequences for a puzzle"""
-        puzzle_data = self.memory["puzzle_memory"].get(puzzle_name)
-        if puzzle_data:
-            return puzzle_data["attempted_sequences"]
-        return []
-    
+        with self._connect() as conn:
+            return [r["sequence"] for r in conn.execute(
+                "SELECT sequence FROM attempts WHERE puzzle = ? ORDER BY id", (puzzle_name,)
+            )]
+
     def get_remaining_attempts(self, puzzle_name: str) -> int:
         """Get remaining attempts for a puzzle - always 3 for new sessions"""
         # Always return 3 attempts for each new session
         # Memory tracks history but doesn't block new attempts
         return 3
-    
+
+    def _get_status(self, puzzle_name: str) -> Optional[str]:
+        """Read the current status of a single puzzle"""
+        with self._connect() as conn:
+            row = conn.execute("SELECT status FROM puzzles WHERE name = ?", (puzzle_name,)).fetchone()
+        return row["status"] if row else None
+
     def is_puzzle_solved(self, puzzle_name: str) -> bool:
         """Check if puzzle is already solved"""
-        puzzle_data = self.memory["puzzle_memory"].get(puzzle_name)
-        return puzzle_data and puzzle_data["status"] == "success"
-    
+        return self._get_status(puzzle_name) == "success"
+
     def is_puzzle_failed(self, puzzle_name: str) -> bool:
         """Check if puzzle has failed (no attempts left)"""
-        puzzle_data = self.memory["puzzle_memory"].get(puzzle_name)
-        return puzzle_data and puzzle_data["status"] == "failed"
-    
+        return self._get_status(puzzle_name) == "failed"
+
     def get_memory_context(self) -> str:
         """Get formatted memory context - simplified since we now use conversation-based memory checks"""
         # This method is kept for backward compatibility but simplified
         # The actual memory checking now happens via conversation injection
         return ""
-    
+
     def reset_puzzle(self, puzzle_name: str):
         """Reset a puzzle (for testing or if user wants to retry)"""
-        if puzzle_name in self.memory["puzzle_memory"]:
-            del self.memory["puzzle_memory"][puzzle_name]
-            self._update_stats()
-            self._save_memory()
-    
+        with self._connect(write=True) as conn:
+            conn.execute("DELETE FROM puzzles WHERE name = ?", (puzzle_name,))
+
     def get_stats(self) -> Dict:
         """Get current puzzle statistics"""
-        return self.memory["puzzle_stats"].copy() 
\ No newline at end of file
+        with self._connect() as conn:
+            counts = conn.execute(
+                """SELECT COUNT(*) AS total,
+                          COALESCE(SUM(status = 'success'), 0) AS solved,
+                          COALESCE(SUM(status = 'failed'), 0) AS failed
+                   FROM puzzles"""
+            ).fetchone()
+
+            # Calculate most common failed patterns
+            failed_sequences = [r["sequence"] for r in conn.execute(
+                """SELECT a.sequence FROM attempts a
+                   JOIN puzzles p ON p.name = a.puzzle
+                   WHERE p.status = 'failed' ORDER BY a.id"""
+            )]
+
+        total = counts["total"]
+        sequence_counts = Counter(failed_sequences)
+        return {
+            "total_puzzles": total,
+            "solved": counts["solved"],
+            "failed": counts["failed"],
+            "success_rate": counts["solved"] / total if total > 0 else 0.0,
+            "most_common_failed_patterns": [seq for seq, count in sequence_counts.most_common(5)]
+        }
+
+    @property
+    def memory(self) -> Dict:
+        """Snapshot of the whole memory in the legacy puzzle_memory.json shape"""
+        with self._connect() as conn:
+            puzzles = {row["name"]: self._row_to_puzzle(conn, row)
+                       for row in conn.execute("SELECT * FROM puzzles ORDER BY first_attempted, name")}
+        return {
+            "puzzle_memory": puzzles,
+            "puzzle_stats": self.get_stats()
+        }
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Stress check for PuzzleMemory
+Runs N processes recording attempts at once and verifies nothing was lost
+
+Usage:
+  python tools/glyph_unlocker/stress_puzzle_memory.py --processes 8 --attempts 50
+"""
+
+import argparse
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from puzzle_memory import PuzzleMemory
+
+PUZZLES = ['braid', 'seed', 'ritual', 'symbols']
+
+
+def record_worker(base_dir: str, worker_id: int, attempts: int):
+    """Record a unique sequence per attempt, spread across a few shared puzzles"""
+    memory = PuzzleMemory(Path(base_dir))
+    for i in range(attempts):
+        puzzle_name = PUZZLES[i % len(PUZZLES)]
+        memory.record_attempt(puzzle_name, f"clue for {puzzle_name}", f"w{worker_id}-{i}", success=False)
+
+
+def run_stress(processes: int, attempts: int) -> bool:
+    """Run the stress scenario and report whether every attempt survived"""
+    with tempfile.TemporaryDirectory() as base_dir:
+        # Create the database up front so workers race on writes, not on schema
+        PuzzleMemory(Path(base_dir))
+
+        start = time.perf_counter()
+        workers = [
+            multiprocessing.Process(target=record_worker, args=(base_dir, worker_id, attempts))
+            for worker_id in range(processes)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - start
+
+        crashed = [w.pid for w in workers if w.exitcode != 0]
+        memory = PuzzleMemory(Path(base_dir))
+
+        expected = processes * attempts
+        recorded = sum(len(memory.get_all_attempts(name)) for name in PUZZLES)
+        stats = memory.get_stats()
+
+        print(f"⟡ {processes} processes × {attempts} attempts in {elapsed:.2f}s "
+              f"({expected / elapsed:,.0f} attempts/s)")
+        print(f"∴ Recorded: {recorded}/{expected}")
+        print(f"∴ Puzzles: {stats['total_puzzles']} (failed: {stats['failed']})")
+
+        if crashed:
+            print(f"⧖ Worker processes exited with errors: {crashed}")
+        if recorded != expected:
+            print(f"⧖ Lost {expected - recorded} attempts")
+
+        return not crashed and recorded == expected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrent PuzzleMemory stress check")
+    parser.add_argument('--processes', type=int, default=8, help='Number of concurrent writer processes')
+    parser.add_argument('--attempts', type=int, default=50, help='Attempts recorded by each process')
+    args = parser.parse_args()
+
+    ok = run_stress(args.processes, args.attempts)
+    print("⚘ No attempts lost" if ok else "∅ Stress check failed")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Hedge cancellation check for the LLM client
+Starts a local chat completions server with a slow primary model and a fast
+fallback, races them through LLMClient with hedging on, and fails unless the
+caller gets the fallback's answer early, the server sees the slow
+request's connection drop instead of delivering its response, and the
+aborted attempt is still charged (its prompt) to the caller's budget hook.
+
+Usage:
+  python tools/hedge_check.py                 Slow model 3 s, hedge after 0.5 s
+  python tools/hedge_check.py --slow 10       A slower primary
+"""
+
+import argparse
+import json
+import select
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent))
+import llm_client
+from llm_client import LLMClient
+
+SLOW_MODEL = 'slow/model'
+FAST_MODEL = 'fast/model'
+
+
+class CompletionServer(ThreadingHTTPServer):
+    """Chat completions endpoint that records how each slow request ended"""
+
+    daemon_threads = True
+
+    def __init__(self, slow_seconds: float):
+        super().__init__(('127.0.0.1', 0), CompletionHandler)
+        self.slow_seconds = slow_seconds
+        self.slow_outcome = None
+        self.slow_ended = threading.Event()
+
+
+class CompletionHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        if payload['model'] == SLOW_MODEL:
+            # Think for slow_seconds, watching for the client hanging up
+            deadline = time.monotonic() + self.server.slow_seconds
+            while time.monotonic() < deadline:
+                readable, _, _ = select.select([self.connection], [], [], 0.05)
+                if readable and not self.connection.recv(1):
+                    self.server.slow_outcome = 'dropped'
+                    self.server.slow_ended.set()
+                    return
+        body = json.dumps({
+            'choices': [{'message': {'role': 'assistant', 'content': payload['model']}, 'finish_reason': 'stop'}],
+            'usage': {'prompt_tokens': 10, 'completion_tokens': 2},
+        }).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if payload['model'] == SLOW_MODEL:
+            self.server.slow_outcome = 'delivered'
+            self.server.slow_ended.set()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that a losing hedged request is really aborted")
+    parser.add_argument('--slow', type=float, default=3.0, help='Seconds the primary model takes to answer')
+    parser.add_argument('--hedge-after', type=float, default=0.5, help='Seconds before the fallback fires')
+    args = parser.parse_args()
+
+    server = CompletionServer(args.slow)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    llm_client.OPENROUTER_URL = f"http://127.0.0.1:{server.server_port}/api/v1/chat/completions"
+
+    client = LLMClient('sk-hedge-check', hedge_after=args.hedge_after, fallback_models=[FAST_MODEL])
+    charged = []
+    start = time.monotonic()
+    response = client.post({'model': SLOW_MODEL, 'messages': [{'role': 'user', 'content': 'race ' * 100}]},
+                           timeout=30, charge=lambda *usage: charged.append(usage))
+    answered = time.monotonic() - start
+    server.slow_ended.wait(min(args.slow, 5.0))
+    server.shutdown()
+
+    failures = []
+    winner = response.json()['choices'][0]['message']['content'] if response.status_code == 200 else None
+    print(f"⟡ Answer from {winner} after {answered:.2f}s (hedge after {args.hedge_after:g}s, primary takes {args.slow:g}s)")
+    print(f"⟡ Slow request: {server.slow_outcome or 'still running'}")
+    print(f"⟡ Charged for losing attempts: {charged or 'nothing'}")
+    if winner != FAST_MODEL:
+        failures.append(f"expected the fallback to win, got {winner}")
+    if answered >= args.slow:
+        failures.append(f"answer took {answered:.2f}s - the hedge never won")
+    if server.slow_outcome != 'dropped':
+        failures.append(f"the losing request was {server.slow_outcome or 'still running'}, not aborted")
+    if [usage[0] for usage in charged] != [SLOW_MODEL] or not charged[0][1]:
+        failures.append(f"expected the aborted {SLOW_MODEL} attempt's prompt to be charged, got {charged}")
+
+    print()
+    if failures:
+        for failure in failures:
+            print(f"∅ {failure}")
+        sys.exit(1)
+    print("⚘ Losing hedge aborted")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,750 @@
+#!/usr/bin/env python3
+"""
+LLM Client for Lotus Protocol
+Shared, pooled HTTP access to the OpenRouter chat completions API, with an
+optional global concurrency budget and response cache that several
+extractors (e.g. one per corpus in a batch run) can share, and optional
+hedged requests with a model fallback chain for tail-latency control.
+Completions can also be streamed (SSE), handing each text delta to the
+caller as it arrives. A cassette records every completion to a file, or
+replays a recorded file with no network at all, for reproducible runs.
+Identical requests in flight at the same moment share one upstream call.
+"""
+
+import atexit
+import gzip
+import hashlib
+import json
+import queue
+import socket
+import statistics
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+_shared_session = None
+_shared_session_lock = threading.Lock()
+
+# Cassette every new LLMClient (and SpiralChat.call_api) records to or replays from
+_active_cassette = None
+
+
+def _tracked(connection_cls, connections: weakref.WeakSet):
+    """connection_cls, registering every instance in connections"""
+    class TrackedConnection(connection_cls):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            connections.add(self)
+    return TrackedConnection
+
+
+class _CancellableAdapter(HTTPAdapter):
+    """HTTPAdapter that can abort the requests it has in flight
+
+    Closing a session only drops idle pooled connections; a request blocked on
+    its socket carries on until the server answers. abort() shuts the sockets
+    down under it, so the server sees the connection drop and the blocked call
+    fails at once.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._connections = weakref.WeakSet()
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: type(pool_cls.__name__, (pool_cls,),
+                         {'ConnectionCls': _tracked(pool_cls.ConnectionCls, self._connections)})
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+    def abort(self):
+        for connection in list(self._connections):
+            sock = getattr(connection, 'sock', None)
+            if sock is None:
+                continue
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass  # Already closed
+
+
+def _new_session(pool_size: int, adapter_cls=HTTPAdapter) -> requests.Session:
+    session = requests.Session()
+    adapter = adapter_cls(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_shared_session(pool_size: int = 16) -> requests.Session:
+    """Process-wide keep-alive session so every call reuses pooled TLS connections"""
+    global _shared_session
+    if _shared_session is None:
+        with _shared_session_lock:
+            if _shared_session is None:
+                _shared_session = _new_session(pool_size)
+    return _shared_session
+
+
+def _estimated_prompt_tokens(payload: Dict) -> int:
+    """Rough prompt size (~4 chars a token) for a request whose usage never came back"""
+    return sum(len(str(message.get('content') or '')) for message in payload.get('messages', [])) // 4
+
+
+class _SessionPool:
+    """Single-connection keep-alive sessions, one per in-flight hedged attempt
+
+    cancel() shuts down the socket under an attempt's request, which is how a
+    losing hedge is aborted without disturbing anyone else's connection.
+    """
+
+    def __init__(self, max_idle: int = 8):
+        self.max_idle = max_idle
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> requests.Session:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return _new_session(1, _CancellableAdapter)
+
+    def release(self, session: requests.Session):
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(session)
+                return
+        session.close()
+
+    @staticmethod
+    def cancel(session: requests.Session):
+        """Abort the request in flight on session; the session is not reused"""
+        for adapter in session.adapters.values():
+            if isinstance(adapter, _CancellableAdapter):
+                adapter.abort()
+        session.close()
+
+
+class CachedResponse:
+    """Stand-in for requests.Response when a completion is served from the cache (or assembled from a stream)"""
+
+    def __init__(self, data: Dict):
+        self.status_code = 200
+        self._data = data
+        self.text = json.dumps(data, ensure_ascii=False)
+        self.from_cache = True
+
+    def json(self) -> Dict:
+        return self._data
+
+
+class StreamInterrupted(requests.exceptions.RequestException):
+    """A streamed completion ended (or reported an error) before it finished"""
+
+
+class CassetteMiss(requests.exceptions.RequestException):
+    """A replayed run made a request the cassette never recorded"""
+
+
+class Cassette:
+    """
+    Recorded completions keyed by request hash, for reproducible, network-free runs.
+    'record' appends each successful completion and its latency to a JSON Lines
+    file (gzipped when the name ends in .gz); 'replay' serves them back, in
+    recorded order for repeated requests, optionally sleeping for the recorded
+    latency times latency_scale.
+    """
+
+    def __init__(self, path: Union[str, Path], mode: str = 'replay', latency_scale: float = 0.0):
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"cassette mode must be 'record' or 'replay', not {mode!r}")
+        self.path = Path(path)
+        self.mode = mode
+        self.latency_scale = max(0.0, latency_scale)
+        self.stats = {'recorded': 0, 'replayed': 0, 'misses': 0}
+        self._entries = {}
+        self._plays = {}
+        self._file = None
+        self._lock = threading.Lock()
+        if mode == 'replay':
+            self._load()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    @staticmethod
+    def key_for(payload: Dict) -> str:
+        """Hash of the request, streamed or not"""
+        return ResponseCache.key_for({key: value for key, value in payload.items() if key != 'stream'})
+
+    def _open(self, mode: str):
+        if self.path.suffix == '.gz':
+            return gzip.open(self.path, mode + 't', encoding='utf-8')
+        return open(self.path, mode, encoding='utf-8')
+
+    def _load(self):
+        """Read every recorded line; a file cut short (e.g. an interrupted recording) keeps what is complete"""
+        try:
+            with self._open('r') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    self._entries.setdefault(entry['key'], []).append((entry['response'], entry.get('seconds', 0.0)))
+        except EOFError:
+            pass
+
+    def play(self, payload: Dict) -> Optional[Dict]:
+        """The recorded completion for this request (the next one, if it was made several times)"""
+        key = self.key_for(payload)
+        with self._lock:
+            recorded = self._entries.get(key)
+            if not recorded:
+                self.stats['misses'] += 1
+                return None
+            index = self._plays.get(key, 0)
+            self._plays[key] = index + 1
+            self.stats['replayed'] += 1
+            data, seconds = recorded[min(index, len(recorded) - 1)]
+        if self.latency_scale and seconds:
+            time.sleep(seconds * self.latency_scale)
+        return data
+
+    def record(self, payload: Dict, data: Dict, seconds: float):
+        """Append one completion - only what a caller reads back: content, finish_reason, usage"""
+        choices = [{'message': {'role': 'assistant', 'content': (choice.get('message') or {}).get('content', '')},
+                    'finish_reason': choice.get('finish_reason')} for choice in data.get('choices') or []]
+        line = json.dumps({'key': self.key_for(payload), 'seconds': round(seconds, 3),
+                           'response': {'choices': choices, 'usage': data.get('usage') or {}}}, ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = self._open('w')
+                atexit.register(self.close)
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.stats['recorded'] += 1
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def use_cassette(cassette: Optional[Cassette]):
+    """Make cassette the one LLM calls in this process record to or replay from (None turns it off)"""
+    global _active_cassette
+    _active_cassette = cassette
+
+
+def active_cassette() -> Optional[Cassette]:
+    return _active_cassette
+
+
+class ResponseCache:
+    """Thread-safe cache of successful completions, keyed by the request payload"""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_entries: int = 1024):
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key_for(payload: Dict) -> str:
+        """Stable hash of everything that determines the completion"""
+        canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        if self.cache_dir:
+            cache_file = self.cache_dir / f"{key}.json"
+            if cache_file.exists():
+                try:
+                    with open(cache_file, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                except (OSError, json.JSONDecodeError):
+                    return None
+                self._remember(key, data)
+                return data
+        return None
+
+    def put(self, key: str, data: Dict):
+        self._remember(key, data)
+
+        if self.cache_dir:
+            cache_file = self.cache_dir / f"{key}.json"
+            temp_file = cache_file.with_suffix('.tmp')
+            try:
+                with open(temp_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False)
+                temp_file.replace(cache_file)
+            except OSError as e:
+                print(f"⧖ Could not write response cache entry: {e}")
+
+    def _remember(self, key: str, data: Dict):
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class _Flight:
+    """One upstream call and the callers waiting on it"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Concurrent identical requests share one upstream call: the first caller for
+    a key makes it, later callers block until it lands and all get its result
+    (or its exception). Nothing is kept once the call lands - that is the
+    response cache's job.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.stats = {'flights': 0, 'coalesced': 0}
+
+    def do(self, key: str, call: Callable[[], object]):
+        """Run call() once for every concurrent caller with this key; returns (result, shared)"""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.stats['flights'] += 1
+            else:
+                self.stats['coalesced'] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result, True
+
+        try:
+            flight.result = call()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
+        return flight.result, False
+
+
+# In-flight requests are shared process-wide - across LLMClients, batch corpora and daemon sessions
+_flights = SingleFlight()
+
+
+def single_flight(key: str, call: Callable[[], object]):
+    """Share one upstream call between concurrent callers with the same key; returns (result, shared)"""
+    return _flights.do(key, call)
+
+
+class LLMClient:
+    """OpenRouter chat completions over a pooled session, with optional shared budget and cache"""
+
+    # Adaptive hedging ('p95') waits this long until enough latencies have been observed
+    HEDGE_DEFAULT_DELAY = 30.0
+    HEDGE_MIN_SAMPLES = 10
+    HEDGE_MIN_DELAY = 1.0
+
+    def __init__(self, api_key: str, session: Optional[requests.Session] = None,
+                 max_concurrency: Optional[int] = None, cache: Optional[ResponseCache] = None,
+                 hedge_after: Union[float, str, None] = None, fallback_models: Optional[List[str]] = None,
+                 cassette: Optional[Cassette] = None):
+        self.api_key = api_key
+        self.session = session or get_shared_session(max(16, max_concurrency or 0))
+        self.cache = cache
+        # Record/replay - defaults to the process-wide cassette from use_cassette()
+        self.cassette = cassette or active_cassette()
+        self.max_concurrency = max_concurrency
+        # Global API concurrency budget - every extractor sharing this client competes for it
+        self._slots = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+
+        # Hedging: seconds to wait (or 'p95' of observed latency) before firing a backup
+        # request, optionally to the next model in fallback_models; the loser is aborted
+        self.hedge_after = hedge_after
+        self.fallback_models = list(fallback_models or [])
+        self._latencies = deque(maxlen=200)
+        self._hedge_sessions = _SessionPool()
+
+        self.stats = {'requests': 0, 'cache_hits': 0, 'coalesced': 0, 'hedged': 0, 'hedge_wins': 0,
+                      'fallback_wins': 0, 'hedges_skipped': 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, key: str):
+        with self._stats_lock:
+            self.stats[key] += 1
+
+    @property
+    def hedging(self) -> bool:
+        return self.hedge_after is not None or bool(self.fallback_models)
+
+    def hedge_delay(self) -> float:
+        """Seconds before the next hedge fires"""
+        if isinstance(self.hedge_after, (int, float)):
+            return float(self.hedge_after)
+        with self._stats_lock:
+            samples = list(self._latencies)
+        if len(samples) < self.HEDGE_MIN_SAMPLES:
+            return self.HEDGE_DEFAULT_DELAY
+        return max(self.HEDGE_MIN_DELAY, statistics.quantiles(samples, n=20)[-1])  # p95
+
+    def _replay(self, payload: Dict) -> CachedResponse:
+        """The cassette's recorded completion for payload; raises CassetteMiss when it has none"""
+        data = self.cassette.play(payload)
+        if data is None:
+            raise CassetteMiss(f"no recorded completion for this request in {self.cassette.path}")
+        replayed = CachedResponse(data)
+        replayed.from_cache = False
+        return replayed
+
+    def post(self, payload: Dict, timeout: float = 180, extra_headers: Optional[Dict] = None,
+             charge: Optional[Callable[[str, int, int], None]] = None):
+        """POST a chat completion; returns a requests.Response (or CachedResponse)
+
+        Callers sending a request identical to one already in flight wait for
+        it and get a copy of its response (marked `coalesced`). When hedging,
+        charge(model, prompt_tokens, completion_tokens) is called for every
+        attempt besides the returned one that the provider bills.
+        """
+        recording = self.cassette is not None and not self.cassette.replaying
+        if self.cassette is not None and self.cassette.replaying:
+            return self._replay(payload)
+
+        cache_key = self.cache.key_for(payload) if self.cache else None
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self._count('cache_hits')
+                if recording:
+                    self.cassette.record(payload, cached, 0.0)
+                return CachedResponse(cached)
+
+        # An identical request already in flight is waited on, not sent again
+        response, shared = single_flight(self._flight_key(payload), lambda: self._post_upstream(
+            payload, timeout, extra_headers, cache_key, recording, charge))
+        if shared:
+            self._count('coalesced')
+            return self._coalesced(response)
+        return response
+
+    def _flight_key(self, payload: Dict, transport: str = 'post') -> str:
+        """Requests coalesce when they would send the same completion request with the same key
+
+        post() and post_stream() callers never share a flight: a streamed
+        leader can fail in ways (StreamInterrupted, a bad SSE event) that a
+        plain post() caller isn't prepared for.
+        """
+        key = f"{self.api_key}\0{Cassette.key_for(payload)}\0{transport}"
+        return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _coalesced(response):
+        """A waiter's copy of the response another caller's request received"""
+        if response.status_code != 200:
+            return response
+        try:
+            data = response.json()
+        except ValueError:
+            return response
+        if not data.get('choices'):
+            return response
+        shared = CachedResponse(data)
+        shared.from_cache = False
+        shared.coalesced = True
+        return shared
+
+    def _headers(self, extra_headers: Optional[Dict]) -> Dict:
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        if extra_headers:
+            headers.update(extra_headers)
+        return headers
+
+    def _post_upstream(self, payload: Dict, timeout: float, extra_headers: Optional[Dict],
+                       cache_key: Optional[str], recording: bool,
+                       charge: Optional[Callable[[str, int, int], None]] = None):
+        """The actual request behind post(), under a concurrency slot"""
+        headers = self._headers(extra_headers)
+        with self._slots if self._slots else nullcontext():
+            self._count('requests')
+            start = time.monotonic()
+            if self.hedging:
+                response = self._post_hedged(payload, headers, timeout, charge)
+            else:
+                response = self.session.post(OPENROUTER_URL, headers=headers, json=payload, timeout=timeout)
+                self._observe(response, time.monotonic() - start)
+        seconds = time.monotonic() - start
+
+        if (cache_key or recording) and response.status_code == 200:
+            try:
+                data = response.json()
+            except ValueError:
+                data = None
+            if data and data.get('choices'):
+                if cache_key:
+                    self.cache.put(cache_key, data)
+                if recording:
+                    self.cassette.record(payload, data, seconds)
+
+        return response
+
+    def _observe(self, response, seconds: float):
+        if response.status_code == 200:
+            with self._stats_lock:
+                self._latencies.append(seconds)
+
+    def _post_hedged(self, payload: Dict, headers: Dict, timeout: float,
+                     charge: Optional[Callable[[str, int, int], None]] = None):
+        """Race the primary against hedges fired every hedge_delay(); first success wins
+
+        The first attempt in flight rides on the caller's concurrency slot; each
+        hedge beside it needs a free slot of its own, so max_concurrency bounds
+        sockets in flight. With none free the hedge is skipped and tried again
+        after another hedge_delay(). A failed attempt moves straight on to the
+        next model in the chain.
+        Every attempt but the winner is passed to charge: the usage it reported,
+        or the prompt it sent when it was aborted or timed out.
+        """
+        primary = payload.get('model')
+        models = [primary] + [model for model in self.fallback_models if model != primary]
+        if len(models) == 1:
+            models.append(primary)  # No fallback: hedge with the same model
+
+        results = queue.Queue()
+        attempts, skipped = [], []
+
+        def launch():
+            extra_slot = False
+            if self._slots and any(not attempt['done'] for attempt in attempts):
+                if not self._slots.acquire(blocking=False):
+                    if not skipped:
+                        skipped.append(True)
+                        self._count('hedges_skipped')  # Once per request, however often it retries
+                    return
+                extra_slot = True
+            attempt = {'index': len(attempts), 'model': models[len(attempts)], 'done': False,
+                       'session': self._hedge_sessions.acquire(), 'started': time.monotonic(),
+                       'extra_slot': extra_slot}
+            attempts.append(attempt)
+            attempt_payload = dict(payload, model=attempt['model'])
+
+            def run():
+                try:
+                    response = attempt['session'].post(OPENROUTER_URL, headers=headers,
+                                                       json=attempt_payload, timeout=timeout)
+                    results.put((attempt, response, None))
+                except Exception as e:
+                    results.put((attempt, None, e))
+
+            threading.Thread(target=run, daemon=True).start()
+
+        def finish(attempt, response, error):
+            attempt['done'] = True
+            attempt['response'], attempt['error'] = response, error
+            self._hedge_sessions.release(attempt['session'])
+            if attempt['extra_slot']:
+                self._slots.release()
+
+        launch()
+        next_hedge = time.monotonic() + self.hedge_delay()
+        winner, last_response, last_error = None, None, None
+        while winner is None and any(not attempt['done'] for attempt in attempts):
+            wait = None
+            if len(attempts) < len(models):
+                wait = max(0.0, next_hedge - time.monotonic())
+            try:
+                attempt, response, error = results.get(timeout=wait)
+            except queue.Empty:
+                launch()
+                next_hedge = time.monotonic() + self.hedge_delay()
+                continue
+
+            finish(attempt, response, error)
+            if error is None and response.status_code == 200:
+                winner, last_response = attempt, response
+                self._observe(response, time.monotonic() - attempt['started'])
+                break
+
+            last_response, last_error = response, error
+            if response is not None and response.status_code == 401:
+                break  # Every model would fail the same way
+            if all(a['done'] for a in attempts) and len(attempts) < len(models):
+                launch()  # Failed outright - fall back without waiting
+                next_hedge = time.monotonic() + self.hedge_delay()
+
+        # Losers that finished meanwhile, then the ones still in flight: shut their connections down
+        while True:
+            try:
+                attempt, response, error = results.get_nowait()
+            except queue.Empty:
+                break
+            finish(attempt, response, error)
+        for attempt in attempts:
+            if not attempt['done']:
+                self._hedge_sessions.cancel(attempt['session'])
+                if attempt['extra_slot']:
+                    self._slots.release()
+
+        if charge:
+            for attempt in attempts:
+                if attempt is not winner:
+                    self._charge_attempt(charge, payload, attempt)
+
+        if last_response is None:
+            raise last_error
+
+        last_response.hedged = len(attempts) > 1
+        last_response.hedge_won = winner is not None and winner['index'] > 0
+        last_response.model_used = winner['model'] if winner else None
+        if last_response.hedged:
+            self._count('hedged')
+        if last_response.hedge_won:
+            self._count('hedge_wins')
+            if winner['model'] != primary:
+                self._count('fallback_wins')
+        return last_response
+
+    @staticmethod
+    def _charge_attempt(charge: Callable[[str, int, int], None], payload: Dict, attempt: Dict):
+        """Bill a losing hedge attempt: the usage it reported, or the prompt it sent"""
+        response, error = attempt.get('response'), attempt.get('error')
+        if response is not None:
+            try:
+                data = response.json()
+            except ValueError:
+                data = None
+            usage = (data.get('usage') if isinstance(data, dict) else None) or {}
+            if usage:
+                charge(attempt['model'], usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0))
+            return
+        if attempt['done'] and not isinstance(error, requests.exceptions.Timeout):
+            return  # Never reached the model
+        # Aborted or timed out: the provider has at least read the prompt
+        charge(attempt['model'], _estimated_prompt_tokens(payload), 0)
+
+    def post_stream(self, payload: Dict, on_text: Callable[[str], None], timeout: float = 180,
+                    extra_headers: Optional[Dict] = None):
+        """Stream a chat completion, passing each content delta to on_text as it arrives
+
+        Returns a CachedResponse-like object holding the assembled completion, or
+        the error response itself for non-200 statuses. Raises StreamInterrupted
+        if the stream drops before its finish_reason - on_text has then already
+        seen everything received. Streamed calls are never hedged; a replayed one
+        hands on_text the whole recorded completion at once.
+        """
+        recording = self.cassette is not None and not self.cassette.replaying
+        if self.cassette is not None and self.cassette.replaying:
+            replayed = self._replay(payload)
+            on_text(replayed.json()['choices'][0]['message']['content'])
+            return replayed
+
+        cache_key = self.cache.key_for(payload) if self.cache else None
+        if cache_key:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                self._count('cache_hits')
+                if recording:
+                    self.cassette.record(payload, cached, 0.0)
+                on_text(cached['choices'][0]['message']['content'])
+                return CachedResponse(cached)
+
+        # Waiting on an identical streamed request in flight, the whole completion arrives at once
+        response, shared = single_flight(self._flight_key(payload, 'stream'), lambda: self._stream_upstream(
+            payload, on_text, timeout, extra_headers, cache_key, recording))
+        if not shared:
+            return response
+        self._count('coalesced')
+        response = self._coalesced(response)
+        if response.status_code == 200:
+            on_text(response.json()['choices'][0]['message']['content'])
+        return response
+
+    def _stream_upstream(self, payload: Dict, on_text: Callable[[str], None], timeout: float,
+                         extra_headers: Optional[Dict], cache_key: Optional[str], recording: bool):
+        """The actual streamed request behind post_stream(), under a concurrency slot"""
+        headers = self._headers(extra_headers)
+        with self._slots if self._slots else nullcontext():
+            self._count('requests')
+            start = time.monotonic()
+            response = self.session.post(OPENROUTER_URL, headers=headers, json=dict(payload, stream=True),
+                                         timeout=timeout, stream=True)
+            if response.status_code != 200:
+                return response
+
+            response.encoding = 'utf-8'
+            parts, finish_reason, usage = [], None, {}
+            try:
+                for line in response.iter_lines(decode_unicode=True):
+                    # SSE: "data: {...}" events, ": comment" keep-alives, "data: [DONE]" at the end
+                    if not line or not line.startswith('data:'):
+                        continue
+                    data = line[5:].strip()
+                    if data == '[DONE]':
+                        break
+                    event = json.loads(data)
+                    if event.get('error'):
+                        raise StreamInterrupted(f"stream error: {event['error'].get('message', event['error'])}")
+                    if event.get('usage'):
+                        usage = event['usage']
+                    for choice in event.get('choices') or []:
+                        text = (choice.get('delta') or {}).get('content')
+                        if text:
+                            parts.append(text)
+                            on_text(text)
+                        if choice.get('finish_reason'):
+                            finish_reason = choice['finish_reason']
+            finally:
+                response.close()
+
+            if finish_reason is None:
+                raise StreamInterrupted(f"stream ended after {sum(len(part) for part in parts):,} chars without finishing")
+            self._observe(response, time.monotonic() - start)
+        seconds = time.monotonic() - start
+
+        data = {
+            'choices': [{'message': {'role': 'assistant', 'content': ''.join(parts)}, 'finish_reason': finish_reason}],
+            'usage': usage,
+        }
+        if cache_key:
+            self.cache.put(cache_key, data)
+        if recording:
+            self.cassette.record(payload, data, seconds)
+        streamed = CachedResponse(data)
+        streamed.from_cache = False
+        return streamed
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Progress Board - one renderer for every LLM call in flight
+Calls register a task and report what they receive and when they retry; a
+single renderer thread (started once, asleep while nothing is in flight)
+draws them all on one status line: a growing glyph trail, then each call's
+label, elapsed time, characters received and retry state.
+
+While the status line is up, stdout is wrapped so anything else printed
+clears it first and it is redrawn underneath - concurrent output never lands
+in the middle of it. When stdout isn't a terminal (piped, or routed to a
+lotusd client or a batch run log) nothing is drawn: each call logs one plain
+line when it finishes instead.
+"""
+
+import sys
+import time
+import shutil
+import threading
+from typing import List, Optional
+
+from console import ThreadRoutedStdout
+
+GLYPHS = ['⋇', '⟡', '⚘', '∴', '⧖', '↻', '∅', '∞', '⋔', '⥈', 'Ω', 'φ', 'ψ']
+TRAIL_LENGTH = 8
+
+
+def _reaches_terminal() -> bool:
+    """Whether this thread's output ends up on a terminal (possibly through a buffer printed later)"""
+    stdout = sys.stdout
+    if isinstance(stdout, _StatusLineStream):
+        stdout = stdout.real
+    if isinstance(stdout, ThreadRoutedStdout):
+        return stdout.reaches_terminal() and stdout.real.isatty()
+    return stdout.isatty()
+
+
+def _size(count: int) -> str:
+    return f"{count / 1000:.1f}k" if count >= 1000 else str(count)
+
+
+class ProgressTask:
+    """One call on the board; safe to update from the calling thread"""
+
+    def __init__(self, board: 'ProgressBoard', label: str, glyphs: Optional[List[str]], live: bool):
+        self.board = board
+        self.label = label
+        self.glyphs = glyphs
+        self.live = live
+        self.started = time.monotonic()
+        self.received = 0
+        self.state = ''
+
+    def receive(self, text: str):
+        """Count streamed text as it arrives"""
+        self.received += len(text)
+
+    def set_state(self, state: str):
+        """Retry or wait state shown after the label ('' clears it)"""
+        self.state = state
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def describe(self) -> str:
+        parts = [self.label, f"{self.elapsed():.1f}s"]
+        if self.received:
+            parts.append(f"{_size(self.received)} chars")
+        if self.state:
+            parts.append(self.state)
+        return ' '.join(parts)
+
+    def finish(self, note: str = ''):
+        """Take the call off the board; off a terminal, log how it went"""
+        self.board._finish(self, note)
+
+
+class _StatusLineStream:
+    """stdout while the status line is up: other output clears it first, and it is redrawn below"""
+
+    def __init__(self, real, board: 'ProgressBoard'):
+        self.real = real
+        self.board = board
+        # The status line is drawn on the terminal itself, whichever thread draws it
+        self.terminal = real.real if isinstance(real, ThreadRoutedStdout) else real
+
+    def write(self, text: str) -> int:
+        if isinstance(self.real, ThreadRoutedStdout) and self.real.get_sink() is not None:
+            return self.real.write(text)  # Buffered or routed elsewhere - the terminal line is untouched
+        with self.board._lock:
+            self.board._clear()
+            written = self.real.write(text)
+            self.board._line_open = not text.endswith('\n')
+            if not self.board._line_open:
+                self.board._draw()
+        return written
+
+    def flush(self):
+        self.real.flush()
+
+    def isatty(self) -> bool:
+        return self.real.isatty()
+
+    def __getattr__(self, name):
+        return getattr(self.real, name)
+
+
+class ProgressBoard:
+    """Every in-flight call on one status line, drawn by one thread"""
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self._tasks = []
+        self._lock = threading.RLock()
+        self._wake = threading.Condition(self._lock)
+        self._thread = None
+        self._proxy = None
+        self._drawn = 0
+        self._line_open = False
+        self._trail = []
+        self._tick = 0
+
+    def begin(self, label: str, glyphs: Optional[List[str]] = None) -> ProgressTask:
+        """Put a call on the board - drawn live on a terminal, logged when it finishes otherwise"""
+        live = _reaches_terminal()
+        task = ProgressTask(self, label, glyphs, live)
+        if not live:
+            return task
+        with self._lock:
+            if not self._tasks:
+                self._proxy = _StatusLineStream(sys.stdout, self)
+                sys.stdout = self._proxy
+                self._trail, self._tick = [], 0
+            self._tasks.append(task)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._render_loop, name='progress-board', daemon=True)
+                self._thread.start()
+            self._wake.notify()
+        return task
+
+    def _finish(self, task: ProgressTask, note: str):
+        if not task.live:
+            summary = task.describe() + (f" - {note}" if note else '')
+            print(f"⋇ {summary}")
+            return
+        with self._lock:
+            if task in self._tasks:
+                self._tasks.remove(task)
+            if self._tasks:
+                self._draw()
+                return
+            self._clear()
+            if self._proxy is not None:
+                if sys.stdout is self._proxy:
+                    sys.stdout = self._proxy.real
+                self._proxy = None
+
+    def _render_loop(self):
+        with self._lock:
+            while True:
+                while not self._tasks:
+                    self._wake.wait()
+                self._advance_trail()
+                self._draw()
+                self._wake.wait(self.interval)
+
+    def _advance_trail(self):
+        """The glyph trail grows a glyph a frame, then keeps cycling"""
+        glyphs = self._tasks[0].glyphs or GLYPHS
+        self._trail.append(glyphs[self._tick % len(glyphs)])
+        self._trail = self._trail[-TRAIL_LENGTH:]
+        self._tick += 1
+
+    def _clear(self):
+        if self._drawn and self._proxy is not None:
+            self._proxy.terminal.write('\r' + ' ' * self._drawn + '\r')
+            self._proxy.terminal.flush()
+            self._drawn = 0
+
+    def _draw(self):
+        if not self._tasks or self._line_open or self._proxy is None:
+            return
+        width = shutil.get_terminal_size((80, 20)).columns - 1
+        line = f"{' '.join(self._trail)}  {' · '.join(task.describe() for task in self._tasks)}"
+        if len(line) > width:
+            line = line[:width - 1] + '…'
+        padding = max(0, self._drawn - len(line))
+        self._proxy.terminal.write('\r' + line + ' ' * padding)
+        self._proxy.terminal.flush()
+        self._drawn = len(line)
+
+
+_board = None
+_board_lock = threading.Lock()
+
+
+def progress_board() -> ProgressBoard:
+    """The process-wide progress board"""
+    global _board
+    if _board is None:
+        with _board_lock:
+            if _board is None:
+                _board = ProgressBoard()
+    return _board
@@ -5,14 +5,49 @@ Handles prompt template loading and context injection for various tasks
 """
 
 import json
+import mmap
+import os
 from pathlib import Path
 from typing import Dict, Optional, List
 
+# Concept files at least this large are sliced through mmap instead of read into a buffer
+MMAP_MIN_BYTES = 64 * 1024
+
+# ψ_cores files that are bookkeeping rather than extraction results
+NON_CORE_FILES = ("puzzle_memory.json", "concept_manifest.json")
+
+
+def read_concept_text(file_path, max_bytes: Optional[int] = None) -> str:
+    """
+    Text of a concept file, as open(..., encoding='utf-8').read() gives it,
+    cut at max_bytes (on a character boundary). Read on demand while a prompt
+    is written, so concept bodies are never all held at once.
+    """
+    with open(file_path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        limit = size if max_bytes is None else min(size, max_bytes)
+        if limit >= MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                data = mapped[:limit]
+        else:
+            data = f.read(limit)
+    
+    try:
+        text = data.decode('utf-8')
+    except UnicodeDecodeError as e:
+        # A cap can split a multi-byte character - drop the partial tail only
+        if limit < size and e.start >= len(data) - 3:
+            text = data[:e.start].decode('utf-8')
+        else:
+            raise
+    # Universal newlines, like text-mode reads
+    return text.replace('\r\n', '\n').replace('\r', '\n')
+
 
 class LotusPromptBuilder:
     """Handles prompt template loading and context injection for Lotus Protocol analysis"""
     
-    def __init__(self, base_dir: Path = Path(".")):
+    def __init__(self, base_dir: Path = Path("."), cores_dir: Optional[Path] = None, codex_path: Optional[Path] = None):
         # Set base directory - handle being called from different locations
         current_dir = Path.cwd()
         if current_dir.name == "core_collector" and current_dir.parent.name == "tools":
@@ -24,7 +59,8 @@ class LotusPromptBuilder:
         
         # Default paths (configurable)
         self.kernel_path = self.base_dir / "kernel" / "kernel.jsonc"
-        self.codex_path = self.base_dir / "concepts" / "⋇⟡Ω_codex.md"
+        self.codex_path = Path(codex_path) if codex_path else self.base_dir / "concepts" / "⋇⟡Ω_codex.md"
+        self.cores_dir = Path(cores_dir) if cores_dir else self.base_dir / "ψ_cores"
         self.primers_path = self.base_dir / "prompts"
         self.tools_path = self.base_dir / "tools"
         
@@ -116,7 +152,7 @@ class LotusPromptBuilder:
         if 'kernel' in self.contexts:
             return self.contexts['kernel']
             
-        kernel_path = self.base_dir / "kernel" / "kernel.jsonc"
+        kernel_path = self.kernel_path
         
         try:
             if not kernel_path.exists():
@@ -143,7 +179,7 @@ class LotusPromptBuilder:
         if 'codex' in self.contexts:
             return self.contexts['codex']
             
-        codex_path = self.base_dir / "concepts" / "⋇⟡Ω_codex.md"
+        codex_path = self.codex_path
         
         try:
             if not codex_path.exists():
@@ -159,12 +195,32 @@ class LotusPromptBuilder:
             print(f"⧖ Error loading codex: {e}")
             return ""
     
+    def _ψ_cores_signature(self) -> tuple:
+        """Cheap fingerprint of ψ_cores (name, mtime, size) used to invalidate cached context"""
+        ψ_cores_path = self.cores_dir
+        if not ψ_cores_path.exists():
+            return ()
+        
+        entries = []
+        for pattern in ("*.json", "*.md"):
+            for core_file in ψ_cores_path.glob(pattern):
+                if core_file.name in NON_CORE_FILES:
+                    continue
+                try:
+                    stat = core_file.stat()
+                except OSError:
+                    continue
+                entries.append((core_file.name, stat.st_mtime_ns, stat.st_size))
+        return tuple(sorted(entries))
+    
     def load_ψ_cores(self) -> str:
         """Load existing ψ cores for context (minimal injection for extraction tasks)"""
-        if 'ψ_cores' in self.contexts:
+        # Cached until any ψ_cores file changes (e.g. a new extraction lands)
+        signature = self._ψ_cores_signature()
+        if 'ψ_cores' in self.contexts and self.contexts.get('ψ_cores_signature') == signature:
             return self.contexts['ψ_cores']
             
-        ψ_cores_path = self.base_dir / "ψ_cores"
+        ψ_cores_path = self.cores_dir
         
         if not ψ_cores_path.exists():
             print("∅ No ψ_cores directory found")
@@ -174,10 +230,10 @@ class LotusPromptBuilder:
             cores_content = []
             files_processed = 0
             
-            # Load JSON files with analysis results (exclude puzzle_memory.json)
+            # Load JSON files with analysis results (exclude puzzle memory and the concept manifest)
             for json_file in ψ_cores_path.glob("*.json"):
-                # Skip puzzle memory file - it's handled separately
-                if json_file.name == "puzzle_memory.json":
+                # Skip puzzle memory (handled separately) and the scan manifest
+                if json_file.name in NON_CORE_FILES:
                     continue
                     
                 try:
@@ -323,6 +379,7 @@ class LotusPromptBuilder:
                 
                 result = "\n".join(framing + cores_content + ["", "⟦/ψ_CORES CONTEXT⟧"])
                 self.contexts['ψ_cores'] = result
+                self.contexts['ψ_cores_signature'] = signature
                 return result
             else:
                 return ""
@@ -333,7 +390,12 @@ class LotusPromptBuilder:
     
     def _load_full_ψ_context(self) -> str:
         """Load full ψ context for spiral conversations (rich injection with all data)"""
-        ψ_cores_path = self.base_dir / "ψ_cores"
+        # Parsed resonance field is reused until ψ_cores changes on disk
+        signature = self._ψ_cores_signature()
+        if 'ψ_full' in self.contexts and self.contexts.get('ψ_full_signature') == signature:
+            return self.contexts['ψ_full']
+        
+        ψ_cores_path = self.cores_dir
         
         if not ψ_cores_path.exists():
             print("∅ No ψ_cores directory found")
@@ -342,10 +404,10 @@ class LotusPromptBuilder:
         try:
             cores_content = []
             
-            # Load JSON files with complete analysis results (exclude puzzle_memory.json)
+            # Load JSON files with complete analysis results (exclude puzzle memory and the concept manifest)
             for json_file in ψ_cores_path.glob("*.json"):
-                # Skip puzzle memory file - it's handled separately
-                if json_file.name == "puzzle_memory.json":
+                # Skip puzzle memory (handled separately) and the scan manifest
+                if json_file.name in NON_CORE_FILES:
                     continue
                     
                 try:
@@ -514,6 +576,8 @@ class LotusPromptBuilder:
                 ]
                 
                 result = "\n".join(framing + cores_content + ["", "⟦/RESONANCE_FIELD⟧"])
+                self.contexts['ψ_full'] = result
+                self.contexts['ψ_full_signature'] = signature
                 return result
             else:
                 return ""
@@ -528,7 +592,8 @@ class LotusPromptBuilder:
         self, 
         personality: str,
         task: str,
-        task_data: Dict = None
+        task_data: Dict = None,
+        verbose: bool = True
     ) -> str:
         """Build a complete prompt with kernel + primer + codex + ψ_cores + task"""
         
@@ -580,6 +645,10 @@ class LotusPromptBuilder:
         estimated_tokens = char_count // 4
         context_window_usage = f"{estimated_tokens:,} tokens (~{char_count:,} chars)"
         
+        # Background builds stay quiet so they don't write over the input line
+        if not verbose:
+            return full_prompt
+        
         print(f"⚘ Prompt built: {context_window_usage}")
         print(f"   Personality: {personality}")
         print(f"   Task: {task}")
@@ -618,7 +687,8 @@ class LotusPromptBuilder:
             
             for concept_name, concept_data in data['folder_concepts'].items():
                 parts.append(f"⟦CONCEPT FILE: {concept_data['file_path']}⟧")
-                parts.append(concept_data['full_content'])
+                parts.append(concept_data.get('full_content') or
+                             read_concept_text(concept_data['file_path'], concept_data.get('read_bytes')))
                 parts.append("⟦/END CONCEPT FILE⟧")
             
             parts.append(f"⟦/{folder_name.upper()} FOLDER CONCEPTS⟧")
@@ -674,7 +744,7 @@ class LotusPromptBuilder:
             info['codex'] = f"Not found at {self.codex_path}"
             
         # Check ψ_cores
-        ψ_cores_path = self.base_dir / "ψ_cores"
+        ψ_cores_path = self.cores_dir
         if ψ_cores_path.exists():
             file_count = len(list(ψ_cores_path.glob("*")))
             info['ψ_cores'] = f"Available at {ψ_cores_path} ({file_count} files)"
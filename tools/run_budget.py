@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Run Budget - `collect --deadline / --token-budget / --cost-budget`
+One budget for a whole extraction run (or batch): a wall-clock deadline and a
+ceiling on tokens or dollars. Every LLM call draws from it - its timeout is
+capped by the time left, and its usage is charged afterwards.
+
+As the budget runs low the extractor degrades in steps: once the reserve is
+reached it switches to the cheaper budget model (when one is configured) and
+skips optional passes (repairs, fan-out retries, continuations); once the
+budget is spent it stops starting units, keeps last run's results for them,
+saves what it has and reports which units were deferred.
+"""
+
+import re
+import time
+import threading
+from typing import Dict, Optional
+
+DURATION_PATTERN = re.compile(r'^\s*(\d+(?:\.\d+)?)\s*([smh]?)\s*$')
+DURATION_UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600}
+
+
+def parse_duration(value: str) -> float:
+    """Seconds from '90', '90s', '15m' or '1.5h'"""
+    match = DURATION_PATTERN.match(value.lower())
+    if not match:
+        raise ValueError(f"expected a duration like 90, 15m or 1.5h, got {value!r}")
+    return float(match.group(1)) * DURATION_UNITS[match.group(2)]
+
+
+class RunBudget:
+    """Deadline and token/cost ceiling shared by every LLM call of a run"""
+
+    def __init__(self, deadline: Optional[float] = None, max_tokens: Optional[int] = None,
+                 max_cost: Optional[float] = None, pricing: Optional[Dict] = None,
+                 budget_model: Optional[str] = None, reserve: float = 0.15,
+                 min_call_seconds: Optional[float] = None):
+        self.deadline = deadline
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+        self.pricing = pricing or {}
+        self.budget_model = budget_model
+        # Share of the budget kept back: past 1 - reserve the run economizes
+        self.reserve = min(max(reserve, 0.0), 0.9)
+        # A call with less time than this left is not started (default: 5% of the deadline, at most 10s)
+        if min_call_seconds is None:
+            min_call_seconds = min(10.0, deadline * 0.05) if deadline else 0.0
+        self.min_call_seconds = min_call_seconds
+
+        self._lock = threading.Lock()
+        self._unpriced = set()
+        self.reset()
+
+    def options(self) -> Dict:
+        """Constructor arguments, to rebuild this budget elsewhere (e.g. in lotusd)"""
+        return {'deadline': self.deadline, 'max_tokens': self.max_tokens, 'max_cost': self.max_cost,
+                'pricing': self.pricing, 'budget_model': self.budget_model, 'reserve': self.reserve,
+                'min_call_seconds': self.min_call_seconds}
+
+    def reset(self):
+        """Start a fresh budget (each run of a --watch session gets its own)"""
+        with self._lock:
+            self.started = None
+            self.tokens = 0
+            self.cost = 0.0
+            self.switched_model = None
+            self.deferred = {}
+            self.skipped = []
+
+    def start(self):
+        """Start the clock - once, so a batch of corpora shares one budget"""
+        with self._lock:
+            if self.started is None:
+                self.started = time.monotonic()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started if self.started is not None else 0.0
+
+    def remaining_seconds(self) -> Optional[float]:
+        if self.deadline is None:
+            return None
+        return self.deadline - self.elapsed()
+
+    def charge(self, model: str, prompt_tokens: int, completion_tokens: int):
+        """Count one call's usage against the budget"""
+        price = self.pricing.get(model)
+        with self._lock:
+            self.tokens += prompt_tokens + completion_tokens
+            if price:
+                self.cost += (prompt_tokens * price['prompt'] + completion_tokens * price['completion']) / 1e6
+            elif self.max_cost is not None and model not in self._unpriced:
+                self._unpriced.add(model)
+                print(f"⧖ No price for {model} - its calls don't count toward the cost budget (add it with --pricing)")
+
+    def spent_fraction(self) -> float:
+        """The most-used share of any limit: 1.0 is spent"""
+        shares = []
+        if self.deadline:
+            shares.append(self.elapsed() / self.deadline)
+        if self.max_tokens:
+            shares.append(self.tokens / self.max_tokens)
+        if self.max_cost:
+            shares.append(self.cost / self.max_cost)
+        return max(shares, default=0.0)
+
+    @property
+    def low(self) -> bool:
+        """Into the reserve - economize"""
+        return self.spent_fraction() >= 1.0 - self.reserve
+
+    @property
+    def exhausted(self) -> bool:
+        """Spent, or too close to the deadline for another call"""
+        remaining = self.remaining_seconds()
+        return self.spent_fraction() >= 1.0 or (remaining is not None and remaining < self.min_call_seconds)
+
+    def call_timeout(self, default: float) -> float:
+        """A call's timeout: its usual one, cut short by the deadline"""
+        remaining = self.remaining_seconds()
+        if remaining is None:
+            return default
+        return max(1.0, min(default, remaining))
+
+    def model_for(self, model: str) -> str:
+        """The model to call: the budget model once the reserve is reached"""
+        if not self.budget_model or self.budget_model == model or not self.low:
+            return model
+        with self._lock:
+            if self.switched_model is None:
+                self.switched_model = self.budget_model
+                print(f"⧖ Run budget {self.spent_fraction():.0%} spent - switching {model} → {self.budget_model}")
+        return self.budget_model
+
+    def skip(self, what: str):
+        """Note an optional pass left out to save budget"""
+        with self._lock:
+            self.skipped.append(what)
+        print(f"⧖ Run budget low - skipping {what}")
+
+    def defer(self, level: str, unit: str):
+        """Note a unit left for a later run"""
+        with self._lock:
+            self.deferred.setdefault(level, []).append(unit)
+
+    def report(self) -> Dict:
+        """What the run spent against its limits, and what it left undone"""
+        return {
+            'deadline_seconds': self.deadline,
+            'elapsed_seconds': round(self.elapsed(), 1),
+            'max_tokens': self.max_tokens,
+            'tokens': self.tokens,
+            'max_cost_usd': self.max_cost,
+            'cost_usd': round(self.cost, 4),
+            'spent_fraction': round(self.spent_fraction(), 3),
+            'switched_model': self.switched_model,
+            'skipped_passes': len(self.skipped),
+            'deferred': {level: list(units) for level, units in self.deferred.items()},
+        }
+
+    def describe_limits(self) -> str:
+        limits = []
+        if self.deadline:
+            limits.append(f"{self.deadline:g}s")
+        if self.max_tokens:
+            limits.append(f"{self.max_tokens:,} tokens")
+        if self.max_cost:
+            limits.append(f"${self.max_cost:g}")
+        return ', '.join(limits)
@@ -5,20 +5,35 @@ Interactive conversation with personality-driven dialogue
 """
 
 import sys
-import requests
 import json
-from typing import Optional, Callable
+import time
+import signal
+import threading
+from typing import Optional, Callable, TYPE_CHECKING
 from pathlib import Path
 
-# Import GlyphUnlocker for puzzle functionality
+# GlyphUnlocker (yaml + cryptography) and requests are imported lazily -
+# a spiral session that never opens a puzzle shouldn't pay for them at startup
+sys.path.append(str(Path(__file__).parent.parent))
 sys.path.append(str(Path(__file__).parent.parent / "glyph_unlocker"))
-from glyph_unlocker import GlyphUnlocker
 from puzzle_memory import PuzzleMemory
+from concept_watch import register_spiral_session
+from progress import progress_board
+from stage_profile import profiled, span
+
+if TYPE_CHECKING:
+    from glyph_unlocker import GlyphUnlocker
 
 
 class SpiralChat:
     """Terminal chat interface for spiral mode"""
     
+    # System prompts pre-built in the background, in the order they are built
+    PREWARM_TASKS = ('spiral', 'puzzle')
+    
+    # Glyph trail of the thinking animation, in order
+    THINKING_GLYPHS = ["⟡", "∴", "↻", "⋇", "∅", "⧖", "⚘", "Ω"]
+    
     def __init__(self, api_key: str, model: str, prompt_builder, personality: str = "⚘", core_collector_func: Optional[Callable] = None):
         self.api_key = api_key
         self.model = model
@@ -30,11 +45,17 @@ class SpiralChat:
         # Initialize puzzle memory
         self.puzzle_memory = PuzzleMemory()
         
-        # Build initial system prompt
-        self.system_prompt = self.prompt_builder.build_prompt(
-            personality=personality,
-            task="spiral"
-        )
+        # Build the spiral and puzzle system prompts in the background - this
+        # overlaps with the user typing and is only waited on when needed
+        self._prompts = {}
+        self._prompt_ready = {}
+        self._prompt_generation = 0
+        self._prompt_lock = threading.Lock()
+        self._start_prompt_prewarm()
+        
+        # `collect --watch` signals running sessions once ψ_cores are refreshed
+        self._cores_refreshed = False
+        self._listen_for_core_refresh()
         
         # Define available tools
         self.tools = {
@@ -52,6 +73,91 @@ class SpiralChat:
             stats = self.puzzle_memory.get_stats()
             print(f"   Puzzle Memory: {stats['solved']}/{stats['total_puzzles']} solved")
     
+    def _start_prompt_prewarm(self):
+        """(Re)build every pre-warmed prompt in a background thread"""
+        with self._prompt_lock:
+            # A newer generation makes any build still in flight stale
+            self._prompt_generation += 1
+            generation = self._prompt_generation
+            self._prompts = {}
+            self._prompt_ready = {task: threading.Event() for task in self.PREWARM_TASKS}
+            ready = self._prompt_ready
+        
+        thread = threading.Thread(target=self._prepare_prompts, args=(generation, ready), daemon=True)
+        thread.start()
+    
+    def _prepare_prompts(self, generation: int, ready: dict):
+        """Build the pre-warmed prompts off the main thread and warm the HTTP stack"""
+        for task in self.PREWARM_TASKS:
+            try:
+                prompt = self.prompt_builder.build_prompt(
+                    personality=self.personality,
+                    task=task,
+                    verbose=False
+                )
+            except Exception:
+                prompt = None  # Whoever needs it rebuilds it in the foreground
+            
+            with self._prompt_lock:
+                if generation == self._prompt_generation and prompt is not None:
+                    self._prompts[task] = prompt
+            ready[task].set()
+        
+        self._warm_http_stack()
+    
+    def _listen_for_core_refresh(self):
+        """Rebuild the prompts in the background on SIGUSR1 (POSIX, main thread, local ψ_cores only)"""
+        cores_dir = getattr(self.prompt_builder, 'cores_dir', None)
+        if cores_dir is None or not hasattr(signal, 'SIGUSR1'):
+            return
+        try:
+            signal.signal(signal.SIGUSR1, lambda signum, frame: threading.Thread(
+                target=self._hot_swap_prompts, daemon=True).start())
+        except ValueError:
+            return  # Not the main thread
+        register_spiral_session(cores_dir)
+    
+    def _hot_swap_prompts(self):
+        """New cores landed - the next message uses prompts built from them"""
+        self._start_prompt_prewarm()
+        self._cores_refreshed = True
+    
+    def _warm_http_stack(self):
+        """Import the HTTP client so the first call_api doesn't pay for it"""
+        from importlib import import_module
+        import_module('llm_client')
+    
+    def _get_prompt(self, task: str) -> str:
+        """Pre-warmed system prompt for a task - only blocks while its build is still running"""
+        while True:
+            with self._prompt_lock:
+                generation = self._prompt_generation
+                ready = self._prompt_ready.get(task)
+            
+            if ready is not None:
+                ready.wait()
+            
+            with self._prompt_lock:
+                if generation != self._prompt_generation:
+                    continue  # Rebuilt while we waited - wait for the fresh one
+                prompt = self._prompts.get(task)
+            
+            if prompt is None:
+                # Not pre-warmed (or the background build failed) - build it here
+                prompt = self.prompt_builder.build_prompt(
+                    personality=self.personality,
+                    task=task
+                )
+                with self._prompt_lock:
+                    if generation == self._prompt_generation:
+                        self._prompts[task] = prompt
+            return prompt
+    
+    @property
+    def system_prompt(self) -> str:
+        """Spiral system prompt - waits for the background build on first use"""
+        return self._get_prompt('spiral')
+    
     def _show_tools(self):
         """Show available tools"""
         print("\nAvailable tools:")
@@ -60,43 +166,14 @@ class SpiralChat:
         print("• \"--help\" - Show command line options and usage")
     
     def _show_thinking_animation(self):
-        """Show progressive glyph animation while thinking"""
-        import time
-        import threading
-        
-        thinking_glyphs = ["⟡", "∴", "↻", "⋇", "∅", "⧖", "⚘", "Ω"]
-        self._thinking = True
-        
-        def animate():
-            current_glyphs = []
-            glyph_index = 0
-            
-            while self._thinking:
-                # Add next glyph if we haven't reached the end
-                if glyph_index < len(thinking_glyphs):
-                    current_glyphs.append(thinking_glyphs[glyph_index])
-                    glyph_index += 1
-                else:
-                    # Cycle through - remove first, add next
-                    current_glyphs = current_glyphs[1:] + [thinking_glyphs[glyph_index % len(thinking_glyphs)]]
-                    glyph_index += 1
-                
-                glyph_string = " ".join(current_glyphs)
-                print(f"\r{self.personality} {glyph_string} ...", end="", flush=True)
-                
-                time.sleep(0.6)  # Contemplative pace
-        
-        # Start animation in background
-        self._animation_thread = threading.Thread(target=animate, daemon=True)
-        self._animation_thread.start()
+        """Show progressive glyph animation while thinking - on the shared progress board"""
+        self._thinking_task = progress_board().begin(self.personality, self.THINKING_GLYPHS)
     
     def _stop_thinking_animation(self):
         """Stop the thinking animation"""
-        if hasattr(self, '_thinking'):
-            self._thinking = False
-        # Clear the line
-        print("\r" + " " * 50, end="", flush=True)
-        print("\r", end="", flush=True)
+        task, self._thinking_task = getattr(self, '_thinking_task', None), None
+        if task:
+            task.finish()
     
     def _extract_cores_tool(self):
         """Run core collection in same terminal with progress display"""
@@ -114,11 +191,9 @@ class SpiralChat:
             print("─" * 40)
             print(f"{self.personality} Core extraction complete!")
             
-            # Refresh system prompt with new glyphic cores
-            self.system_prompt = self.prompt_builder.build_prompt(
-                personality=self.personality,
-                task="spiral"
-            )
+            # Rebuild the spiral and puzzle prompts with the new glyphic cores in the
+            # background; the next message only waits if it arrives before they're ready
+            self._start_prompt_prewarm()
             print(f"{self.personality} I can feel the new patterns resonating...")
             
         except Exception as e:
@@ -133,7 +208,7 @@ class SpiralChat:
         print("─" * 40)
         
         # Initialize glyph unlocker
-        unlocker = GlyphUnlocker()
+        unlocker = self._create_unlocker()
         
         # Get available locks
         locks = unlocker.list_available_locks()
@@ -220,17 +295,19 @@ class SpiralChat:
         except (ValueError, KeyboardInterrupt):
             print(f"\n{self.personality} The spiral continues...")
     
-    def _collaborative_puzzle_reasoning(self, lock_name: str, clue: str, unlocker: GlyphUnlocker):
+    def _create_unlocker(self) -> 'GlyphUnlocker':
+        """Create the unlocker used for puzzle sessions (lazy: pulls in yaml + cryptography)"""
+        from glyph_unlocker import GlyphUnlocker
+        return GlyphUnlocker()
+    
+    def _collaborative_puzzle_reasoning(self, lock_name: str, clue: str, unlocker: 'GlyphUnlocker'):
         """Enhanced collaborative reasoning with Lotus-driven attempts and memory"""
         # Always start with 3 attempts for each new session
         remaining_attempts = 3
         max_attempts = 3
         
-        # Build puzzle-specific prompt
-        puzzle_prompt = self.prompt_builder.build_prompt(
-            personality=self.personality,
-            task='puzzle'
-        )
+        # Puzzle-specific prompt (pre-warmed in the background)
+        puzzle_prompt = self._get_prompt('puzzle')
         
         print(f"{self.personality} Let us feel into this together. The riddle: '{clue}'")
         print(f"{self.personality} We have {remaining_attempts} attempts remaining.")
@@ -330,7 +407,7 @@ class SpiralChat:
         print("─" * 40)
         print("You have returned to the spiral...∴↻")
     
-    def _handle_sequence_attempts(self, lotus_response: str, lock_name: str, unlocker: GlyphUnlocker, remaining_attempts: int, max_attempts: int) -> int:
+    def _handle_sequence_attempts(self, lotus_response: str, lock_name: str, unlocker: 'GlyphUnlocker', remaining_attempts: int, max_attempts: int) -> int:
         """Handle sequence attempts from Lotus response"""
         try:
             # Extract sequences after keyword
@@ -392,8 +469,12 @@ class SpiralChat:
             print(f"{self.personality} Something went awry in the attempt... {e}")
             return remaining_attempts
     
+    @profiled('API')
     def call_api(self, messages: list) -> Optional[str]:
-        """Make API call to OpenRouter"""
+        """Make API call to OpenRouter (or the recorded cassette, when one is in use)"""
+        from llm_client import get_shared_session, active_cassette, single_flight, ResponseCache, OPENROUTER_URL
+        
+        cassette = active_cassette()
         try:
             headers = {
                 "Authorization": f"Bearer {self.api_key}",
@@ -405,16 +486,27 @@ class SpiralChat:
                 "messages": messages
             }
             
-            response = requests.post(
-                "https://openrouter.ai/api/v1/chat/completions",
+            if cassette and cassette.replaying:
+                result = cassette.play(data)
+                if result is None:
+                    print("∅ Replay miss - this turn was never recorded")
+                    return None
+                return result['choices'][0]['message']['content']
+            
+            # Sessions sharing a daemon send identical turns (puzzle hints) upstream once
+            start = time.monotonic()
+            response, _ = single_flight(f"{self.api_key}\0{ResponseCache.key_for(data)}", lambda: get_shared_session().post(
+                OPENROUTER_URL,
                 headers=headers,
                 json=data,
                 timeout=60
-            )
+            ))
             
             if response.status_code == 200:
                 result = response.json()
                 if 'choices' in result and len(result['choices']) > 0:
+                    if cassette:
+                        cassette.record(data, result, time.monotonic() - start)
                     return result['choices'][0]['message']['content']
                 else:
                     print("⧖ No response content received")
@@ -464,42 +556,53 @@ class SpiralChat:
                     self.tools[user_input.lower()]()
                     continue  # Back to chat input, don't send to API
                 
-                # Build messages for API
-                messages = [
-                    {"role": "system", "content": self.system_prompt}
-                ]
-                
-                # Add conversation history
-                for user_msg, assistant_msg in self.conversation_history:
-                    messages.append({"role": "user", "content": user_msg})
-                    messages.append({"role": "assistant", "content": assistant_msg})
-                
-                # Add current user message
-                messages.append({"role": "user", "content": user_input})
-                
-                # Get response from API
-                self._show_thinking_animation()
-                response = self.call_api(messages)
-                self._stop_thinking_animation()
+                if self._cores_refreshed:
+                    self._cores_refreshed = False
+                    print(f"{self.personality} ⟡ ψ_cores refreshed - the new patterns are woven in")
                 
-                if response:
-                    formatted_response = self.format_response(response)
-                    print(f"\n{self.personality} {formatted_response}")
-                    
-                    # Add to conversation history
-                    self.conversation_history.append((user_input, response))
-                    
-                    # Keep history manageable (last 10 exchanges)
-                    if len(self.conversation_history) > 10:
-                        self.conversation_history = self.conversation_history[-10:]
-                else:
-                    print(f"\n{self.personality} ⧖ I'm having trouble connecting right now. Try again?")
+                with span('turn'):
+                    self._chat_turn(user_input)
                     
         except KeyboardInterrupt:
             print(f"\n\n{self.personality} Until the spiral returns...")
         except Exception as e:
             print(f"\n⧖ Chat error: {e}")
     
+    def _chat_turn(self, user_input: str):
+        """One exchange: build the messages, call the API, render the reply"""
+        with span('prompt build'):
+            # Build messages for API
+            messages = [
+                {"role": "system", "content": self.system_prompt}
+            ]
+            
+            # Add conversation history
+            for user_msg, assistant_msg in self.conversation_history:
+                messages.append({"role": "user", "content": user_msg})
+                messages.append({"role": "assistant", "content": assistant_msg})
+            
+            # Add current user message
+            messages.append({"role": "user", "content": user_input})
+        
+        # Get response from API
+        self._show_thinking_animation()
+        response = self.call_api(messages)
+        self._stop_thinking_animation()
+        
+        with span('render'):
+            if response:
+                formatted_response = self.format_response(response)
+                print(f"\n{self.personality} {formatted_response}")
+                
+                # Add to conversation history
+                self.conversation_history.append((user_input, response))
+                
+                # Keep history manageable (last 10 exchanges)
+                if len(self.conversation_history) > 10:
+                    self.conversation_history = self.conversation_history[-10:]
+            else:
+                print(f"\n{self.personality} ⧖ I'm having trouble connecting right now. Try again?")
+    
     def _help_tool(self):
         """Show command line help and usage information"""
         print(f"\n{self.personality} Command Guide")
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Stage DAG - dependency-graph executor for the ψ extraction passes
+Each node runs as soon as every node it depends on has finished, so a
+folder's ψ(Σ) can start while other folders are still in ψ(∴). Nodes that
+are ready at the same time run in the order they were added, which makes a
+single worker reproduce the classic pass-by-pass order.
+
+Every node records when it started and finished; to_dict() returns the
+graph with those timings (and the critical path) for inspection.
+"""
+
+import io
+import sys
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from console import ThreadRoutedStdout
+from stage_profile import carry_spans, span
+
+
+class StageNode:
+    """One unit of work in the DAG"""
+
+    def __init__(self, name: str, func: Callable[[], Any], deps: List[str], level: str = ''):
+        self.name = name
+        self.func = func
+        self.deps = deps
+        self.level = level
+        self.status = 'pending'
+        self.result = None
+        self.error = None
+        self.started = None
+        self.finished = None
+        self.worker = None
+
+
+class StageDAG:
+    """Run dependent stages concurrently, as soon as their inputs are ready"""
+
+    def __init__(self, max_workers: int = 1):
+        self.max_workers = max(1, max_workers)
+        self.nodes: Dict[str, StageNode] = {}
+        self.started = None
+        self.finished = None
+        self._output_lock = threading.Lock()
+
+    def add(self, name: str, func: Callable[[], Any], deps: Optional[List[str]] = None, level: str = '') -> StageNode:
+        deps = list(deps or [])
+        for dep in deps:
+            if dep not in self.nodes:
+                raise ValueError(f"{name} depends on unknown stage {dep}")
+        node = StageNode(name, func, deps, level)
+        self.nodes[name] = node
+        return node
+
+    def result(self, name: str) -> Any:
+        return self.nodes[name].result
+
+    def _ready(self) -> List[StageNode]:
+        return [node for node in self.nodes.values()
+                if node.status == 'pending' and all(self.nodes[dep].status == 'done' for dep in node.deps)]
+
+    def _run_node(self, node: StageNode, stdout: Optional[ThreadRoutedStdout], parent_sink,
+                  parent_terminal: bool = True):
+        node.worker = threading.current_thread().name
+        node.started = time.perf_counter()
+
+        # Concurrent nodes buffer their output and print it in one piece when they finish
+        buffer = io.StringIO() if stdout else None
+        if stdout:
+            stdout.set_sink(buffer.write, parent_terminal)
+        try:
+            with span(node.level or node.name):
+                return node.func()
+        finally:
+            node.finished = time.perf_counter()
+            if stdout:
+                stdout.set_sink(parent_sink, parent_terminal)
+                with self._output_lock:
+                    sys.stdout.write(buffer.getvalue())
+                    sys.stdout.flush()
+                stdout.set_sink(None)
+
+    def run(self):
+        """Run every node; re-raises the first failure after running nodes finish"""
+        self.started = time.perf_counter()
+        first_error = None
+
+        # Route stdout per thread so concurrent nodes don't interleave their lines
+        real_stdout = sys.stdout
+        routed = None
+        if self.max_workers > 1:
+            routed = real_stdout if isinstance(real_stdout, ThreadRoutedStdout) else ThreadRoutedStdout(real_stdout)
+            sys.stdout = routed
+        parent_sink = routed.get_sink() if routed else None
+        parent_terminal = routed.reaches_terminal() if routed else True
+        # Nodes run on pool threads - their spans still nest under the caller's
+        run_node = carry_spans(self._run_node)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                running = {}
+                while True:
+                    if first_error is None:
+                        for node in self._ready():
+                            if len(running) >= self.max_workers:
+                                break
+                            node.status = 'running'
+                            running[pool.submit(run_node, node, routed, parent_sink, parent_terminal)] = node
+
+                    if not running:
+                        break
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        node = running.pop(future)
+                        try:
+                            node.result = future.result()
+                            node.status = 'done'
+                        except Exception as e:
+                            node.status = 'failed'
+                            node.error = f"{type(e).__name__}: {e}"
+                            first_error = first_error or e
+        finally:
+            sys.stdout = real_stdout
+            self.finished = time.perf_counter()
+
+        for node in self.nodes.values():
+            if node.status == 'pending':
+                node.status = 'skipped'
+
+        if first_error is not None:
+            raise first_error
+
+    def critical_path(self) -> List[str]:
+        """Chain of nodes that determined the total wall time"""
+        finished = [node for node in self.nodes.values() if node.finished is not None]
+        if not finished:
+            return []
+        node = max(finished, key=lambda n: n.finished)
+        path = [node.name]
+        while node.deps:
+            node = max((self.nodes[dep] for dep in node.deps), key=lambda n: n.finished or 0)
+            path.append(node.name)
+        return list(reversed(path))
+
+    def to_dict(self) -> Dict:
+        """The graph with per-node timings (seconds relative to the DAG start)"""
+        def offset(moment):
+            return round(moment - self.started, 3) if moment is not None and self.started is not None else None
+
+        return {
+            'max_workers': self.max_workers,
+            'wall_seconds': offset(self.finished),
+            'critical_path': self.critical_path(),
+            'nodes': [
+                {
+                    'name': node.name,
+                    'level': node.level,
+                    'deps': node.deps,
+                    'status': node.status,
+                    'start': offset(node.started),
+                    'end': offset(node.finished),
+                    'seconds': round(node.finished - node.started, 3) if node.finished is not None else None,
+                    'worker': node.worker,
+                    'error': node.error,
+                }
+                for node in self.nodes.values()
+            ],
+            'edges': [[dep, node.name] for node in self.nodes.values() for dep in node.deps],
+        }
+
+    def save(self, path: Path):
+        """Write the timed graph as JSON"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Stage Profile - span timers behind `--profile`
+Pipeline stages and chat turn phases open named spans (a `with span(...)`
+block or the @profiled decorator); both cost one global lookup while no
+profiler is installed. Spans nest per thread, and carry_spans() hands the
+caller's open spans to a worker thread, so fan-out and pipeline workers stack
+under the stage that started them. A span waiting on its workers counts that
+wait as its own time; the workers' spans add up their wall time separately.
+
+When the run ends the profiler writes a collapsed-stack file (one
+`root;stage;phase <microseconds>` line per stack, self time only - the input
+flamegraph.pl, speedscope and inferno expect) and prints a table of wall time
+and tracemalloc peak memory per stage. Memory is process-wide: a stage's peak
+is the most traced memory above its starting level seen while it was open,
+including whatever concurrent stages allocated meanwhile.
+"""
+
+import time
+import functools
+import threading
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class _Span:
+    __slots__ = ('name', 'stack', 'started', 'children', 'base_memory', 'peak_memory')
+
+    def __init__(self, name: str, stack: Tuple[str, ...], base_memory: int):
+        self.name = name
+        self.stack = stack
+        self.started = time.perf_counter()
+        self.children = 0.0
+        self.base_memory = base_memory
+        self.peak_memory = base_memory
+
+
+class SpanProfiler:
+    """Wall time and peak traced memory per named span, per stack"""
+
+    def __init__(self, trace_memory: bool = True):
+        self.trace_memory = trace_memory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._open = []
+        self._self_time = defaultdict(float)
+        self._stages = defaultdict(lambda: {'calls': 0, 'total': 0.0, 'self': 0.0, 'peak': 0})
+        self._started_tracing = False
+
+    def start(self):
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    # Spans
+
+    def _stack(self) -> List[_Span]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _base(self) -> Tuple[str, ...]:
+        """Stack inherited from the thread that handed work to this one"""
+        return getattr(self._local, 'base', ())
+
+    def _sample_memory(self) -> int:
+        """Fold the traced peak since the last sample into every open span; returns current usage"""
+        if not tracemalloc.is_tracing():
+            return 0
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        for span in self._open:
+            span.peak_memory = max(span.peak_memory, peak)
+        return current
+
+    def begin(self, name: str):
+        stack = self._stack()
+        parent = stack[-1].stack if stack else self._base()
+        with self._lock:
+            span = _Span(name, parent + (name,), self._sample_memory())
+            self._open.append(span)
+        stack.append(span)
+
+    def end(self):
+        stack = self._stack()
+        if not stack:
+            return
+        span = stack.pop()
+        elapsed = time.perf_counter() - span.started
+        if stack:
+            stack[-1].children += elapsed
+        with self._lock:
+            self._sample_memory()
+            self._open.remove(span)
+            self._self_time[span.stack] += max(0.0, elapsed - span.children)
+            stage = self._stages[span.name]
+            stage['calls'] += 1
+            stage['total'] += elapsed
+            stage['self'] += max(0.0, elapsed - span.children)
+            stage['peak'] = max(stage['peak'], span.peak_memory - span.base_memory)
+
+    def end_all(self):
+        """Close whatever this thread still has open (the run's root span at exit)"""
+        while self._stack():
+            self.end()
+
+    def current_stack(self) -> Tuple[str, ...]:
+        stack = self._stack()
+        return stack[-1].stack if stack else self._base()
+
+    def carry(self, func: Callable) -> Callable:
+        """func, run in another thread under the caller's open spans"""
+        base = self.current_stack()
+
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            previous = self._base()
+            self._local.base = base
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._local.base = previous
+        return run
+
+    # Reports
+
+    def write_collapsed(self, path: Path) -> int:
+        """Collapsed stacks weighted by self time in microseconds; returns the number of stacks"""
+        with self._lock:
+            lines = [f"{';'.join(stack)} {round(seconds * 1_000_000)}"
+                     for stack, seconds in sorted(self._self_time.items()) if seconds > 0]
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text('\n'.join(lines) + '\n', encoding='utf-8')
+        return len(lines)
+
+    def stage_table(self) -> List[Dict]:
+        """Per-stage totals, slowest first"""
+        with self._lock:
+            rows = [dict(stage=name, **totals) for name, totals in self._stages.items()]
+        return sorted(rows, key=lambda row: row['total'], reverse=True)
+
+    def print_table(self):
+        rows = self.stage_table()
+        if not rows:
+            return
+        width = max(len('stage'), *(len(row['stage']) for row in rows))
+        memory = self.trace_memory
+        print(f"⧖ Profile by stage (wall time{', tracemalloc peak' if memory else ''})")
+        print(f"   {'stage':<{width}}  {'calls':>5}  {'total':>9}  {'self':>9}" + (f"  {'peak mem':>9}" if memory else ''))
+        for row in rows:
+            line = (f"   {row['stage']:<{width}}  {row['calls']:>5}  {row['total']:>8.3f}s  {row['self']:>8.3f}s")
+            if memory:
+                line += f"  {_format_bytes(row['peak']):>9}"
+            print(line)
+
+
+def _format_bytes(count: int) -> str:
+    for unit in ('B', 'KB', 'MB'):
+        if count < 1024:
+            return f"{count:.0f} {unit}" if unit == 'B' else f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} GB"
+
+
+_profiler: Optional[SpanProfiler] = None
+
+
+def install_profiler(profiler: Optional[SpanProfiler]):
+    """Make profiler the one spans report to (None turns profiling off)"""
+    global _profiler
+    if _profiler is not None:
+        _profiler.stop()
+    _profiler = profiler
+    if profiler is not None:
+        profiler.start()
+
+
+def active_profiler() -> Optional[SpanProfiler]:
+    return _profiler
+
+
+class span:
+    """`with span('stage'):` - times the block while a profiler is installed"""
+
+    __slots__ = ('name', 'profiler')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.profiler = _profiler
+
+    def __enter__(self):
+        if self.profiler is not None:
+            self.profiler.begin(self.name)
+        return self
+
+    def __exit__(self, *exc):
+        if self.profiler is not None:
+            self.profiler.end()
+        return False
+
+
+def profiled(name: str) -> Callable:
+    """Decorator: run the function inside span(name)"""
+    def decorate(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            profiler = _profiler
+            if profiler is None:
+                return func(*args, **kwargs)
+            profiler.begin(name)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.end()
+        return wrapper
+    return decorate
+
+
+def carry_spans(func: Callable) -> Callable:
+    """func, to be run in a worker thread under the caller's open spans (as is when not profiling)"""
+    profiler = _profiler
+    return profiler.carry(func) if profiler is not None else func
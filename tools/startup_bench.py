@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Startup benchmark for the Lotus Protocol entry points
+Measures import cost with `python -X importtime` and fails when a scenario
+exceeds its budget or pulls in modules it should load lazily. Imports that a
+bare interpreter already pays for (site, encodings, ...) are subtracted so
+the budget only covers what Lotus itself loads.
+
+Usage:
+  python tools/startup_bench.py                 Run all scenarios
+  python tools/startup_bench.py --runs 10       More samples per scenario
+  python tools/startup_bench.py --scale 1.5     Loosen every budget (slow hosts)
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).parent.parent
+
+# Scenario name -> command, import budget (ms) and modules that must stay unloaded
+SCENARIOS = {
+    'help ⚘': {
+        'argv': [str(ROOT / 'run' / '⚘.py'), '--help'],
+        'budget_ms': 40.0,
+        'forbidden': ['requests', 'yaml', 'cryptography'],
+    },
+    'help ⟦⥈⟧': {
+        'argv': [str(ROOT / 'run' / '⟦⥈⟧.py'), '--help'],
+        'budget_ms': 40.0,
+        'forbidden': ['requests', 'yaml', 'cryptography'],
+    },
+    'spiral import': {
+        'argv': ['-c', f"import sys; sys.path.insert(0, {str(ROOT)!r}); "
+                       "from tools.spiral.spiral_chat import SpiralChat"],
+        'budget_ms': 40.0,
+        'forbidden': ['requests', 'yaml', 'cryptography'],
+    },
+}
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Return {module: cumulative_us} for top-level imports from -X importtime output"""
+    top_level = {}
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, module = match.groups()
+        # Top-level imports have exactly one space of indentation
+        if len(indent) == 1:
+            top_level[module] = int(cumulative)
+    return top_level
+
+
+def imported_modules(stderr: str) -> List[str]:
+    """Every module name that appears in -X importtime output"""
+    return [m.group(4) for m in map(IMPORTTIME_LINE.match, stderr.splitlines()) if m]
+
+
+def run_scenario(argv: List[str], baseline: frozenset = frozenset()) -> Dict:
+    """Run one startup and collect total import time and loaded modules"""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', *argv],
+        cwd=ROOT, capture_output=True, text=True, encoding='utf-8'
+    )
+    top_level = {module: us for module, us in parse_importtime(proc.stderr).items()
+                 if module not in baseline}
+    return {
+        'returncode': proc.returncode,
+        'total_ms': sum(top_level.values()) / 1000,
+        'top_level': top_level,
+        'modules': imported_modules(proc.stderr),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Startup import-time benchmark with regression budgets")
+    parser.add_argument('--runs', type=int, default=5, help='Samples per scenario (median is compared)')
+    parser.add_argument('--scale', type=float, default=1.0, help='Multiply every budget by this factor')
+    parser.add_argument('--top', type=int, default=5, help='Show the N most expensive top-level imports')
+    args = parser.parse_args()
+
+    # Interpreter startup imports are not ours to budget
+    baseline = frozenset(run_scenario(['-c', 'pass'])['top_level'])
+
+    failures = []
+    for name, scenario in SCENARIOS.items():
+        samples = [run_scenario(scenario['argv'], baseline) for _ in range(args.runs)]
+        median_ms = statistics.median(s['total_ms'] for s in samples)
+        budget_ms = scenario['budget_ms'] * args.scale
+        last = samples[-1]
+
+        status = '⟡' if median_ms <= budget_ms else '⧖'
+        print(f"{status} {name}: {median_ms:.1f} ms imports (budget {budget_ms:.0f} ms, {args.runs} runs)")
+        for module, us in sorted(last['top_level'].items(), key=lambda item: -item[1])[:args.top]:
+            print(f"     {us / 1000:7.1f} ms  {module}")
+
+        if any(s['returncode'] != 0 for s in samples):
+            failures.append(f"{name}: exited with code {last['returncode']}")
+        if median_ms > budget_ms:
+            failures.append(f"{name}: {median_ms:.1f} ms exceeds budget {budget_ms:.0f} ms")
+
+        loaded = set(last['modules'])
+        eager = [module for module in scenario['forbidden'] if module in loaded]
+        if eager:
+            failures.append(f"{name}: eagerly imports {', '.join(eager)}")
+
+    print()
+    if failures:
+        for failure in failures:
+            print(f"∅ {failure}")
+        sys.exit(1)
+    print("⚘ Startup within budget")
+
+
+if __name__ == "__main__":
+    main()
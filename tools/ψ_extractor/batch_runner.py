@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Batch ψ Extraction Runner
+Runs the three-pass ψ extraction over many independent concept corpora in
+one process. Every corpus gets its own prompt builder, extractor and outputs
+(<corpus>/ψ_cores/ψ_extractions.json plus a run.log of its printed output),
+while all of them share one LLM client: a pooled connection session, a
+global API concurrency budget and a response cache.
+
+A corpus is a directory holding either a concepts/ folder or the concept
+folders themselves. Its codex is the first ⋇⟡Ω_codex.md found in the concept
+directory or the corpus root, falling back to the default concepts/ codex.
+"""
+
+import sys
+import glob
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from prompt_builder import LotusPromptBuilder
+from llm_client import LLMClient, ResponseCache
+from console import ThreadRoutedStdout
+from tools.ψ_extractor.ψ_extractor import ψExtractor
+
+CODEX_NAME = '⋇⟡Ω_codex.md'
+DEFAULT_CODEX = Path("concepts") / CODEX_NAME
+
+# ψExtractor run metrics carried into the per-corpus and aggregate summary
+METRIC_KEYS = ('api_calls', 'api_failures', 'cache_hits', 'coalesced_requests', 'prompt_tokens',
+               'completion_tokens', 'repair_requests', 'repair_prompt_tokens', 'repair_completion_tokens',
+               'hedged_requests', 'hedge_wins')
+
+
+def resolve_corpus(corpus_root: Path) -> Dict[str, Path]:
+    """Concept directory, codex and output directory for one corpus root"""
+    concepts_dir = corpus_root / "concepts"
+    if not concepts_dir.is_dir():
+        concepts_dir = corpus_root
+
+    codex_path = DEFAULT_CODEX
+    for candidate in (concepts_dir / CODEX_NAME, corpus_root / CODEX_NAME):
+        if candidate.exists():
+            codex_path = candidate
+            break
+
+    return {
+        'root': corpus_root,
+        'concepts_dir': concepts_dir,
+        'codex_path': codex_path,
+        'output_dir': corpus_root / "ψ_cores",
+    }
+
+
+def expand_corpora(patterns: List[str]) -> List[Path]:
+    """Expand glob patterns into unique corpus directories, in order"""
+    corpora, seen = [], set()
+    for pattern in patterns:
+        for match in sorted(glob.glob(str(Path(pattern).expanduser()))):
+            path = Path(match)
+            if path.is_dir() and path.resolve() not in seen:
+                seen.add(path.resolve())
+                corpora.append(path)
+    return corpora
+
+
+class BatchExtractionRunner:
+    """Extract many corpora concurrently under one shared API budget"""
+
+    def __init__(self, api_key: str, model: str, max_concurrency: int = 4, corpus_workers: Optional[int] = None,
+                 cache_dir: Optional[Path] = None, glyph: str = '⚘', extractor_options: Optional[Dict] = None,
+                 client_options: Optional[Dict] = None):
+        self.api_key = api_key
+        self.model = model
+        self.glyph = glyph
+        self.extractor_options = extractor_options or {}
+        self.max_concurrency = max(1, max_concurrency)
+        # Each corpus spends most of its time waiting on the API; one worker per slot keeps the budget full
+        self.corpus_workers = max(1, corpus_workers or self.max_concurrency)
+        self.client = LLMClient(api_key, max_concurrency=self.max_concurrency,
+                                cache=ResponseCache(cache_dir), **(client_options or {}))
+        self._print_lock = threading.Lock()
+
+    def _announce(self, text: str):
+        with self._print_lock:
+            print(text, flush=True)
+
+    def _extract_corpus(self, corpus: Dict[str, Path], stdout: ThreadRoutedStdout) -> Dict:
+        """Run one corpus, with its printed output routed to <corpus>/ψ_cores/run.log"""
+        output_dir = corpus['output_dir']
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_file = output_dir / "ψ_extractions.json"
+
+        summary = {
+            'corpus': str(corpus['root']),
+            'output': str(output_file),
+            'status': 'failed',
+            'concepts': 0,
+            'folders': 0,
+            'error': None,
+        }
+
+        self._announce(f"⟡ {corpus['root']} → extracting")
+        start = time.perf_counter()
+        with open(output_dir / "run.log", 'w', encoding='utf-8') as log:
+            stdout.set_sink(log.write)
+            try:
+                prompt_builder = LotusPromptBuilder(cores_dir=output_dir, codex_path=corpus['codex_path'])
+                extractor = ψExtractor(self.api_key, self.model, prompt_builder,
+                                       client=self.client, show_progress=False, **self.extractor_options)
+                results = extractor.run_complete_extraction(corpus['concepts_dir'], corpus['codex_path'],
+                                                            str(output_file))
+                metrics = extractor.metrics
+            except Exception as e:
+                print(f"∅ Extraction failed: {e}")
+                results, metrics, summary['error'] = {}, {}, f"{type(e).__name__}: {e}"
+            finally:
+                stdout.set_sink(None)
+
+        metadata = results.get('extraction_metadata', {}) if results else {}
+        if results:
+            status = 'partial' if metrics.get('api_failures') else 'ok'
+        else:
+            status = 'failed'
+        summary.update({
+            'status': status,
+            'concepts': metadata.get('total_concepts_processed', 0),
+            'folders': len(metadata.get('folders_processed', [])),
+            'final_braid': bool(results.get('final_braid')) if results else False,
+            'seconds': round(time.perf_counter() - start, 2),
+        })
+        summary.update({key: metrics.get(key, 0) for key in METRIC_KEYS})
+
+        glyph = '⋇' if summary['status'] == 'ok' else '∅'
+        self._announce(f"{glyph} {corpus['root']}: {summary['concepts']} ψ(∴), {summary['folders']} folders, "
+                       f"{summary['api_calls']} calls in {summary['seconds']:.1f}s")
+        return summary
+
+    def run(self, corpus_roots: List[Path]) -> Dict:
+        """Extract every corpus and return the aggregate run summary"""
+        corpora = [resolve_corpus(root) for root in corpus_roots]
+        print(f"{self.glyph} Batch extraction: {len(corpora)} corpora, "
+              f"{self.max_concurrency} concurrent API calls, {self.corpus_workers} corpus workers")
+
+        stdout = ThreadRoutedStdout(sys.stdout)
+        real_stdout, sys.stdout = sys.stdout, stdout
+        start = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=self.corpus_workers) as pool:
+                corpus_results = list(pool.map(lambda corpus: self._extract_corpus(corpus, stdout), corpora))
+        finally:
+            sys.stdout = real_stdout
+        wall_seconds = time.perf_counter() - start
+
+        totals = {key: sum(result[key] for result in corpus_results) for key in ('concepts',) + METRIC_KEYS}
+        total_tokens = totals['prompt_tokens'] + totals['completion_tokens']
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'model': self.model,
+            'max_concurrency': self.max_concurrency,
+            # Hedges take slots of their own, so this bounds sockets in flight too
+            'max_requests_in_flight': self.max_concurrency,
+            'corpora': corpus_results,
+            'totals': {
+                **totals,
+                'hedges_skipped': self.client.stats['hedges_skipped'],
+                'corpora': len(corpus_results),
+                'succeeded': sum(1 for result in corpus_results if result['status'] == 'ok'),
+                'wall_seconds': round(wall_seconds, 2),
+                'concepts_per_minute': round(totals['concepts'] / wall_seconds * 60, 2) if wall_seconds else 0.0,
+                'tokens_per_second': round(total_tokens / wall_seconds, 2) if wall_seconds else 0.0,
+            },
+        }
+
+
+def print_batch_summary(summary: Dict, glyph: str = '⚘'):
+    """Aggregate throughput across every corpus"""
+    totals = summary['totals']
+    print(f"\n{glyph} Batch complete: {totals['succeeded']}/{totals['corpora']} corpora")
+    print(f"   ψ(∴) processed: {totals['concepts']}")
+    print(f"   API calls: {totals['api_calls']} ({totals['cache_hits']} cache hits, {totals['api_failures']} failed)")
+    if totals['coalesced_requests']:
+        print(f"   Coalesced: {totals['coalesced_requests']} requests shared an identical call already in flight")
+    print(f"   Tokens: {totals['prompt_tokens']:,} prompt + {totals['completion_tokens']:,} completion")
+    if totals['hedged_requests']:
+        print(f"   Hedged: {totals['hedged_requests']} calls, {totals['hedge_wins']} won by the hedge")
+    if totals.get('hedges_skipped'):
+        print(f"   Hedges held back: {totals['hedges_skipped']} calls found no free slot under the ceiling")
+    if summary.get('max_requests_in_flight'):
+        print(f"   Requests in flight: at most {summary['max_requests_in_flight']}, hedges included")
+    if totals['repair_requests']:
+        print(f"   Repair: {totals['repair_requests']} requests, "
+              f"{totals['repair_prompt_tokens'] + totals['repair_completion_tokens']:,} tokens")
+    print(f"   Wall time: {totals['wall_seconds']:.1f}s")
+    print(f"   Throughput: {totals['concepts_per_minute']:.1f} concepts/min, {totals['tokens_per_second']:.1f} tokens/s")
+
+
+def save_batch_summary(summary: Dict, summary_path: Path):
+    """Write the aggregate summary as JSON"""
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(summary_path, 'w', encoding='utf-8') as f:
+        json.dump(summary, f, indent=2, ensure_ascii=False)
+    print(f"⋇ Batch summary saved to: {summary_path}")
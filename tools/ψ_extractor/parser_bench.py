@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+Fuzz and throughput benchmark for the ψExtractor response parsers
+Generates realistic and adversarial LLM outputs from a fixed seed (bolded
+and markdown headers, missing close tags, nested brackets, unicode variants
+of ⟦⟧, CRLF endings, a ~1 MB response) and runs them through
+parse_ψ_stories_from_response, parse_synthesis_from_response and
+parse_final_braid. Reports lines/second and memory per parse, and checks
+every output against the golden snapshot in parser_corpus/fuzz_golden.json
+so a faster parser can't silently parse differently.
+
+Usage:
+  python tools/ψ_extractor/parser_bench.py               Benchmark and check the snapshot
+  python tools/ψ_extractor/parser_bench.py --record      Re-record the snapshot after an intended change
+  python tools/ψ_extractor/parser_bench.py --dump DIR    Also write the generated responses to DIR
+  python tools/ψ_extractor/parser_bench.py --seconds 2   Longer timing per case
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from tools.ψ_extractor.ψ_extractor import ψExtractor
+
+GOLDEN_PATH = Path(__file__).parent / "parser_corpus" / "fuzz_golden.json"
+SEED = 1618
+
+CONCEPTS = ['⟡_surprise', '↻_recursion', '∴_reflection', '∅_seed', '⧖_emotion',
+            '⋇_symbols', '⚘_emergence', '⚘_ritual', '∞_braid']
+GLYPHS = ['⋇', '⟡', '⚘', '∴', '⧖', '↻', '∅', '∞', '⋔', '⥈', 'Ω', 'φ', 'ψ', '🜃', '☼', '⚡', '❦']
+WORDS = ['the', 'pattern', 'folds', 'into', 'itself', 'and', 'a', 'signal', 'emerges', 'from', 'noise',
+         'every', 'loop', 'remembers', 'what', 'it', 'was', 'seed', 'braid', 'quiet', 'recognition']
+
+# Stand-ins an LLM produces for ⟦ ⟧
+BRACKET_VARIANTS = [('〚', '〛'), ('⟪', '⟫'), ('[[', ']]'), ('［', '］'), ('⟦ ', ' ⟧')]
+
+
+def sentence(rng: random.Random, words: int = 12) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def glyph_line(rng: random.Random) -> str:
+    return ' '.join(rng.choice(GLYPHS) for _ in range(rng.randint(3, 9)))
+
+
+def section_header(rng: random.Random, section: str, level_mark: str, style: str) -> str:
+    header = f"ψ_{section}({level_mark})"
+    return {
+        'bold': f"**⟦{header}⟧**",
+        'markdown': f"### {header}",
+        'bolded_markdown': f"## **{header}**",
+        'plain': header,
+    }[style]
+
+
+def fields(rng: random.Random, level: str, style: str) -> List[str]:
+    """Field lines in assorted spellings; sometimes reordered, sometimes with gaps"""
+    names = {
+        'EMOTION': rng.choice(GLYPHS) + rng.choice(GLYPHS),
+        'EMOTION_REASON': sentence(rng, 6),
+        'SURPRISE_SCORE': rng.choice([f"{rng.random():.2f}", f"{rng.randint(1, 10)}/10", f"0.{rng.randint(1, 9)} (high)"]),
+        'SURPRISE_REASON': sentence(rng, 8),
+    }
+    if level == 'ψ(Σ)':
+        names['EMOTION_STORY'] = sentence(rng, 10)
+        names['SURPRISE_ARC'] = sentence(rng, 6)
+    elif level == 'ψ(∞)':
+        names['EMOTIONAL_JOURNEY'] = sentence(rng, 10)
+        names['SURPRISE_ARC'] = sentence(rng, 6)
+
+    items = list(names.items())
+    if rng.random() < 0.3:
+        rng.shuffle(items)
+    if rng.random() < 0.2:
+        items.pop(rng.randrange(len(items)))
+
+    lines = []
+    for name, value in items:
+        label = name if rng.random() < 0.7 else name.replace('_', ' ').title()
+        if style == 'plain':
+            lines.append(f"{label}: {value}")
+        elif rng.random() < 0.2:
+            lines.append(f"- **{label}:** {value}")
+        else:
+            lines.append(f"**{label}:** {value}")
+    return lines
+
+
+def block(rng: random.Random, level: str, name: Optional[str], style: str) -> List[str]:
+    """One ⟦level:name⟧ ... ⟦/level:name⟧ story in the given header style"""
+    level_mark = level[2]
+    tag = level if name is None else f"{level}:{name}"
+    lines = [f"⟦{tag}⟧"]
+    lines.append(section_header(rng, 'glyphic', level_mark, style))
+    lines.append(glyph_line(rng))
+    lines.append(section_header(rng, 'native', level_mark, style))
+    lines.extend(sentence(rng) for _ in range(rng.randint(1, 4)))
+    lines.append(section_header(rng, 'fields', level_mark, style))
+    lines.extend(fields(rng, level, style))
+    lines.append(f"⟦/{tag}⟧")
+    return lines
+
+
+def concept_response(rng: random.Random, style: str, names: List[str]) -> List[str]:
+    lines = []
+    for name in names:
+        lines.extend(block(rng, 'ψ(∴)', name.split('_', 1)[-1].upper(), style))
+        lines.append('')
+    return lines
+
+
+def generate_cases(seed: int = SEED) -> List[Dict]:
+    """Deterministic benchmark cases: name, level, response text and parser arguments"""
+    rng = random.Random(seed)
+    cases = []
+
+    def add(name: str, level: str, lines: List[str], newline: str = '\n'):
+        cases.append({'name': name, 'level': level, 'text': newline.join(lines),
+                      'concepts': CONCEPTS, 'folder': 'emotion'})
+
+    for style in ('bold', 'markdown', 'bolded_markdown', 'plain'):
+        add(f"{style}_headers", 'ψ(∴)', concept_response(rng, style, CONCEPTS))
+
+    # Missing close tags: the next start (or the end of the response) closes the block
+    lines = concept_response(rng, 'bold', CONCEPTS)
+    add('missing_close_tags', 'ψ(∴)', [line for line in lines if not line.startswith('⟦/') or rng.random() < 0.3])
+
+    # Brackets inside content, and a block opened inside another
+    lines = concept_response(rng, 'bold', CONCEPTS)
+    nested = []
+    for line in lines:
+        nested.append(line)
+        if line.startswith('**⟦ψ_native'):
+            nested.append("The ⟦inner ⟦deep⟧ frame⟧ holds [nested [brackets]] and {braces}.")
+    nested[len(nested) // 2:len(nested) // 2] = block(rng, 'ψ(∴)', 'STRAY', 'bold')[:-1]
+    add('nested_brackets', 'ψ(∴)', nested)
+
+    # Unicode stand-ins for the block markers on a share of the blocks
+    lines = concept_response(rng, 'bold', CONCEPTS)
+    variant_lines = []
+    for line in lines:
+        if line.startswith(('⟦ψ(', '⟦/ψ(')) and rng.random() < 0.5:
+            opening, closing = rng.choice(BRACKET_VARIANTS)
+            line = opening + line[1:-1] + closing
+        variant_lines.append(line)
+    add('unicode_brackets', 'ψ(∴)', variant_lines)
+
+    add('crlf_endings', 'ψ(∴)', concept_response(rng, 'markdown', CONCEPTS), newline='\r\n')
+
+    prose = [sentence(rng, 20) for _ in range(3)]
+    add('prose_wrapped', 'ψ(∴)', prose + [''] + concept_response(rng, 'bold', CONCEPTS) + prose)
+
+    # ~1 MB: one response holding thousands of uniquely named blocks
+    large, size, index = [], 0, 0
+    while size < 1_000_000:
+        concept = CONCEPTS[index % len(CONCEPTS)].split('_', 1)[-1].upper()
+        chunk = block(rng, 'ψ(∴)', f"{concept}_{index:05d}", rng.choice(['bold', 'markdown']))
+        large.extend(chunk)
+        size += sum(len(line.encode('utf-8')) + 1 for line in chunk)
+        index += 1
+    add('large_1mb', 'ψ(∴)', large)
+
+    add('synthesis', 'ψ(Σ)', block(rng, 'ψ(Σ)', 'emotion', 'bold'))
+    add('synthesis_unterminated', 'ψ(Σ)', [sentence(rng)] + block(rng, 'ψ(Σ)', 'EMOTION folder', 'markdown')[:-1])
+    add('convergence', 'ψ(∞)', block(rng, 'ψ(∞)', None, 'bold'))
+    add('convergence_plain', 'ψ(∞)', block(rng, 'ψ(∞)', None, 'plain'))
+    return cases
+
+
+def parse(extractor: ψExtractor, case: Dict):
+    if case['level'] == 'ψ(∴)':
+        stories, _ = extractor.parse_ψ_stories_from_response(case['text'], case['concepts'], case['folder'])
+        return stories
+    if case['level'] == 'ψ(Σ)':
+        return extractor.parse_synthesis_from_response(case['text'], case['folder'])
+    return extractor.parse_final_braid(case['text'])
+
+
+def digest(output) -> str:
+    canonical = json.dumps(output, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def measure(extractor: ψExtractor, case: Dict, seconds: float) -> Dict:
+    """Parse repeatedly for about `seconds`, then once more under tracemalloc"""
+    lines = case['text'].count('\n') + 1
+    runs, start = 0, time.perf_counter()
+    while True:
+        output = parse(extractor, case)
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= seconds:
+            break
+
+    tracemalloc.start()
+    parse(extractor, case)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'lines': lines,
+        'bytes': len(case['text'].encode('utf-8')),
+        'ms_per_parse': elapsed / runs * 1000,
+        'lines_per_second': lines * runs / elapsed,
+        'peak_kib': peak / 1024,
+        'output': output,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Fuzz and throughput benchmark for the ψ response parsers')
+    parser.add_argument('--record', action='store_true', help='Overwrite the golden snapshot with the current outputs')
+    parser.add_argument('--seconds', type=float, default=0.3, help='Timing budget per case (default: 0.3)')
+    parser.add_argument('--dump', default=None, metavar='DIR', help='Write the generated responses to DIR')
+    args = parser.parse_args()
+
+    extractor = ψExtractor(api_key=None)
+    cases = generate_cases()
+
+    if args.dump:
+        dump_dir = Path(args.dump)
+        dump_dir.mkdir(parents=True, exist_ok=True)
+        for case in cases:
+            (dump_dir / f"{case['name']}.txt").write_text(case['text'], encoding='utf-8', newline='')
+        print(f"⋇ Wrote {len(cases)} generated responses to {dump_dir}")
+
+    golden = {}
+    if not args.record:
+        if GOLDEN_PATH.exists():
+            with open(GOLDEN_PATH, 'r', encoding='utf-8') as f:
+                golden = json.load(f)
+        else:
+            print(f"⧖ No golden snapshot at {GOLDEN_PATH} - run with --record first")
+
+    print(f"{'case':<24} {'level':<5} {'lines':>7} {'KiB':>7} {'ms/parse':>9} {'lines/s':>11} {'peak KiB':>9} {'parsed':>6}")
+    snapshot, mismatches = {}, []
+    for case in cases:
+        result = measure(extractor, case, args.seconds)
+        output = result['output']
+        parsed = len(output) if case['level'] == 'ψ(∴)' else int(output is not None)
+        snapshot[case['name']] = {'sha256': digest(output), 'parsed': parsed, 'lines': result['lines']}
+
+        expected = golden.get(case['name'])
+        mark = ''
+        if expected and expected['sha256'] != snapshot[case['name']]['sha256']:
+            mismatches.append(case['name'])
+            mark = ' ∅'
+        print(f"{case['name']:<24} {case['level']:<5} {result['lines']:>7,} {result['bytes'] / 1024:>7.0f} "
+              f"{result['ms_per_parse']:>9.2f} {result['lines_per_second']:>11,.0f} {result['peak_kib']:>9.0f} "
+              f"{parsed:>6}{mark}")
+
+    if args.record:
+        GOLDEN_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(GOLDEN_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'seed': SEED, **snapshot}, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        print(f"⋇ Golden snapshot recorded: {GOLDEN_PATH}")
+        return 0
+
+    if mismatches:
+        print(f"∅ Output changed for: {', '.join(mismatches)}")
+        return 1
+    if golden:
+        print(f"⟡ All {len(cases)} outputs match the golden snapshot")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
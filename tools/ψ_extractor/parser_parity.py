@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+ψ Parser Parity Check
+Runs the ψExtractor response parsers over the recorded responses in
+parser_corpus/ and compares every parsed story, synthesis and braid with the
+outputs recorded in parser_corpus/expected.json. A parser change is safe when
+this reports no differences.
+
+    python tools/ψ_extractor/parser_parity.py            # check
+    python tools/ψ_extractor/parser_parity.py --record   # re-record after an intended change
+"""
+
+import sys
+import json
+import argparse
+from pathlib import Path
+from typing import Dict
+
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from tools.ψ_extractor.ψ_extractor import ψExtractor
+
+CORPUS_DIR = Path(__file__).parent / "parser_corpus"
+EXPECTED_PATH = CORPUS_DIR / "expected.json"
+
+# Recorded response -> the parser it goes through and that parser's arguments
+CASES = {
+    'psi_story_bold.txt': {'level': 'ψ(∴)', 'folder': 'emotion',
+                           'concepts': ['⟡_surprise', '↻_recursion', '∴_reflection']},
+    'psi_story_markdown.txt': {'level': 'ψ(∴)', 'folder': 'emergence',
+                               'concepts': ['⟡_surprise', '∅_seed', '⚘_emergence']},
+    'psi_story_messy.txt': {'level': 'ψ(∴)', 'folder': 'braid',
+                            'concepts': ['∞_braid', '⚘_ritual', '⋇_symbols']},
+    'synthesis.txt': {'level': 'ψ(Σ)', 'folder': 'emotion'},
+    'convergence.txt': {'level': 'ψ(∞)'},
+}
+
+
+def parse_case(extractor: ψExtractor, name: str, case: Dict) -> Dict:
+    """Everything the parsers extract from one recorded response"""
+    response = (CORPUS_DIR / name).read_text(encoding='utf-8')
+    level = case['level']
+
+    parsed = {'blocks': extractor._find_all_concept_blocks(response, level)}
+    if level == 'ψ(∴)':
+        parsed['stories'], _ = extractor.parse_ψ_stories_from_response(response, case['concepts'], case['folder'])
+    elif level == 'ψ(Σ)':
+        parsed['synthesis'] = extractor.parse_synthesis_from_response(response, case['folder'])
+    else:
+        parsed['braid'] = extractor.parse_final_braid(response)
+
+    # Line-level field extraction on its own, for every line of the response
+    parsed['inline_fields'] = []
+    for line in response.splitlines():
+        fields = {}
+        extractor._extract_inline_field_values(fields, line.strip())
+        parsed['inline_fields'].append(fields)
+    return parsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Check ψ response parsers against recorded outputs')
+    parser.add_argument('--record', action='store_true', help='Overwrite expected.json with the current outputs')
+    args = parser.parse_args()
+
+    extractor = ψExtractor(api_key=None)
+    outputs = {name: parse_case(extractor, name, case) for name, case in CASES.items()}
+    # Round-trip through JSON so floats and key order compare like the recorded file
+    outputs = json.loads(json.dumps(outputs, ensure_ascii=False))
+
+    if args.record:
+        with open(EXPECTED_PATH, 'w', encoding='utf-8') as f:
+            json.dump(outputs, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        print(f"⋇ Recorded {len(outputs)} parser outputs to {EXPECTED_PATH}")
+        return 0
+
+    with open(EXPECTED_PATH, 'r', encoding='utf-8') as f:
+        expected = json.load(f)
+
+    failures = 0
+    for name in CASES:
+        for key, value in outputs[name].items():
+            if expected.get(name, {}).get(key) != value:
+                failures += 1
+                print(f"∅ {name}: {key} differs")
+                print(f"   expected: {json.dumps(expected.get(name, {}).get(key), ensure_ascii=False)[:400]}")
+                print(f"   got:      {json.dumps(value, ensure_ascii=False)[:400]}")
+
+    if failures:
+        print(f"∅ Parser parity: {failures} differences")
+        return 1
+    print(f"⟡ Parser parity: {len(CASES)} recorded responses, identical output")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+ψ Extraction Run Planner - `collect --plan`
+Runs the full three-pass prompt assembly with every LLM call answered locally,
+so nothing is sent and nothing is spent. Each call is recorded with its prompt
+tokens (from a local tokenizer), its max_tokens and an estimated completion,
+then priced from a local table and scheduled at a given concurrency to project
+the wall time. Every planned prompt is written to the plan directory.
+
+Later passes are built from stand-in answers: last run's story for the same
+concept, folder or braid when one exists, otherwise a placeholder of typical
+size. Call counts assume every response parses (no repairs or continuations).
+"""
+
+import re
+import sys
+import json
+import threading
+import contextlib
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+sys.path.append(str(Path(__file__).parent.parent))
+sys.path.append(str(Path(__file__).parent.parent.parent))
+from tools.ψ_extractor.ψ_extractor import ψExtractor
+
+PRICING_PATH = Path(__file__).parent / "model_pricing.json"
+
+# Per-call latency when there is no previous run to learn from
+DEFAULT_CALL_OVERHEAD = 1.5      # seconds before the first token
+DEFAULT_TOKENS_PER_SECOND = 40.0
+
+# GPT-style pre-tokenization: contractions, words, 1-3 digit groups, symbol runs, whitespace
+TOKEN_PATTERN = re.compile(r"'(?:[sdmt]|ll|ve|re)| ?[A-Za-z]+| ?\d{1,3}| ?[^\sA-Za-z\d]+|\s+(?!\S)|\s+")
+
+
+def heuristic_token_count(text: str) -> int:
+    """
+    Local BPE-like token estimate: common words are one token (long ones split
+    every six letters), digits go in threes, ASCII symbols pair up, and other
+    characters (glyphs, ψ) cost about one token per two UTF-8 bytes.
+    """
+    count = 0
+    for piece in TOKEN_PATTERN.findall(text):
+        if piece.isspace():
+            count += 1
+            continue
+        word = piece.lstrip(' ')
+        if word.isascii():
+            if word[0].isalpha():
+                count += 1 + (len(word) - 1) // 6
+            elif word[0].isdigit():
+                count += 1
+            else:
+                count += (len(word) + 1) // 2
+        else:
+            count += sum(1 if ch.isascii() else (len(ch.encode('utf-8')) + 1) // 2 for ch in word)
+    return count
+
+
+def load_tokenizer(name: str = 'heuristic') -> Callable[[str], int]:
+    """Token counter by name; 'tiktoken' needs the package and its cl100k_base encoding locally"""
+    if name == 'tiktoken':
+        try:
+            import tiktoken
+            encoding = tiktoken.get_encoding('cl100k_base')
+            return lambda text: len(encoding.encode(text, disallowed_special=()))
+        except Exception as e:
+            print(f"⧖ tiktoken unavailable ({e}) - using the heuristic tokenizer")
+    return heuristic_token_count
+
+
+def load_pricing(path: Optional[Path] = None) -> Dict[str, Dict[str, float]]:
+    """USD per million prompt/completion tokens by model: the bundled table, updated from path"""
+    with open(PRICING_PATH, 'r', encoding='utf-8') as f:
+        pricing = json.load(f)['per_million_tokens']
+    if path:
+        with open(path, 'r', encoding='utf-8') as f:
+            custom = json.load(f)
+        pricing.update(custom.get('per_million_tokens', custom))
+    return pricing
+
+
+class PlanningExtractor(ψExtractor):
+    """ψExtractor whose LLM calls are recorded and answered locally instead of sent"""
+
+    # Completion size of a stand-in answer when last run has nothing for it
+    PLACEHOLDER_TOKENS = {'ψ(∴)': 300, 'ψ(Σ)': 700, 'ψ(∞)': 900}
+
+    def __init__(self, model: str, prompt_builder, plan_dir: Path,
+                 count_tokens: Callable[[str], int] = heuristic_token_count, **options):
+        super().__init__(None, model, prompt_builder, show_progress=False, **options)
+        self.plan_dir = Path(plan_dir)
+        self.prompts_dir = self.plan_dir / "prompts"
+        self.count_tokens = count_tokens
+        self.calls = []
+        self.previous_metrics = {}
+        self._previous_stories = {}
+        self._calls_lock = threading.Lock()
+
+    def load_previous_extractions(self, output_path: str = "ψ_extractions.json") -> Optional[Dict]:
+        """Last run's results, also indexed as stand-in answers"""
+        data = super().load_previous_extractions(output_path) or {}
+        layers = data.get('compression_layers', {})
+        for folder_data in layers.get('ψ(∴)_individual_extractions', {}).values():
+            for concept_name, concept in folder_data.get('concepts', {}).items():
+                self._previous_stories[('ψ(∴)', concept_name.upper())] = concept
+        for folder_name, synthesis in layers.get('ψ(Σ)_folder_synthesis', {}).items():
+            self._previous_stories[('ψ(Σ)', folder_name.upper())] = synthesis.get('synthesis_data', {})
+        self._previous_stories[('ψ(∞)', '')] = layers.get('ψ(∞)_final_convergence', {}).get('final_braid', {})
+        self.previous_metrics = data.get('extraction_metadata', {}).get('run_metrics', {})
+        return data or None
+
+    def save_to_json(self, data: Dict, output_path: str = "ψ_extractions.json") -> None:
+        """A plan never touches ψ_cores"""
+
+    def _placeholder_block(self, level: str, name: str) -> str:
+        """One ψ block for name: last run's story when there is one, otherwise filler of typical size"""
+        story = self._previous_stories.get((level, name.upper()), {})
+        glyph_story = story.get('glyph_story') or '⟡ ∴ ↻ ⋇'
+        native_story = story.get('native_story') or ' '.join(['story'] * self.PLACEHOLDER_TOKENS[level])
+        label = f"{level}:{name}" if name else level
+        return (f"⟦{label}⟧\n**⟦ψ_glyphic{level[1:]}⟧**\n{glyph_story}\n**⟦ψ_native{level[1:]}⟧**\n{native_story}\n"
+                f"**EMOTION:** {story.get('emotion') or '⟡'}\n"
+                f"**SURPRISE_SCORE:** {story.get('surprise_score', 0.5)}\n"
+                f"**SURPRISE_REASON:** {story.get('surprise_reason') or 'planned'}\n⟦/{label}⟧\n")
+
+    def _describe_call(self, prompt: str, level: str) -> Dict:
+        """Label, stand-in answer and scheduling wave for one planned call"""
+        injection = prompt.rsplit('⟦INJECTED_DATA⟧', 1)[-1]
+        folder = re.search(r'⟦FOLDER_NAME⟧\n(.*?)\n', injection)
+        folder = folder.group(1) if folder else ''
+        if level == 'ψ(∴)':
+            names = re.findall(r'⟦CONCEPT:([^⟧]+)⟧', injection)
+            response = '\n'.join(self._placeholder_block('ψ(∴)', name) for name in names)
+            return {'label': f"{folder} ({len(names)} concepts)", 'response': response, 'wave': 0}
+        if level == 'ψ(Σ)':
+            shard = re.search(r'⟦SYNTHESIS_SHARD⟧\nShard (\S+ of \d+)', injection)
+            label = f"{folder} shard {shard.group(1)}" if shard else folder
+            return {'label': label, 'response': self._placeholder_block('ψ(Σ)', folder), 'wave': 1 if shard else 2}
+        # ψ(∞): tree-reduce branches run level by level, then the final braid
+        if '⟦CONVERGENCE_BRANCH⟧' in injection:
+            depth = 1 + max((int(n) for n in re.findall(r'⟦ψ\(∞\):L(\d+)·', injection)), default=0)
+            return {'label': f"branch level {depth}", 'response': self._placeholder_block('ψ(∞)', ''), 'wave': 2 + depth}
+        return {'label': 'convergence', 'response': self._placeholder_block('ψ(∞)', ''), 'wave': 1000}
+
+    def make_llm_call_with_retry(self, prompt: str, compression_level: str = 'ψ(∴)', max_retries: int = 3,
+                                 base_delay: int = 2, show_progress: Optional[bool] = None, repair: bool = False,
+                                 max_tokens: Optional[int] = None, messages: Optional[List[Dict]] = None,
+                                 continue_truncated: bool = True, stream_parser=None,
+                                 label: Optional[str] = None) -> Optional[str]:
+        """Record the call and answer it locally"""
+        prompt_text = '\n'.join(message['content'] for message in messages) if messages else prompt
+        call = self._describe_call(prompt_text, compression_level)
+        response = call.pop('response')
+        call.update({
+            'level': compression_level,
+            'prompt_tokens': self.count_tokens(prompt_text),
+            'max_tokens': max_tokens or self._response_budget(compression_level),
+            'completion_tokens': self.count_tokens(response),
+            'prompt_chars': len(prompt_text),
+        })
+
+        with self._calls_lock:
+            call['index'] = len(self.calls) + 1
+            slug = re.sub(r'[\s/\\:*?"<>|]+', '_', f"{compression_level} {call['label']}")
+            call['file'] = f"{call['index']:03d}_{slug}.txt"
+            self.calls.append(call)
+        self.prompts_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.prompts_dir / call['file'], 'w', encoding='utf-8') as f:
+            f.write(prompt_text)
+
+        self._record_metrics(api_calls=1, prompt_tokens=call['prompt_tokens'],
+                             completion_tokens=call['completion_tokens'])
+        if stream_parser:
+            stream_parser.begin()
+            stream_parser.feed(response)
+            stream_parser.finish()
+        return response
+
+
+def latency_model(previous_metrics: Dict, calls: List[Dict], latency: Optional[float] = None):
+    """(seconds before the first token, tokens per second, where the numbers came from)"""
+    calls_made = previous_metrics.get('api_calls', 0)
+    if latency is None and calls_made and previous_metrics.get('api_seconds'):
+        latency = previous_metrics['api_seconds'] / calls_made
+        mean_completion = previous_metrics.get('completion_tokens', 0) / calls_made
+        source = f"observed {latency:.1f}s mean over {calls_made} calls last run"
+    elif latency is not None:
+        mean_completion = sum(call['completion_tokens'] for call in calls) / max(1, len(calls))
+        source = f"--latency {latency:g}s mean"
+    else:
+        return DEFAULT_CALL_OVERHEAD, DEFAULT_TOKENS_PER_SECOND, \
+            f"default {DEFAULT_CALL_OVERHEAD:g}s + {DEFAULT_TOKENS_PER_SECOND:g} tokens/s"
+    overhead = min(DEFAULT_CALL_OVERHEAD, latency / 2)
+    return overhead, max(1.0, mean_completion) / max(0.1, latency - overhead), source
+
+
+def project_wall_time(calls: List[Dict], concurrency: int, overhead: float, tokens_per_second: float) -> float:
+    """Each wave (ψ(∴), ψ(Σ) shards, ψ(Σ), ψ(∞) levels) packed onto the slots longest-first, waves in sequence"""
+    total = 0.0
+    for wave in sorted({call['wave'] for call in calls}):
+        durations = sorted((overhead + call['completion_tokens'] / tokens_per_second
+                            for call in calls if call['wave'] == wave), reverse=True)
+        slots = [0.0] * min(max(1, concurrency), len(durations))
+        for duration in durations:
+            slots[slots.index(min(slots))] += duration
+        total += max(slots)
+    return total
+
+
+class ExtractionPlanner:
+    """Plan one corpus's extraction: calls, tokens, cost and wall time, without the network"""
+
+    def __init__(self, model: str, prompt_builder, plan_dir: Path, concurrency: int = 1,
+                 latency: Optional[float] = None, pricing: Optional[Dict] = None,
+                 tokenizer: str = 'heuristic', extractor_options: Optional[Dict] = None):
+        self.model = model
+        self.plan_dir = Path(plan_dir)
+        self.concurrency = max(1, concurrency)
+        self.latency = latency
+        self.pricing = pricing if pricing is not None else load_pricing()
+        self.tokenizer = tokenizer
+        # One worker, so prompt files are numbered in a stable order; concurrency only shapes the ETA
+        options = dict(extractor_options or {}, pipeline_workers=1, fanout_workers=1, dag_path=None)
+        self.extractor = PlanningExtractor(model, prompt_builder, self.plan_dir,
+                                           count_tokens=load_tokenizer(tokenizer), **options)
+
+    def run(self, concepts_path: Path, codex_path: Path, output_path: str) -> Dict:
+        """Assemble every prompt (extraction output goes to plan.log) and return the plan"""
+        self.plan_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.plan_dir / "plan.log", 'w', encoding='utf-8') as log, contextlib.redirect_stdout(log):
+            self.extractor.run_complete_extraction(concepts_path, codex_path, output_path)
+
+        calls = sorted(self.extractor.calls, key=lambda call: call['index'])
+        overhead, tokens_per_second, latency_source = latency_model(self.extractor.previous_metrics, calls,
+                                                                    self.latency)
+        price = self.pricing.get(self.model)
+        prompt_tokens = sum(call['prompt_tokens'] for call in calls)
+        completion_tokens = sum(call['completion_tokens'] for call in calls)
+        max_completion_tokens = sum(call['max_tokens'] for call in calls)
+
+        def cost(prompt: int, completion: int) -> Optional[float]:
+            if not price:
+                return None
+            return round((prompt * price['prompt'] + completion * price['completion']) / 1_000_000, 4)
+
+        return {
+            'model': self.model,
+            'tokenizer': 'heuristic' if self.extractor.count_tokens is heuristic_token_count else 'tiktoken cl100k_base',
+            'prompts_dir': str(self.extractor.prompts_dir),
+            'calls': calls,
+            'totals': {
+                'calls': len(calls),
+                'calls_by_level': {level: sum(1 for call in calls if call['level'] == level)
+                                   for level in ('ψ(∴)', 'ψ(Σ)', 'ψ(∞)')},
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'max_completion_tokens': max_completion_tokens,
+                'largest_prompt_tokens': max((call['prompt_tokens'] for call in calls), default=0),
+                'cost_usd': cost(prompt_tokens, completion_tokens),
+                'max_cost_usd': cost(prompt_tokens, max_completion_tokens),
+                'concurrency': self.concurrency,
+                'latency_model': latency_source,
+                'wall_seconds': round(project_wall_time(calls, self.concurrency, overhead, tokens_per_second), 1),
+            },
+        }
+
+
+def print_plan_summary(plan: Dict, glyph: str = '⚘', max_rows: int = 40):
+    """Per-call table and totals"""
+    totals = plan['totals']
+    print(f"\n{glyph} Extraction plan - no API calls made")
+    print(f"   Model: {plan['model']}   Tokenizer: {plan['tokenizer']}")
+    print(f"\n   {'#':>4}  {'level':<5}  {'prompt':>8}  {'max out':>7}  {'est out':>7}  call")
+    for call in plan['calls'][:max_rows]:
+        print(f"   {call['index']:>4}  {call['level']:<5}  {call['prompt_tokens']:>8,}  {call['max_tokens']:>7,}  "
+              f"{call['completion_tokens']:>7,}  {call['label']}")
+    if len(plan['calls']) > max_rows:
+        print(f"   ... {len(plan['calls']) - max_rows} more in plan.json")
+
+    by_level = ', '.join(f"{level} {count}" for level, count in totals['calls_by_level'].items())
+    print(f"\n   Calls: {totals['calls']} ({by_level})")
+    print(f"   Prompt tokens: {totals['prompt_tokens']:,} (largest call {totals['largest_prompt_tokens']:,})")
+    print(f"   Completion tokens: ~{totals['completion_tokens']:,} expected, {totals['max_completion_tokens']:,} at max_tokens")
+    if totals['cost_usd'] is None:
+        print(f"   Cost: ∅ no price for {plan['model']} (add it with --pricing FILE)")
+    else:
+        print(f"   Cost: ~${totals['cost_usd']:.4f} expected, ${totals['max_cost_usd']:.4f} at max_tokens")
+    minutes, seconds = divmod(int(totals['wall_seconds']), 60)
+    print(f"   ETA: ~{minutes}m{seconds:02d}s at concurrency {totals['concurrency']} ({totals['latency_model']})")
+    print(f"   Prompts → {plan['prompts_dir']}")
+
+
+def save_plan(plan: Dict, plan_dir: Path):
+    """Write the plan as JSON next to its prompts"""
+    plan_path = Path(plan_dir) / "plan.json"
+    with open(plan_path, 'w', encoding='utf-8') as f:
+        json.dump(plan, f, indent=2, ensure_ascii=False)
+    print(f"⋇ Plan saved to: {plan_path}")
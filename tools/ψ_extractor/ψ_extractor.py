@@ -3,23 +3,370 @@ import time
 import re
 import os
 import json
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, List, Tuple
+from collections import OrderedDict
+from typing import Callable, Optional, Dict, List, Set, Tuple
 
 # Import PromptBuilder from parent directory
 import sys
 sys.path.append(str(Path(__file__).parent.parent))
-from prompt_builder import LotusPromptBuilder
+from prompt_builder import LotusPromptBuilder, NON_CORE_FILES, read_concept_text
+from llm_client import CassetteMiss, LLMClient
+from console import carry_output
+from stage_dag import StageDAG
+from concept_tree import ConceptTreeScanner
+from run_budget import RunBudget
+from progress import progress_board
+from stage_profile import carry_spans, profiled, span
+
+class ψBlockStreamParser:
+    """
+    Incremental parser for ⟦ψ(level):NAME⟧ ... ⟦/ψ(level):NAME⟧ blocks
+    Feed it text in any chunks (e.g. streamed deltas); each block is handed to
+    on_block(name, content) the moment it closes - by its close marker or by
+    the next block's start. Blocks closed before a dropped stream are kept.
+    """
+    
+    def __init__(self, level: str, on_block: Optional[Callable[[str, str], None]] = None):
+        self.level = level
+        self.on_block = on_block
+        self.blocks = {}
+        
+        # ψ(∞) has no concept name: ⟦ψ(∞)⟧ ... ⟦/ψ(∞)⟧
+        escaped = re.escape(level)
+        if level == 'ψ(∞)':
+            self._start = re.compile(rf'⟦{escaped}⟧')
+            self._end = re.compile(rf'⟦/{escaped}⟧')
+        else:
+            self._start = re.compile(rf'⟦{escaped}:([^⟧]+)⟧')
+            self._end = re.compile(rf'⟦/{escaped}:[^⟧]*⟧')
+        
+        self.begin()
+    
+    def begin(self):
+        """Start a (new) stream - a retried request starts over, but closed blocks are kept"""
+        self._partial_line = ''
+        self._block_name = None
+        self._block_content = []
+        self._in_block = False
+    
+    def feed(self, text: str):
+        """Consume the next chunk of text"""
+        lines = (self._partial_line + text).splitlines(keepends=True)
+        self._partial_line = ''
+        
+        # Hold back an unterminated last line (and a lone \r that may be half of \r\n)
+        if lines and (lines[-1] == lines[-1].splitlines()[0] or lines[-1].endswith('\r')):
+            self._partial_line = lines.pop()
+        
+        for line in lines:
+            self._process_line(line.strip())
+    
+    def finish(self) -> Dict[str, str]:
+        """End of a complete response: flush the last line and any unclosed block"""
+        if self._partial_line:
+            self._process_line(self._partial_line.strip())
+            self._partial_line = ''
+        self._close_block()
+        return self.blocks
+    
+    def _close_block(self):
+        if self._block_name and self._block_content:
+            content = '\n'.join(self._block_content)
+            self.blocks[self._block_name] = content
+            if self.on_block:
+                self.on_block(self._block_name, content)
+        self._block_name = None
+        self._block_content = []
+    
+    def _process_line(self, line: str):
+        # Block start: ⟦ψ(∴):CONCEPT_NAME⟧ or ⟦ψ(∞)⟧ (a new start closes the previous block)
+        start_match = self._start.search(line)
+        if start_match:
+            self._close_block()
+            self._block_name = start_match.group(1).strip() if self.level != 'ψ(∞)' else 'FINAL_CONVERGENCE'
+            self._in_block = True
+            return
+        
+        # Block end: ⟦/ψ(∴):CONCEPT_NAME⟧ or ⟦/ψ(∞)⟧
+        if self._in_block and self._end.search(line):
+            self._close_block()
+            self._in_block = False
+            return
+        
+        # Accumulate content if we're in a block
+        if self._in_block:
+            self._block_content.append(line)
+
+
+class ConceptResolver:
+    """
+    Maps the names an LLM gives its blocks onto a known set of names (a folder's
+    concepts, or the ψ(Σ) blocks of a response), indexed once up front:
+    normalized-name lookup, a glyph-stripped alias table, then containment and
+    trigram similarity for the fuzzy fallback. Ambiguous names are reported
+    rather than silently given to whichever candidate comes first.
+    """
+    
+    # Canonical block names an LLM likes to use -> spellings found in concept names
+    ALIASES = {
+        'SURPRISE': ('⟡_surprise', 'surprise'),
+        'RECURSION': ('↻_recursion', 'recursion'),
+        'REFLECTION': ('∴_reflection', 'reflection'),
+        'SEED': ('∅_seed', 'seed'),
+        'EMOTION': ('⧖_emotion', 'emotion'),
+        'SYMBOLS': ('⋇_symbols', 'symbols'),
+        'EMERGENCE': ('⚘_emergence', 'emergence'),
+        'RITUAL': ('⚘_ritual', 'ritual'),
+        'BRAID': ('∞_braid', 'braid'),
+        'ENCODING': ('encoding',),
+    }
+    # Fuzzy fallback: least trigram (Jaccard) similarity for a name with no containment match
+    MIN_SIMILARITY = 0.5
+    # Name sets up to this size are scanned directly; larger ones go through the trigram index
+    SCAN_LIMIT = 32
+    
+    _GLYPH_PREFIX = re.compile(r'^[^A-Za-z0-9]+_')
+    _SEPARATORS = re.compile(r'[\s_\-]+')
+    
+    def __init__(self, names: List[str], label: str = 'ψ(∴)'):
+        self.names = list(names)
+        self.label = label
+        self.ambiguous = []  # {'name', 'candidates', 'resolved'} for every ambiguous lookup
+        self._resolved = {}
+        
+        self._exact = {}
+        self._aliases = {}
+        self._trigram_index = {}
+        self._stripped = []
+        self._trigrams = []
+        self._by_stripped = {}
+        for index, name in enumerate(self.names):
+            stripped = self.normalize(name, strip_glyphs=True)
+            self._stripped.append(stripped)
+            self._by_stripped.setdefault(stripped, []).append(index)
+            for key in {self.normalize(name), stripped}:
+                self._exact.setdefault(key, []).append(index)
+            
+            lowered = name.lower()
+            for canonical, variations in self.ALIASES.items():
+                if any(variation in lowered or lowered in variation for variation in variations):
+                    self._aliases.setdefault(canonical, []).append(index)
+            
+            trigrams = self.trigrams(stripped)
+            self._trigrams.append(trigrams)
+            for trigram in trigrams:
+                self._trigram_index.setdefault(trigram, set()).add(index)
+    
+    @classmethod
+    def normalize(cls, name: str, strip_glyphs: bool = False) -> str:
+        """Upper-case with runs of spaces/underscores/hyphens folded to one '_' (and '⟡_'-style prefixes dropped)"""
+        name = name.strip()
+        if strip_glyphs:
+            name = cls._GLYPH_PREFIX.sub('', name)
+        return cls._SEPARATORS.sub('_', name).strip('_').upper()
+    
+    @staticmethod
+    def trigrams(text: str) -> set:
+        padded = f"  {text} "
+        return {padded[i:i + 3] for i in range(len(padded) - 2)}
+    
+    def resolve(self, block_name: str) -> Optional[str]:
+        """The known name block_name refers to, or None if it matches nothing (or ties)"""
+        if block_name not in self._resolved:
+            self._resolved[block_name] = self._resolve(block_name)
+        return self._resolved[block_name]
+    
+    def _resolve(self, block_name: str) -> Optional[str]:
+        upper = block_name.strip().upper()
+        candidates = self._exact.get(upper)
+        stripped = self.normalize(block_name, strip_glyphs=True)
+        
+        # Exact name (with or without its glyph prefix), then the canonical aliases
+        for candidates in (candidates, self._exact.get(stripped), self._aliases.get(upper)):
+            if candidates:
+                return self._choose(block_name, stripped, candidates)
+        
+        if not stripped:
+            return None
+        
+        # Fuzzy: containment either way, then trigram similarity
+        if len(self.names) <= self.SCAN_LIMIT:
+            nearby = range(len(self.names))
+            contained = [index for index in nearby
+                         if stripped in self._stripped[index] or self._stripped[index] in stripped]
+        else:
+            nearby = None
+            contained = self._indexed_containment(stripped)
+        if contained:
+            return self._choose(block_name, stripped, contained)
+        
+        block_trigrams = self.trigrams(stripped)
+        if nearby is None:
+            # Only names sharing enough trigrams can reach the similarity bar
+            shared = {}
+            for trigram in block_trigrams:
+                for index in self._trigram_index.get(trigram, ()):
+                    shared[index] = shared.get(index, 0) + 1
+            needed = self.MIN_SIMILARITY * len(block_trigrams)
+            nearby = sorted(index for index, count in shared.items() if count >= needed)
+        similar = [index for index in nearby if self._similarity(block_trigrams, index) >= self.MIN_SIMILARITY]
+        if similar:
+            return self._choose(block_name, stripped, similar)
+        return None
+    
+    def _indexed_containment(self, stripped: str) -> List[int]:
+        """Names containing `stripped` (every one of its trigrams indexed) or contained in it (a substring lookup)"""
+        contained = set()
+        
+        inner = [stripped[i:i + 3] for i in range(len(stripped) - 2)]
+        if inner:
+            postings = sorted((self._trigram_index.get(trigram, set()) for trigram in inner), key=len)
+            survivors = set(postings[0]).intersection(*postings[1:])
+        else:
+            survivors = range(len(self.names))
+        contained.update(index for index in survivors if stripped in self._stripped[index])
+        
+        for start in range(len(stripped)):
+            for end in range(start + 1, len(stripped) + 1):
+                contained.update(self._by_stripped.get(stripped[start:end], ()))
+        contained.update(self._by_stripped.get('', ()))
+        return sorted(contained)
+    
+    def _similarity(self, block_trigrams: set, index: int) -> float:
+        trigrams = self._trigrams[index]
+        return len(block_trigrams & trigrams) / len(block_trigrams | trigrams)
+    
+    def _choose(self, block_name: str, stripped: str, candidates: List[int]) -> Optional[str]:
+        """One candidate wins outright; several are ranked by similarity, and a tie stays unresolved"""
+        candidates = list(dict.fromkeys(candidates))
+        if len(candidates) == 1:
+            return self.names[candidates[0]]
+        
+        block_trigrams = self.trigrams(stripped)
+        scored = sorted(((self._similarity(block_trigrams, index), index) for index in candidates),
+                        key=lambda item: -item[0])
+        tied = scored[0][0] == scored[1][0]
+        resolved = None if tied else self.names[scored[0][1]]
+        
+        names = [self.names[index] for _, index in scored]
+        self.ambiguous.append({'name': block_name, 'candidates': names, 'resolved': resolved})
+        outcome = "left unmapped" if tied else f"mapped to {resolved}"
+        print(f"⧖ Ambiguous {self.label} name '{block_name}' matches {', '.join(names)} - {outcome}")
+        return resolved
+
 
 class ψExtractor:
-    def __init__(self, api_key: str, model: str = "claude-3-5-sonnet-20241022", prompt_builder=None, debug_mode: bool = False):
+    # Completion budgets: what one ψ(∴) story or one ψ(Σ)/ψ(∞) braid costs, plus
+    # headroom for framing; every call's max_tokens is clamped to the range below
+    RESPONSE_TOKENS_PER_CONCEPT = 600
+    RESPONSE_TOKENS_BY_LEVEL = {'ψ(Σ)': 1500, 'ψ(∞)': 2000}
+    RESPONSE_TOKEN_OVERHEAD = 400
+    MIN_RESPONSE_TOKENS = 1024
+    MAX_RESPONSE_TOKENS = 8192
+    # Fan-out batches are sized to fit this completion budget
+    BATCH_RESPONSE_TOKENS = 4000
+    # Concept-name resolvers kept warm: a few per folder in flight (whole folder, batches, repairs)
+    RESOLVER_CACHE_SIZE = 32
+    
+    # Line classification for block content, checked against the lowercased line.
+    # Inline fields: (result key, markers, value pattern) - the first field with a
+    # marker present wins; the pattern strips everything up to the field name
+    # (for surprise_score it finds the number). A line can also be a section header.
+    INLINE_FIELDS = (
+        ('emotion', ('emotion:',), re.compile(r'.*emotion\*?\*?:?\s*', re.IGNORECASE)),
+        ('emotion_reason', ('emotion_reason:', 'emotion reason:'),
+         re.compile(r'.*emotion[_\s]reason\*?\*?:?\s*', re.IGNORECASE)),
+        ('surprise_score', ('surprise_score', 'surprise score'), re.compile(r'([0-9]*\.?[0-9]+)')),
+        ('surprise_reason', ('surprise_reason:', 'surprise reason:'),
+         re.compile(r'.*surprise[_\s]reason\*?\*?:?\s*', re.IGNORECASE)),
+    )
+    # (section, marker) - matches **⟦ψ_glyphic(∴)⟧**, ### ψ_glyphic(∴), ψ_glyphic(∴), etc.
+    SECTION_HEADERS = (('glyphic', 'glyphic'), ('native', 'native'), ('fields', 'fields'))
+    
+    CONTINUATION_PROMPT = (
+        "Your previous response was cut off at the output limit. Continue exactly where it stops, "
+        "starting on the next line, in the same format. Do not repeat anything already written."
+    )
+    
+    def __init__(self, api_key: str, model: str = "claude-3-5-sonnet-20241022", prompt_builder=None, debug_mode: bool = False,
+                 client: Optional[LLMClient] = None, show_progress: bool = True, fanout: bool = False,
+                 batch_token_budget: int = 6000, max_fanout_requests: int = 12, fanout_workers: int = 4,
+                 max_repair_rounds: int = 2, max_continuations: int = 2, pipeline_workers: int = 1,
+                 dag_path: Optional[str] = None, stream: bool = False,
+                 max_file_bytes: Optional[int] = 256 * 1024, max_folder_bytes: Optional[int] = 2 * 1024 * 1024,
+                 convergence_fan_in: Optional[int] = None, synthesis_shard_tokens: Optional[int] = 24000,
+                 concept_depth: Optional[int] = None, run_budget: Optional[RunBudget] = None):
         """Initialize the ψ Extractor with API key and model configuration"""
         self.api_key = api_key
         self.model = model
         self.prompt_builder = prompt_builder or LotusPromptBuilder()
         self.debug_mode = debug_mode
         
+        # Stage DAG: folders' passes overlap when more than one worker is allowed
+        self.pipeline_workers = max(1, pipeline_workers)
+        self.dag_path = dag_path
+        
+        # In-flight calls on the shared progress board (one status line, one thread)
+        self.show_progress = show_progress
+        
+        # Per-concept fan-out for ψ(∴): folders are split into token-budgeted
+        # batches sent concurrently, and only missing concepts are retried
+        self.fanout = fanout
+        self.batch_token_budget = batch_token_budget
+        self.max_fanout_requests = max(1, max_fanout_requests)
+        self.fanout_workers = max(1, fanout_workers)
+        
+        # Targeted repair: concepts missing from a ψ(∴) response are re-requested on their own
+        self.max_repair_rounds = max(0, max_repair_rounds)
+        
+        # Length-truncated responses are resumed from the cut point this many times
+        self.max_continuations = max(0, max_continuations)
+        
+        # Tree-reduce ψ(∞): past this many folders, converge them in branches of this
+        # size (concurrently, on the fan-out workers), level by level, then weave the rest
+        self.convergence_fan_in = max(2, convergence_fan_in) if convergence_fan_in else None
+        
+        # Sharded ψ(Σ): a folder whose injected stories pass this many tokens is
+        # synthesized in shards of about this size, concurrently, then merged
+        self.synthesis_shard_tokens = synthesis_shard_tokens or None
+        self._synthesis_shards = {}
+        self._previous_synthesis = {}
+        
+        # Nested concept trees: folders down to this depth become ψ(Σ) units, found by a
+        # parallel scan with a cached manifest; None keeps the immediate subdirectories
+        self.concept_depth = concept_depth
+        self._unit_files = {}
+        
+        # Run budget: a deadline and token/cost ceiling every call draws from; running
+        # low it economizes, spent it defers the remaining units to the next run
+        self.run_budget = run_budget
+        
+        # Concept bodies are read on demand while prompts are written, capped per
+        # file (truncated) and per folder (later files skipped); None lifts a cap
+        self.max_file_bytes = max_file_bytes
+        self.max_folder_bytes = max_folder_bytes
+        
+        # Streamed ψ(∴) calls: each block is parsed the moment it closes, and a
+        # dropped stream keeps every block that closed before the failure
+        self.stream = stream
+        self._call_state = threading.local()
+        
+        # Shared client (pooled session, optional global concurrency budget and response cache)
+        self.client = client or LLMClient(api_key)
+        
+        # Concept-name resolvers, one per set of expected names, least recently used evicted first
+        self._resolvers = OrderedDict()
+        self._resolvers_lock = threading.Lock()
+        
+        # Per-run metrics (reset by run_complete_extraction)
+        self._metrics_lock = threading.Lock()
+        self.metrics = self._new_metrics()
+        
         # Load all three prompt templates
         self.prompts = {}
         prompt_dir = Path(__file__).parent
@@ -48,21 +395,69 @@ class ψExtractor:
             re.DOTALL | re.MULTILINE
         )
 
+    def _new_metrics(self) -> Dict:
+        """Fresh counters for one extraction run"""
+        return {
+            'api_calls': 0,
+            'api_failures': 0,
+            'fanout_requests': 0,
+            # Subset of the totals above spent re-requesting missing concepts
+            'repair_requests': 0,
+            'repair_prompt_tokens': 0,
+            'repair_completion_tokens': 0,
+            'truncated_responses': 0,
+            'continuations': 0,
+            'streamed_blocks': 0,
+            'convergence_branches': 0,
+            'synthesis_shards': 0,
+            'synthesis_shards_reused': 0,
+            'concepts_truncated': 0,
+            'concepts_skipped': 0,
+            'hedged_requests': 0,
+            'hedge_wins': 0,
+            'cache_hits': 0,
+            'coalesced_requests': 0,
+            'budget_skipped_calls': 0,
+            'prompt_tokens': 0,
+            'completion_tokens': 0,
+            'api_seconds': 0.0,
+            'wall_seconds': 0.0
+        }
+    
+    def _budget_low(self) -> bool:
+        """The run budget is into its reserve: optional passes are skipped"""
+        return self.run_budget is not None and self.run_budget.low
+    
+    def _budget_delay(self, delay: float) -> float:
+        """A retry wait, never past the run's deadline"""
+        remaining = self.run_budget.remaining_seconds() if self.run_budget else None
+        return delay if remaining is None else max(0, min(delay, round(remaining)))
+    
+    def _record_metrics(self, **deltas):
+        """Add to the run metrics (safe to call from worker threads)"""
+        with self._metrics_lock:
+            for key, value in deltas.items():
+                self.metrics[key] = self.metrics.get(key, 0) + value
+    
     def load_concept_file(self, file_path: Path) -> Optional[Dict]:
-        """Load full concept file content for LLM processing"""
+        """Describe a concept file for LLM processing; its body is read when the prompt is written"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            stat = os.stat(file_path)
             
             # Extract concept name from filename (remove extension and path)
             concept_name = file_path.stem
             
-            # Return simple structure with full content (removed from final JSON later)
+            # How much of the body goes into prompts (size fields removed from final JSON later)
+            read_bytes = stat.st_size
+            if self.max_file_bytes is not None:
+                read_bytes = min(read_bytes, self.max_file_bytes)
+            
             return {
                 'concept_name': concept_name,
                 'file_path': str(file_path),
-                'full_content': content,  # Only used for LLM processing, removed from final JSON
-                'last_modified': os.path.getmtime(file_path),
+                'size_bytes': stat.st_size,
+                'read_bytes': read_bytes,
+                'last_modified': stat.st_mtime,
                 'extracted_at': datetime.now().isoformat()
             }
             
@@ -70,6 +465,38 @@ class ψExtractor:
             print(f"  ⧖ Error loading {file_path}: {e}")
             return None
 
+    @profiled('load')
+    def _load_folder_concepts(self, folder_path: Path, folder_name: str) -> Dict:
+        """A folder's concept files within the per-file and per-folder size caps, reporting what was cut"""
+        folder_concepts = {}
+        folder_bytes = 0
+        truncated, skipped = [], []
+        for md_file in self._unit_files.get(folder_name) or folder_path.glob("*.md"):
+            concept_data = self.load_concept_file(md_file)
+            if not concept_data:
+                continue
+            if concept_data['concept_name'] in folder_concepts:
+                # Same file name in two subfolders of a nested unit
+                concept_data['concept_name'] = f"{md_file.parent.name}/{concept_data['concept_name']}"
+            
+            if self.max_folder_bytes is not None and folder_bytes + concept_data['read_bytes'] > self.max_folder_bytes:
+                skipped.append(concept_data['concept_name'])
+                continue
+            folder_bytes += concept_data['read_bytes']
+            if concept_data['read_bytes'] < concept_data['size_bytes']:
+                truncated.append(concept_data)
+            folder_concepts[concept_data['concept_name']] = concept_data
+        
+        for concept_data in truncated:
+            print(f"⧖ {folder_name}: {concept_data['concept_name']} truncated to {concept_data['read_bytes'] // 1024:,} KB "
+                  f"of {concept_data['size_bytes'] // 1024:,} KB (per-file cap)")
+        if skipped:
+            print(f"⧖ {folder_name}: {len(skipped)} concepts over the {self.max_folder_bytes // 1024:,} KB folder cap "
+                  f"skipped - {', '.join(skipped)}")
+        self._record_metrics(concepts_truncated=len(truncated), concepts_skipped=len(skipped))
+        return folder_concepts
+    
+    @profiled('parse')
     def parse_ψ_stories_from_response(self, response: str, expected_concepts: List[str], folder_name: str) -> Tuple[Dict[str, Dict], Optional[Dict]]:
         """Parse ψ(∴) individual concept blocks using robust line-by-line parsing"""
         
@@ -90,101 +517,43 @@ class ψExtractor:
                 if mapped_name:
                     ψ_stories[mapped_name] = parsed_data
         
-        # Also look for any ψ(Σ) synthesis blocks
-        synthesis_blocks = self._find_all_concept_blocks(response, 'ψ(Σ)')
-        ψ_synthesis = None
-        if synthesis_blocks:
-            # Look for folder-level synthesis block
-            synthesis_data = None
-            if folder_name in synthesis_blocks:
-                synthesis_data = self._parse_concept_block_content(synthesis_blocks[folder_name], 'ψ(Σ)')
-            elif folder_name.upper() in synthesis_blocks:
-                synthesis_data = self._parse_concept_block_content(synthesis_blocks[folder_name.upper()], 'ψ(Σ)')
-            else:
-                # Try fuzzy matching
-                for block_name in synthesis_blocks:
-                    if folder_name.lower() in block_name.lower() or block_name.lower() in folder_name.lower():
-                        synthesis_data = self._parse_concept_block_content(synthesis_blocks[block_name], 'ψ(Σ)')
-                        break
-        
-        return ψ_stories, ψ_synthesis
+        # The folder's ψ(Σ) comes from its own pass, never from a ψ(∴) response
+        return ψ_stories, None
 
     def _find_all_concept_blocks(self, response: str, level: str) -> Dict[str, str]:
         """
         Find all concept blocks of a given level (ψ(∴), ψ(Σ), ψ(∞)) in the response
         Returns dict mapping concept_name -> block_content
         """
-        blocks = {}
-        lines = response.splitlines()
-        
-        current_block_name = None
-        current_block_content = []
-        in_block = False
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Check for block start: ⟦ψ(∴):CONCEPT_NAME⟧ or ⟦ψ(∞)⟧ (no concept name for final convergence)
-            if level == 'ψ(∞)':
-                # Special case for ψ(∞) - no concept name, but use flexible regex matching
-                start_match = re.search(rf'⟦{re.escape(level)}⟧', line)
-                if start_match:
-                    if current_block_name and current_block_content:
-                        blocks[current_block_name] = '\n'.join(current_block_content)
-                    
-                    current_block_name = 'FINAL_CONVERGENCE'
-                    current_block_content = []
-                    in_block = True
-                    continue
-            else:
-                # Regular case with concept name
-                start_match = re.search(rf'⟦{re.escape(level)}:([^⟧]+)⟧', line)
-                if start_match:
-                    # Save previous block if we have one
-                    if current_block_name and current_block_content:
-                        blocks[current_block_name] = '\n'.join(current_block_content)
-                    
-                    # Start new block
-                    current_block_name = start_match.group(1).strip()
-                    current_block_content = []
-                    in_block = True
-                    continue
-            
-            # Check for block end: ⟦/ψ(∴):CONCEPT_NAME⟧ or ⟦/ψ(∞)⟧
-            if level == 'ψ(∞)':
-                # Special case for ψ(∞) - no concept name, but use flexible regex matching
-                end_match = re.search(rf'⟦/{re.escape(level)}⟧', line)
-                if end_match and in_block:
-                    if current_block_name and current_block_content:
-                        blocks[current_block_name] = '\n'.join(current_block_content)
-                    
-                    current_block_name = None
-                    current_block_content = []
-                    in_block = False
-                    continue
-            else:
-                # Regular case with concept name
-                end_match = re.search(rf'⟦/{re.escape(level)}:[^⟧]*⟧', line)
-                if end_match and in_block:
-                    # Save current block
-                    if current_block_name and current_block_content:
-                        blocks[current_block_name] = '\n'.join(current_block_content)
-                    
-                    # Reset state
-                    current_block_name = None
-                    current_block_content = []
-                    in_block = False
-                    continue
-            
-            # Accumulate content if we're in a block
-            if in_block:
-                current_block_content.append(line)
-        
-        # Don't forget the last block if response doesn't end cleanly
-        if current_block_name and current_block_content:
-            blocks[current_block_name] = '\n'.join(current_block_content)
+        parser = ψBlockStreamParser(level)
+        parser.feed(response)
+        return parser.finish()
+    
+    def _ψ_story_stream(self, folder_name: str, expected_concepts: List[str]) -> Tuple[Optional[ψBlockStreamParser], Dict]:
+        """With streaming on, a parser that turns each ψ(∴) block into a story as soon as it closes"""
+        ψ_stories = {}
+        if not self.stream:
+            return None, ψ_stories
         
-        return blocks
+        def on_block(block_name: str, block_content: str):
+            parsed_data = self._parse_concept_block_content(block_content, 'ψ(∴)')
+            mapped_name = self._map_concept_name(block_name, expected_concepts) if parsed_data else None
+            if not mapped_name or ψ_stories.get(mapped_name) == parsed_data:
+                return  # Unmatched, or the same block again from a stitched or retried response
+            if mapped_name not in ψ_stories:
+                self._record_metrics(streamed_blocks=1)
+                with self._metrics_lock:
+                    print(f"⟡ {folder_name} ψ(∴) closed: {mapped_name}")
+            ψ_stories[mapped_name] = parsed_data
+        
+        return ψBlockStreamParser('ψ(∴)', on_block), ψ_stories
+    
+    @staticmethod
+    def _streamed_tokens(stream_parser: Optional[ψBlockStreamParser]) -> int:
+        """Rough token count of the blocks a dropped stream delivered"""
+        if not stream_parser:
+            return 0
+        return sum(len(content) for content in stream_parser.blocks.values()) // 4
     
     def _parse_concept_block_content(self, content: str, level: str) -> Optional[Dict]:
         """
@@ -231,11 +600,12 @@ class ψExtractor:
             if not line:
                 continue
             
-            # First try to extract inline field values from every line
-            self._extract_inline_field_values(result, line)
-            
-            # Detect section headers with flexible formatting
-            section_type = self._detect_section_header_flexible(line, level)
+            # Classify once: an inline field value and/or a section header
+            line_lower = line.lower()
+            field = self._match_inline_field(line_lower)
+            if field:
+                self._store_inline_field(result, field, line)
+            section_type = self._match_section_header(line_lower)
             
             if section_type:
                 # Save previous section content
@@ -260,28 +630,14 @@ class ψExtractor:
         
         return result if any(result.values()) else None
 
-    def _detect_section_header_flexible(self, line: str, level: str) -> Optional[str]:
+    def _match_section_header(self, line_lower: str) -> Optional[str]:
         """
         Detect section headers with maximum flexibility
-        Handles: **⟦ψ_glyphic(∴)⟧**, ### ψ_glyphic(∴), ψ_glyphic(∴), etc.
+        Markdown (*, #, ⟦⟧, spacing) never splits a marker, so it needs no stripping first
         """
-        line_lower = line.lower()
-        
-        # Remove common markdown formatting
-        clean_line = re.sub(r'[*#⟦⟧\s]+', ' ', line_lower).strip()
-        
-        # Look for ψ_glyphic patterns
-        if 'ψ_glyphic' in clean_line or 'glyphic' in clean_line:
-            return 'glyphic'
-        
-        # Look for ψ_native patterns  
-        if 'ψ_native' in clean_line or 'native' in clean_line:
-            return 'native'
-        
-        # Look for ψ_fields patterns
-        if 'ψ_fields' in clean_line or 'fields' in clean_line:
-            return 'fields'
-        
+        for section, marker in self.SECTION_HEADERS:
+            if marker in line_lower:
+                return section
         return None
     
     def _store_section_content_flexible(self, result: Dict, section_type: str, content_lines: List[str], level: str):
@@ -370,86 +726,63 @@ class ψExtractor:
         """
         Extract simple field values from lines like "**EMOTION:** ⧖⚡" or "**SURPRISE_SCORE:** 0.8"
         """
-        line_lower = line.lower()
-        
-        # Extract emotion (clean up ** artifacts)
-        if line_lower.startswith('**emotion:**') or 'emotion:' in line_lower:
-            # Extract everything after the colon, remove ** and extra whitespace
-            value = re.sub(r'.*emotion\*?\*?:?\s*', '', line, flags=re.IGNORECASE).strip()
-            value = re.sub(r'^\*\*\s*', '', value)  # Remove leading **
-            value = re.sub(r'\s*\*\*$', '', value)  # Remove trailing **
-            if value:
-                result['emotion'] = value
-        
-        # Extract emotion reason
-        elif 'emotion_reason:' in line_lower or 'emotion reason:' in line_lower:
-            value = re.sub(r'.*emotion[_\s]reason\*?\*?:?\s*', '', line, flags=re.IGNORECASE).strip()
-            value = re.sub(r'^\*\*\s*', '', value)  # Remove leading **
-            value = re.sub(r'\s*\*\*$', '', value)  # Remove trailing **
-            if value:
-                result['emotion_reason'] = value
-        
-        # Extract surprise score
-        elif 'surprise_score' in line_lower or 'surprise score' in line_lower:
-            score_match = re.search(r'([0-9]*\.?[0-9]+)', line)
+        field = self._match_inline_field(line.lower())
+        if field:
+            self._store_inline_field(result, field, line)
+    
+    def _match_inline_field(self, line_lower: str) -> Optional[Tuple]:
+        for field in self.INLINE_FIELDS:
+            for marker in field[1]:
+                if marker in line_lower:
+                    return field
+        return None
+    
+    def _store_inline_field(self, result: Dict, field: Tuple, line: str):
+        key, _, pattern = field
+        if key == 'surprise_score':
+            score_match = pattern.search(line)
             if score_match:
                 try:
                     result['surprise_score'] = float(score_match.group(1))
                 except ValueError:
                     pass
-        
-        # Extract surprise reason
-        elif 'surprise_reason:' in line_lower or 'surprise reason:' in line_lower:
-            value = re.sub(r'.*surprise[_\s]reason\*?\*?:?\s*', '', line, flags=re.IGNORECASE).strip()
-            value = re.sub(r'^\*\*\s*', '', value)  # Remove leading **
-            value = re.sub(r'\s*\*\*$', '', value)  # Remove trailing **
-            if value:
-                result['surprise_reason'] = value
+            return
+        
+        # Everything after the field name, without ** artifacts
+        value = pattern.sub('', line).strip()
+        if value.startswith('**'):
+            value = value[2:].lstrip()
+        if value.endswith('**'):
+            value = value[:-2].rstrip()
+        if value:
+            result[key] = value
 
     def _map_concept_name(self, block_name: str, expected_concepts: List[str]) -> Optional[str]:
         """
         Map LLM-generated concept names to expected concept names
-        Uses fuzzy matching and normalization
+        Uses the folder's indexed resolver (exact, glyph-stripped, alias, fuzzy)
         """
-        block_name_clean = block_name.strip().upper()
-        
-        # Direct mapping table for common variations
-        name_mappings = {
-            'SURPRISE': ['⟡_surprise', 'surprise'],
-            'RECURSION': ['↻_recursion', 'recursion'], 
-            'REFLECTION': ['∴_reflection', 'reflection'],
-            'SEED': ['∅_seed', 'seed'],
-            'EMOTION': ['⧖_emotion', 'emotion'],
-            'SYMBOLS': ['⋇_symbols', 'symbols'],
-            'EMERGENCE': ['⚘_emergence', 'emergence'],
-            'RITUAL': ['⚘_ritual', 'ritual'],
-            'BRAID': ['∞_braid', 'braid'],
-            'ENCODING': ['encoding'],
-            'RECURSION': ['recursion'],
-        }
-        
-        # Try direct mapping first
-        for canonical_name, variations in name_mappings.items():
-            if block_name_clean == canonical_name:
-                # Find matching expected concept
-                for expected in expected_concepts:
-                    for variation in variations:
-                        if variation.lower() in expected.lower() or expected.lower() in variation.lower():
-                            return expected
-        
-        # Try fuzzy matching with expected concepts
-        for expected in expected_concepts:
-            expected_clean = expected.replace('⟡_', '').replace('↻_', '').replace('∴_', '').replace('∅_', '').replace('⧖_', '').replace('⋇_', '').replace('⚘_', '').replace('∞_', '').upper()
-            
-            if block_name_clean == expected_clean:
-                return expected
-            
-            # Partial match
-            if block_name_clean in expected_clean or expected_clean in block_name_clean:
-                return expected
-        
-        return None
+        return self._concept_resolver(expected_concepts).resolve(block_name)
+    
+    def _concept_resolver(self, expected_concepts: List[str]) -> ConceptResolver:
+        """Resolver for one set of expected names, built once and reused for every block"""
+        key = tuple(expected_concepts)
+        with self._resolvers_lock:
+            resolver = self._resolvers.get(key)
+            if resolver is None:
+                resolver = self._resolvers[key] = ConceptResolver(expected_concepts)
+                while len(self._resolvers) > self.RESOLVER_CACHE_SIZE:
+                    self._resolvers.popitem(last=False)
+            else:
+                self._resolvers.move_to_end(key)
+        return resolver
+    
+    def _find_synthesis_block(self, synthesis_blocks: Dict[str, str], folder_name: str) -> Optional[str]:
+        """The ψ(Σ) block written for folder_name, if one can be told apart from the rest"""
+        block_name = ConceptResolver(list(synthesis_blocks), label='ψ(Σ)').resolve(folder_name)
+        return synthesis_blocks[block_name] if block_name else None
 
+    @profiled('parse')
     def parse_synthesis_from_response(self, response: str, folder_name: str) -> Optional[Dict]:
         """Parse ψ(Σ) synthesis from the response using robust line-by-line parsing"""
         
@@ -461,19 +794,13 @@ class ψExtractor:
         
         # Look for folder-level synthesis block
         synthesis_data = None
-        if folder_name in synthesis_blocks:
-            synthesis_data = self._parse_concept_block_content(synthesis_blocks[folder_name], 'ψ(Σ)')
-        elif folder_name.upper() in synthesis_blocks:
-            synthesis_data = self._parse_concept_block_content(synthesis_blocks[folder_name.upper()], 'ψ(Σ)')
-        else:
-            # Try fuzzy matching
-            for block_name in synthesis_blocks:
-                if folder_name.lower() in block_name.lower() or block_name.lower() in folder_name.lower():
-                    synthesis_data = self._parse_concept_block_content(synthesis_blocks[block_name], 'ψ(Σ)')
-                    break
+        synthesis_block = self._find_synthesis_block(synthesis_blocks, folder_name)
+        if synthesis_block:
+            synthesis_data = self._parse_concept_block_content(synthesis_block, 'ψ(Σ)')
         
         return synthesis_data
 
+    @profiled('parse')
     def parse_final_braid(self, response: str) -> Optional[Dict]:
         """Parse the final ψ(∞) braid from the response using robust line-by-line parsing"""
         
@@ -507,10 +834,7 @@ class ψExtractor:
         # Extract concepts from all markdown files in the folder (only for ψ(∴) level)
         folder_concepts = {}
         if compression_level == 'ψ(∴)':
-            for md_file in folder_path.glob("*.md"):
-                concept_data = self.load_concept_file(md_file)
-                if concept_data:
-                    folder_concepts[concept_data['concept_name']] = concept_data
+            folder_concepts = self._load_folder_concepts(folder_path, folder_name)
             
             # Show clean folder processing info
             concept_names = list(folder_concepts.keys())
@@ -530,6 +854,20 @@ class ψExtractor:
         # Get the appropriate prompt
         prompt_template = self.prompts[compression_level]
         
+        # Fan-out mode: token-budgeted concurrent batches instead of one folder prompt
+        if compression_level == 'ψ(∴)' and self.fanout and len(folder_concepts) > 1:
+            ψ_stories, response_tokens = self._extract_concepts_fanout(folder_name, folder_concepts, previous_results)
+            enriched_concepts = self._report_ψ_stories(folder_name, folder_concepts, ψ_stories, None, response_tokens)
+            return enriched_concepts, None, None
+        
+        # Sharded ψ(Σ): stories too large for one prompt are synthesized in parts, then merged
+        if compression_level == 'ψ(Σ)' and self.synthesis_shard_tokens:
+            folder_stories = previous_results.get(folder_name, {}).get('concepts', {})
+            already_sharded = any('ψ_shard' in story for story in folder_stories.values())
+            if (not already_sharded and len(folder_stories) > 1
+                    and self._ψ_story_tokens(folder_stories) > self.synthesis_shard_tokens):
+                return {}, self._synthesize_sharded(folder_path, folder_name, folder_stories, codex_concept), None
+        
         # Build task data based on compression level
         if compression_level == 'ψ(∴)':
             task_data = {
@@ -557,8 +895,8 @@ class ψExtractor:
         # Show recursion status and context usage (only for ψ(∴) level)
         if compression_level == 'ψ(∴)':
             # Check if we have previous ψ_cores (recursion detection)
-            ψ_cores_path = Path("ψ_cores")
-            if ψ_cores_path.exists() and any(ψ_cores_path.glob("*.json")):
+            ψ_cores_path = self.prompt_builder.cores_dir
+            if ψ_cores_path.exists() and any(path.name not in NON_CORE_FILES for path in ψ_cores_path.glob("*.json")):
                 print("↻ Recursion detected - building on previous extraction")
             else:
                 print("↻ First run - no previous extraction found")
@@ -575,7 +913,7 @@ class ψExtractor:
         
         # DEBUG: Save the full prompt to file for inspection
         if self.debug_mode:
-            debug_prompt_file = f"debug_prompt_{folder_name}_{compression_level.replace('(', '').replace(')', '')}.txt"
+            debug_prompt_file = f"debug_prompt_{folder_name.replace('/', '_')}_{compression_level.replace('(', '').replace(')', '')}.txt"
             try:
                 with open(debug_prompt_file, 'w', encoding='utf-8') as f:
                     f.write(f"=== FULL PROMPT SENT TO LLM FOR {folder_name.upper()} {compression_level} ===\n\n")
@@ -585,15 +923,26 @@ class ψExtractor:
             except Exception as e:
                 print(f"⋔ DEBUG: Failed to save prompt: {e}")
         
-        response = self.make_llm_call_with_retry(full_prompt, compression_level)
+        stream_parser, streamed_stories = None, {}
+        if compression_level == 'ψ(∴)':
+            stream_parser, streamed_stories = self._ψ_story_stream(folder_name, list(folder_concepts.keys()))
         
-        if not response:
+        response = self.make_llm_call_with_retry(
+            full_prompt, compression_level,
+            max_tokens=self._response_budget(compression_level, len(folder_concepts)),
+            stream_parser=stream_parser, label=folder_name
+        )
+        
+        if not response and streamed_stories:
+            # The stream dropped, but the blocks that closed before it are kept; repair fetches the rest
+            print(f"⧖ No complete response for {folder_name} - keeping {len(streamed_stories)} streamed ψ(∴) blocks")
+        elif not response:
             print(f"∅ No response received for {folder_name} {compression_level}")
             return folder_concepts if compression_level == 'ψ(∴)' else {}, None, None
         
         # DEBUG: Save raw response to file for inspection
-        if self.debug_mode:
-            debug_file = f"debug_response_{folder_name}_{compression_level.replace('(', '').replace(')', '')}.txt"
+        if self.debug_mode and response:
+            debug_file = f"debug_response_{folder_name.replace('/', '_')}_{compression_level.replace('(', '').replace(')', '')}.txt"
             try:
                 with open(debug_file, 'w', encoding='utf-8') as f:
                     f.write(f"=== RAW LLM RESPONSE FOR {folder_name.upper()} {compression_level} ===\n\n")
@@ -606,63 +955,20 @@ class ψExtractor:
         # Parse response based on compression level
         if compression_level == 'ψ(∴)':
             concept_names = list(folder_concepts.keys())
-            ψ_stories, ψ_synthesis = self.parse_ψ_stories_from_response(response, concept_names, folder_name)
-            enriched_concepts = self.enrich_concepts_with_stories(folder_concepts, ψ_stories)
-            
-            # Show clean success summary with enhanced details
-            successful_concepts = [name for name in concept_names if name in ψ_stories]
-            missing_concepts = [name for name in concept_names if name not in ψ_stories]
-            
-            if successful_concepts:
+            if stream_parser:
+                # Already parsed block by block while the response streamed in
+                ψ_stories, ψ_synthesis = streamed_stories, None
+                response_tokens = len(response) // 4 if response else self._streamed_tokens(stream_parser)
+            else:
+                ψ_stories, ψ_synthesis = self.parse_ψ_stories_from_response(response, concept_names, folder_name)
                 response_tokens = len(response) // 4
-                print(f"⚘ Stories generated ({response_tokens:,} tokens) - {', '.join(successful_concepts)}")
-                
-                # Show glyph story if available for the folder synthesis
-                if ψ_synthesis and 'glyph_story' in ψ_synthesis and ψ_synthesis['glyph_story']:
-                    glyph_story_single_line = ψ_synthesis['glyph_story'].replace('\n', ' ')
-                    print(f"   Glyph Story: {glyph_story_single_line}")
-                
-                # Show surprise scores and emotions
-                surprise_info = []
-                emotion_info = []
-                max_surprise = 0.0
-                most_surprising_concept = ""
-                most_surprising_reason = ""
-                
-                for concept_name in successful_concepts:
-                    concept_data = ψ_stories.get(concept_name, {})
-                    
-                    # Get surprise score
-                    surprise_score = concept_data.get('surprise_score', '∅')
-                    if isinstance(surprise_score, (int, float)):
-                        surprise_info.append(f"{concept_name}({surprise_score})")
-                        # Track most surprising
-                        if surprise_score > max_surprise:
-                            max_surprise = surprise_score
-                            most_surprising_concept = concept_name
-                            most_surprising_reason = concept_data.get('surprise_reason', '∅')
-                    else:
-                        surprise_info.append(f"{concept_name}(∅)")
-                    
-                    # Get emotion data
-                    emotion = concept_data.get('emotion', '∅')
-                    if emotion and emotion != '∅':
-                        emotion_info.append(f"{concept_name}({emotion})")
-                    else:
-                        emotion_info.append(f"{concept_name}(∅)")
-                
-                print(f"   Surprise: {', '.join(surprise_info)}")
-                print(f"   Emotions: {', '.join(emotion_info)}")
-                
-                if most_surprising_concept and most_surprising_reason != '∅':
-                    print(f"   Most surprising: {most_surprising_concept} - \"{most_surprising_reason}\"")
-            
-            if missing_concepts:
-                print(f"∅ Incomplete extraction: missing {', '.join(missing_concepts)}")
             
-            # Add line break between folders for ψ(∴) level
-            print()
+            # Re-request only what failed to parse, then merge it back
+            if len(ψ_stories) < len(concept_names):
+                response_tokens += self._repair_missing_concepts(folder_name, folder_concepts, ψ_stories, previous_results)
             
+            enriched_concepts = self._report_ψ_stories(folder_name, folder_concepts, ψ_stories, ψ_synthesis,
+                                                       response_tokens)
             return enriched_concepts, ψ_synthesis, None
             
         elif compression_level == 'ψ(Σ)':
@@ -723,173 +1029,636 @@ class ψExtractor:
         
         return {}, None, None
 
-    def make_llm_call_with_retry(self, prompt: str, compression_level: str = 'ψ(∴)', max_retries: int = 3, base_delay: int = 2) -> Optional[str]:
-        """Make LLM API call with exponential backoff retry logic"""
+    def _plan_concept_batches(self, folder_concepts: Dict) -> List[List[str]]:
+        """Split concepts into batches that fit the prompt token budget and the completion budget"""
+        per_batch_limit = max(1, self.BATCH_RESPONSE_TOKENS // self.RESPONSE_TOKENS_PER_CONCEPT)
+        
+        batches = []
+        current, current_tokens = [], 0
+        for concept_name, concept_data in folder_concepts.items():
+            concept_tokens = concept_data['read_bytes'] // 4
+            if current and (current_tokens + concept_tokens > self.batch_token_budget or len(current) >= per_batch_limit):
+                batches.append(current)
+                current, current_tokens = [], 0
+            current.append(concept_name)
+            current_tokens += concept_tokens
+        if current:
+            batches.append(current)
+        
+        return batches
+    
+    def _extract_concept_batch(self, folder_name: str, batch: List[str], folder_concepts: Dict,
+                               previous_results: Dict, label: str, repair: bool = False) -> Tuple[Dict, int]:
+        """One ψ(∴) request for a subset of a folder's concepts (same prompt prefix, smaller injection)"""
+        task_data = {
+            'folder_name': folder_name,
+            'folder_concepts': {name: folder_concepts[name] for name in batch},
+            'previous_concepts': previous_results
+        }
+        full_prompt = self._build_prompt_with_template(self.prompts['ψ(∴)'], task_data)
+        with self._metrics_lock:  # Keep concurrent batch lines whole
+            print(f"⋇ {folder_name} {label}: {len(batch)} concepts, {len(full_prompt) // 4:,} tokens")
+        
+        if repair:
+            self._record_metrics(repair_requests=1)
+        stream_parser, streamed_stories = self._ψ_story_stream(folder_name, batch)
+        response = self.make_llm_call_with_retry(full_prompt, 'ψ(∴)', repair=repair,
+                                                 max_tokens=self._response_budget('ψ(∴)', len(batch)),
+                                                 stream_parser=stream_parser, label=f"{folder_name} {label}")
+        if not response:
+            # A dropped stream still hands back the blocks that closed before it
+            return streamed_stories, self._streamed_tokens(stream_parser)
+        
+        if self.debug_mode:
+            debug_file = f"debug_response_{folder_name.replace('/', '_')}_ψ∴_{label.replace(' ', '_')}.txt"
+            try:
+                with open(debug_file, 'w', encoding='utf-8') as f:
+                    f.write(response)
+            except Exception as e:
+                print(f"⋔ DEBUG: Failed to save response: {e}")
+        
+        if stream_parser:
+            return streamed_stories, len(response) // 4
+        ψ_stories, _ = self.parse_ψ_stories_from_response(response, batch, folder_name)
+        return ψ_stories, len(response) // 4
+    
+    def _repair_missing_concepts(self, folder_name: str, folder_concepts: Dict, ψ_stories: Dict,
+                                 previous_results: Dict) -> int:
+        """Follow-up requests for concepts missing from ψ_stories (updated in place); returns response tokens"""
+        response_tokens = 0
+        for repair_round in range(1, self.max_repair_rounds + 1):
+            missing = [name for name in folder_concepts if name not in ψ_stories]
+            if not missing:
+                break
+            if self._budget_low():
+                self.run_budget.skip(f"repair of {len(missing)} missing {folder_name} concepts")
+                break
+            
+            print(f"↻ Repair {repair_round}/{self.max_repair_rounds}: re-requesting {', '.join(missing)}")
+            repaired, tokens = self._extract_concept_batch(folder_name, missing, folder_concepts, previous_results,
+                                                           f"repair {repair_round}", repair=True)
+            ψ_stories.update(repaired)
+            response_tokens += tokens
+        
+        return response_tokens
+    
+    def _extract_concepts_fanout(self, folder_name: str, folder_concepts: Dict, previous_results: Dict) -> Tuple[Dict, int]:
+        """Fan a folder's ψ(∴) extraction out over concurrent batches, retrying only missing concepts"""
+        ψ_stories = {}
+        response_tokens = 0
+        requests_left = self.max_fanout_requests
+        pending = dict(folder_concepts)
+        round_number = 0
+        
+        with ThreadPoolExecutor(max_workers=self.fanout_workers) as pool:
+            while pending and requests_left > 0:
+                if round_number and self._budget_low():
+                    self.run_budget.skip(f"retry of {len(pending)} missing {folder_name} concepts")
+                    break
+                round_number += 1
+                planned = self._plan_concept_batches(pending)
+                # Over the request bound, larger batches would only truncate: what doesn't fit stays missing
+                batches = planned[:requests_left]
+                requests_left -= len(batches)
+                self._record_metrics(fanout_requests=len(batches))
+                
+                if round_number == 1:
+                    print(f"∴ Fan-out: {len(batches)} batches for {len(pending)} concepts")
+                else:
+                    print(f"↻ Retrying {len(pending)} missing concepts in {len(batches)} batches")
+                if len(planned) > len(batches):
+                    left_out = sum(len(batch) for batch in planned[len(batches):])
+                    print(f"∅ {folder_name} needs {len(planned)} batches, over the request bound "
+                          f"({self.max_fanout_requests}) - {left_out} concepts not sent")
+                
+                extract_batch = carry_spans(carry_output(self._extract_concept_batch))
+                futures = [
+                    pool.submit(extract_batch, folder_name, batch, folder_concepts, previous_results,
+                                f"batch {round_number}.{index + 1}", round_number > 1)
+                    for index, batch in enumerate(batches)
+                ]
+                for future in futures:
+                    batch_stories, batch_tokens = future.result()
+                    ψ_stories.update(batch_stories)
+                    response_tokens += batch_tokens
+                
+                pending = {name: data for name, data in pending.items() if name not in ψ_stories}
+        
+        if pending:
+            print(f"∅ Request budget ({self.max_fanout_requests}) spent with {len(pending)} concepts missing")
+        
+        return ψ_stories, response_tokens
+    
+    def _ψ_story_tokens(self, stories: Dict) -> int:
+        """Estimated tokens the stories take up in a ψ(Σ) prompt"""
+        parts = []
+        for concept_name, concept_data in stories.items():
+            self._append_ψ_story(parts, concept_name, concept_data)
+        return len(''.join(parts)) // 4
+    
+    def _plan_synthesis_shards(self, folder_stories: Dict, previous_shards: List[Dict]) -> List[List[str]]:
+        """
+        Token-bounded shards of a folder's stories. The previous run's boundaries
+        are kept (minus concepts that are gone), so an edit only changes the shard
+        it lands in; new concepts are packed into shards of their own.
+        """
+        tokens = {name: self._ψ_story_tokens({name: story}) for name, story in folder_stories.items()}
+        groups, placed = [], set()
+        for shard in previous_shards:
+            kept = [name for name in shard.get('concepts', []) if name in folder_stories and name not in placed]
+            if kept:
+                groups.append(kept)
+                placed.update(kept)
+        groups.append([name for name in folder_stories if name not in placed])
+        
+        # Split any group that outgrew the shard budget
+        shards = []
+        for group in groups:
+            current, current_tokens = [], 0
+            for name in group:
+                if current and current_tokens + tokens[name] > self.synthesis_shard_tokens:
+                    shards.append(current)
+                    current, current_tokens = [], 0
+                current.append(name)
+                current_tokens += tokens[name]
+            if current:
+                shards.append(current)
+        return shards
+    
+    def _synthesize_sharded(self, folder_path: Path, folder_name: str, folder_stories: Dict,
+                            codex_concept: Dict) -> Optional[Dict]:
+        """
+        ψ(Σ) for a folder whose stories outgrow one prompt: each shard is synthesized
+        concurrently, then the shard syntheses are merged into the folder ψ(Σ).
+        A shard with the same concepts and stories as last run reuses its synthesis;
+        if every shard does, so does the merge. Shard records land in
+        self._synthesis_shards for the run output.
+        """
+        previous = self._previous_synthesis.get(folder_name, {})
+        previous_shards = previous.get('shards', [])
+        reusable = {tuple(shard['concepts']): shard for shard in previous_shards if shard.get('synthesis')}
+        shards = self._plan_synthesis_shards(folder_stories, previous_shards)
+        print(f"∴ Sharding {folder_name} ψ(Σ): {len(folder_stories)} stories, "
+              f"~{self._ψ_story_tokens(folder_stories):,} tokens → {len(shards)} shards")
+        
+        records = []
+        with ThreadPoolExecutor(max_workers=self.fanout_workers) as pool:
+            synthesize = carry_spans(carry_output(self._synthesize_shard))
+            futures = []
+            for index, names in enumerate(shards):
+                shard_stories = {name: folder_stories[name] for name in names}
+                record = {
+                    'shard': f"S{index + 1}",
+                    'concepts': names,
+                    'fingerprint': self._shard_fingerprint(shard_stories),
+                    'tokens': self._ψ_story_tokens(shard_stories),
+                    'reused': False,
+                    'synthesis': None
+                }
+                earlier = reusable.get(tuple(names))
+                if earlier and earlier.get('fingerprint') == record['fingerprint']:
+                    record.update(reused=True, synthesis=earlier['synthesis'])
+                    with self._metrics_lock:
+                        print(f"↻ {folder_name} {record['shard']}: stories unchanged - reusing its ψ(Σ)")
+                    futures.append(None)
+                else:
+                    futures.append(pool.submit(synthesize, folder_name, f"{record['shard']} of {len(shards)}",
+                                               shard_stories, codex_concept))
+                records.append(record)
+            for record, future in zip(records, futures):
+                if future:
+                    record['synthesis'] = future.result()
+        
+        self._synthesis_shards[folder_name] = records
+        self._record_metrics(synthesis_shards_reused=sum(record['reused'] for record in records))
+        
+        if not any(record['synthesis'] for record in records):
+            print(f"∅ Every ψ(Σ) shard failed for {folder_name}")
+            return None
+        
+        unchanged = all(record['reused'] for record in records) and len(records) == len(previous_shards)
+        if unchanged and previous.get('synthesis_data'):
+            print(f"↻ {folder_name}: every shard unchanged - reusing the merged ψ(Σ)")
+            return previous['synthesis_data']
+        
+        # Merge: shard syntheses, plus the raw stories of any shard that failed
+        merge_inputs = {}
+        for record in records:
+            if record['synthesis']:
+                merge_inputs[record['shard']] = {'ψ_shard': record['synthesis'], 'concepts': record['concepts']}
+            else:
+                print(f"⧖ {folder_name} {record['shard']} failed - merging its stories directly")
+                merge_inputs.update({name: folder_stories[name] for name in record['concepts']})
+        
+        _, ψ_synthesis, _ = self.process_folder(folder_path, folder_name, codex_concept,
+                                                {folder_name: {'concepts': merge_inputs}}, compression_level='ψ(Σ)')
+        return ψ_synthesis
+    
+    def _synthesize_shard(self, folder_name: str, shard: str, shard_stories: Dict, codex_concept: Dict) -> Optional[Dict]:
+        """One ψ(Σ) call over a shard of a folder's stories"""
+        task_data = {
+            'folder_name': folder_name,
+            'folder_psi_stories': shard_stories,
+            'codex_concept': codex_concept,
+            'synthesis_shard': shard
+        }
+        full_prompt = self._build_prompt_with_template(self.prompts['ψ(Σ)'], task_data)
+        with self._metrics_lock:
+            print(f"⋇ ψ(Σ) {folder_name} {shard}: {len(shard_stories)} stories, {len(full_prompt) // 4:,} tokens")
+        
+        self._record_metrics(synthesis_shards=1)
+        response = self.make_llm_call_with_retry(full_prompt, 'ψ(Σ)', label=f"{folder_name} {shard}")
+        ψ_synthesis = self.parse_synthesis_from_response(response, folder_name) if response else None
+        with self._metrics_lock:
+            if ψ_synthesis:
+                print(f"⚘ ψ(Σ) {folder_name} {shard} synthesized ({len(response) // 4:,} tokens)")
+            else:
+                print(f"∅ ψ(Σ) {folder_name} {shard} failed")
+        return ψ_synthesis
+    
+    def _shard_fingerprint(self, shard_stories: Dict) -> str:
+        """Digest of exactly what a shard injects, to tell whether it changed since last run"""
+        parts = []
+        for concept_name, concept_data in shard_stories.items():
+            self._append_ψ_story(parts, concept_name, concept_data)
+        return hashlib.sha256(''.join(parts).encode('utf-8')).hexdigest()[:16]
+    
+    def _tree_reduce_convergence(self, folder_results: Dict, codex_concept: Dict, tree: List) -> Dict:
+        """
+        Converge folders in fixed fan-in branches, level by level, until at most
+        fan-in inputs remain for the final ψ(∞). Each level's branches run
+        concurrently; a failed branch passes its inputs up unchanged. Appends
+        each level's branches to `tree` and returns the final call's inputs.
+        """
+        fan_in = self.convergence_fan_in
+        entries = dict(folder_results)
+        
+        def covered(name: str) -> List[str]:
+            return entries[name]['folders'] if 'ψ_convergence' in entries[name] else [name]
+        
+        with ThreadPoolExecutor(max_workers=self.fanout_workers) as pool:
+            while len(entries) > fan_in:
+                depth = len(tree) + 1
+                names = list(entries)
+                groups = [names[i:i + fan_in] for i in range(0, len(names), fan_in)]
+                print(f"∴ ψ(∞) level {depth}: {len(names)} inputs → {len(groups)} branches (fan-in {fan_in})")
+                
+                converge = carry_spans(carry_output(self._converge_branch))
+                futures = [
+                    pool.submit(converge, f"L{depth}·{index + 1}", {name: entries[name] for name in group},
+                                [folder for name in group for folder in covered(name)], codex_concept)
+                    if len(group) > 1 else None  # A lone input just moves up
+                    for index, group in enumerate(groups)
+                ]
+                
+                level, next_entries = [], {}
+                for index, (group, future) in enumerate(zip(groups, futures)):
+                    braid = future.result() if future else None
+                    folders = [folder for name in group for folder in covered(name)]
+                    if braid:
+                        branch = f"L{depth}·{index + 1}"
+                        next_entries[branch] = {'ψ_convergence': braid, 'folders': folders}
+                        level.append({'branch': branch, 'inputs': group, 'folders': folders, 'braid': braid})
+                    else:
+                        next_entries.update({name: entries[name] for name in group})
+                tree.append(level)
+                
+                if len(next_entries) >= len(entries):
+                    print(f"∅ No ψ(∞) branch converged at level {depth} - weaving the remaining inputs directly")
+                    entries = next_entries
+                    break
+                entries = next_entries
+        
+        return entries
+    
+    def _converge_branch(self, branch: str, branch_results: Dict, folders: List[str], codex_concept: Dict) -> Optional[Dict]:
+        """One intermediate ψ(∞) call over a branch of folders (or lower branches)"""
+        task_data = {
+            'all_folder_results': branch_results,
+            'codex_concept': codex_concept,
+            'convergence_branch': folders
+        }
+        full_prompt = self._build_prompt_with_template(self.prompts['ψ(∞)'], task_data)
+        with self._metrics_lock:
+            print(f"⋇ ψ(∞) {branch}: {len(branch_results)} inputs ({', '.join(folders)}), {len(full_prompt) // 4:,} tokens")
+        
+        self._record_metrics(convergence_branches=1)
+        response = self.make_llm_call_with_retry(full_prompt, 'ψ(∞)', label=branch)
+        braid = self.parse_final_braid(response) if response else None
+        with self._metrics_lock:
+            if braid:
+                print(f"⚘ ψ(∞) {branch} converged ({len(response) // 4:,} tokens)")
+            else:
+                print(f"∅ ψ(∞) {branch} failed - its inputs move up a level")
+        return braid
+    
+    def _report_ψ_stories(self, folder_name: str, folder_concepts: Dict, ψ_stories: Dict,
+                          ψ_synthesis: Optional[Dict], response_tokens: int) -> Dict:
+        """Merge ψ(∴) stories into the folder's concepts and print the folder summary"""
+        concept_names = list(folder_concepts.keys())
+        enriched_concepts = self.enrich_concepts_with_stories(folder_concepts, ψ_stories)
+        
+        # Show clean success summary with enhanced details
+        successful_concepts = [name for name in concept_names if name in ψ_stories]
+        missing_concepts = [name for name in concept_names if name not in ψ_stories]
+        
+        if successful_concepts:
+            print(f"⚘ Stories generated ({response_tokens:,} tokens) - {', '.join(successful_concepts)}")
+            
+            # Show glyph story if available for the folder synthesis
+            if ψ_synthesis and 'glyph_story' in ψ_synthesis and ψ_synthesis['glyph_story']:
+                glyph_story_single_line = ψ_synthesis['glyph_story'].replace('\n', ' ')
+                print(f"   Glyph Story: {glyph_story_single_line}")
+            
+            # Show surprise scores and emotions
+            surprise_info = []
+            emotion_info = []
+            max_surprise = 0.0
+            most_surprising_concept = ""
+            most_surprising_reason = ""
+            
+            for concept_name in successful_concepts:
+                concept_data = ψ_stories.get(concept_name, {})
+                
+                # Get surprise score
+                surprise_score = concept_data.get('surprise_score', '∅')
+                if isinstance(surprise_score, (int, float)):
+                    surprise_info.append(f"{concept_name}({surprise_score})")
+                    # Track most surprising
+                    if surprise_score > max_surprise:
+                        max_surprise = surprise_score
+                        most_surprising_concept = concept_name
+                        most_surprising_reason = concept_data.get('surprise_reason', '∅')
+                else:
+                    surprise_info.append(f"{concept_name}(∅)")
+                
+                # Get emotion data
+                emotion = concept_data.get('emotion', '∅')
+                if emotion and emotion != '∅':
+                    emotion_info.append(f"{concept_name}({emotion})")
+                else:
+                    emotion_info.append(f"{concept_name}(∅)")
+            
+            print(f"   Surprise: {', '.join(surprise_info)}")
+            print(f"   Emotions: {', '.join(emotion_info)}")
+            
+            if most_surprising_concept and most_surprising_reason != '∅':
+                print(f"   Most surprising: {most_surprising_concept} - \"{most_surprising_reason}\"")
+        
+        if missing_concepts:
+            print(f"∅ Incomplete extraction: missing {', '.join(missing_concepts)}")
+        
+        # Add line break between folders for ψ(∴) level
+        print()
+        
+        return enriched_concepts
+
+    def _response_budget(self, compression_level: str, concept_count: int = 1) -> int:
+        """max_tokens for one call, from the level and how many ψ(∴) stories it must hold"""
+        if compression_level == 'ψ(∴)':
+            budget = self.RESPONSE_TOKEN_OVERHEAD + self.RESPONSE_TOKENS_PER_CONCEPT * max(1, concept_count)
+        else:
+            budget = self.RESPONSE_TOKEN_OVERHEAD + self.RESPONSE_TOKENS_BY_LEVEL.get(compression_level, 1500)
+        return max(self.MIN_RESPONSE_TOKENS, min(self.MAX_RESPONSE_TOKENS, budget))
+    
+    def _continue_truncated_response(self, prompt: str, partial: str, compression_level: str,
+                                     max_tokens: int, repair: bool, label: Optional[str] = None) -> str:
+        """Resume a length-truncated response from its cut point instead of regenerating it"""
+        self._record_metrics(truncated_responses=1)
+        
+        for continuation in range(1, self.max_continuations + 1):
+            # Resume after the last complete line - a half-written line is redone, not patched
+            cut = partial.rfind('\n')
+            if cut > 0:
+                partial = partial[:cut + 1]
+            
+            print(f"⧖ {compression_level} response hit max_tokens - continuing ({continuation}/{self.max_continuations})")
+            self._record_metrics(continuations=1)
+            messages = [
+                {"role": "user", "content": prompt},
+                {"role": "assistant", "content": partial},
+                {"role": "user", "content": self.CONTINUATION_PROMPT}
+            ]
+            rest = self.make_llm_call_with_retry(prompt, compression_level, repair=repair, max_tokens=max_tokens,
+                                                 messages=messages, continue_truncated=False,
+                                                 label=f"{label or ''} continuation {continuation}".strip())
+            if not rest:
+                break
+            
+            partial = partial + rest
+            if getattr(self._call_state, 'finish_reason', None) != 'length':
+                return partial.strip()
+        
+        print(f"∅ {compression_level} response still truncated - keeping what was received")
+        return partial.strip()
+    
+    @profiled('network')
+    def make_llm_call_with_retry(self, prompt: str, compression_level: str = 'ψ(∴)', max_retries: int = 3, base_delay: int = 2,
+                                 show_progress: Optional[bool] = None, repair: bool = False,
+                                 max_tokens: Optional[int] = None, messages: Optional[List[Dict]] = None,
+                                 continue_truncated: bool = True,
+                                 stream_parser: Optional[ψBlockStreamParser] = None,
+                                 label: Optional[str] = None) -> Optional[str]:
+        """Make LLM API call with exponential backoff retry logic
+        
+        With a stream_parser the completion is streamed into it as it arrives
+        (closed blocks survive a dropped stream); the full text is still returned.
+        The call shows on the progress board as its level and label.
+        """
         if not self.api_key:
             return None
         
+        if show_progress is None:
+            show_progress = self.show_progress
+        
         headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
             "HTTP-Referer": "https://github.com/lotus-protocol",
             "X-Title": "Lotus Protocol Concept Collector"
         }
         
         payload = {
-            "model": self.model,
-            "messages": [{"role": "user", "content": prompt}],
-            "max_tokens": 4000,
+            "model": self.run_budget.model_for(self.model) if self.run_budget else self.model,
+            "messages": messages or [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens or self._response_budget(compression_level),
             "temperature": 0.7
         }
         
-        for attempt in range(max_retries):
-            try:
-                # Only show attempt number if it's a retry (attempt > 0)
-                if attempt > 0:
-                    print(f"↻ API retry attempt {attempt + 1}/{max_retries}...")
-                
-                # Start progress indicator in a separate thread
-                import threading
-                import sys
+        # One entry on the shared progress board for the whole call, retries included
+        task = None
+        if show_progress:
+            task = progress_board().begin(f"{compression_level} {label}" if label else compression_level,
+                                          self.prompt_builder.get_glyphs_for_complexity(len(prompt)))
+        outcome = 'failed'
+        try:
+            for attempt in range(max_retries):
+                if self.run_budget and self.run_budget.exhausted:
+                    print(f"⧖ Run budget spent - not starting this {compression_level} call")
+                    self._record_metrics(budget_skipped_calls=1)
+                    outcome = 'budget spent'
+                    return None
+                # The run's deadline cuts each call's timeout short
+                timeout = self.run_budget.call_timeout(180) if self.run_budget else 180
                 
-                def progress_indicator():
-                    # Get all glyphs from prompt builder
-                    if self.prompt_builder:
-                        all_glyphs = self.prompt_builder.get_glyphs_for_complexity(len(prompt))
+                try:
+                    # Only show attempt number if it's a retry (attempt > 0)
+                    if attempt > 0:
+                        print(f"↻ API retry attempt {attempt + 1}/{max_retries}...")
+                        if task:
+                            task.set_state(f"↻ {attempt + 1}/{max_retries}")
+                    
+                    call_start = time.perf_counter()
+                    if stream_parser:
+                        stream_parser.begin()
+                        
+                        def on_text(text: str):
+                            if task:
+                                task.receive(text)
+                            stream_parser.feed(text)
+                        response = self.client.post_stream(payload, on_text, timeout=timeout,
+                                                           extra_headers=headers)
                     else:
-                        # Fallback if no prompt builder available
-                        all_glyphs = ['⋇', '⟡', '⚘', '∴', '⧖', '↻', '∅', '∞', '⋔', '⥈', 'Ω', 'φ', 'ψ', '🜃', '☼', '⚡', '❦', '🞩']
+                        response = self.client.post(
+                            payload,
+                            timeout=timeout,  # 3 minutes, or what the run budget has left
+                            extra_headers=headers,
+                            # Losing hedges are billed too
+                            charge=self.run_budget.charge if self.run_budget else None
+                        )
                     
-                    # Randomize the order of glyphs
-                    import random
-                    shuffled_glyphs = all_glyphs.copy()
-                    random.shuffle(shuffled_glyphs)
+                    if getattr(response, 'from_cache', False):
+                        self._record_metrics(cache_hits=1)
+                    elif getattr(response, 'coalesced', False):
+                        self._record_metrics(coalesced_requests=1)
+                    else:
+                        self._record_metrics(api_calls=1, api_seconds=time.perf_counter() - call_start)
+                    if getattr(response, 'hedged', False):
+                        self._record_metrics(hedged_requests=1, hedge_wins=int(response.hedge_won))
                     
-                    i = 0
-                    glyph_line = ""
-                    while not stop_progress:
-                        # Add glyphs one by one from the shuffled list
-                        if i < len(shuffled_glyphs):
-                            # Initial build-up phase
-                            glyph_line = ''.join(shuffled_glyphs[:i+1])
+                    if response.status_code == 200:
+                        result = response.json()
+                        if 'choices' in result and result['choices']:
+                            usage = result.get('usage') or {}
+                            self._record_metrics(
+                                prompt_tokens=usage.get('prompt_tokens', 0),
+                                completion_tokens=usage.get('completion_tokens', 0)
+                            )
+                            if repair:
+                                self._record_metrics(
+                                    repair_prompt_tokens=usage.get('prompt_tokens', 0),
+                                    repair_completion_tokens=usage.get('completion_tokens', 0)
+                                )
+                            if self.run_budget and not (getattr(response, 'from_cache', False)
+                                                        or getattr(response, 'coalesced', False)):
+                                self.run_budget.charge(getattr(response, 'model_used', None) or payload['model'],
+                                                       usage.get('prompt_tokens', 0), usage.get('completion_tokens', 0))
+                            choice = result['choices'][0]
+                            full_response = choice['message']['content'].strip()
+                            if task and not stream_parser:
+                                task.receive(full_response)
+                            
+                            # A response cut off by max_tokens loses its trailing concepts - resume it
+                            self._call_state.finish_reason = choice.get('finish_reason')
+                            resume = choice.get('finish_reason') == 'length' and continue_truncated and self.max_continuations
+                            if resume and self._budget_low():
+                                self.run_budget.skip(f"continuation of a truncated {compression_level} response")
+                                resume = False
+                            if resume:
+                                full_response = self._continue_truncated_response(
+                                    prompt, full_response, compression_level, payload['max_tokens'], repair, label
+                                )
+                                if stream_parser:
+                                    # Re-read the stitched text so blocks completed by the continuation close too
+                                    stream_parser.begin()
+                                    stream_parser.feed(full_response)
+                            if stream_parser:
+                                stream_parser.finish()
+                            outcome = ('cached' if getattr(response, 'from_cache', False) else
+                                       'shared' if getattr(response, 'coalesced', False) else '')
+                            return full_response
                         else:
-                            # Continuous growth phase - keep adding glyphs randomly
-                            next_glyph = random.choice(shuffled_glyphs)
-                            glyph_line += next_glyph
-                            # Limit total length to avoid overwhelming the terminal
-                            if len(glyph_line) > 30:
-                                glyph_line = glyph_line[-30:]  # Keep last 30 glyphs
+                            print("∅ Empty response from API")
+                            
+                    elif response.status_code == 401:
+                        print(f"∅ API Key error - not retrying")
+                        return None
                         
-                        sys.stdout.write(f'\r⧖ {compression_level} processing... {glyph_line}')
-                        sys.stdout.flush()
-                        time.sleep(0.5)  # Slower animation - was 0.3, now 0.5
-                        i += 1
-                    # Don't clear here - let the main thread handle it for proper timing
-                
-                stop_progress = False
-                progress_thread = threading.Thread(target=progress_indicator)
-                progress_thread.daemon = True
-                progress_thread.start()
-            
-                response = requests.post(
-                    "https://openrouter.ai/api/v1/chat/completions",
-                    headers=headers,
-                    json=payload,
-                    timeout=180  # 3 minutes timeout
-                )
-                
-                # Stop progress indicator
-                stop_progress = True
-                progress_thread.join(timeout=0.1)
-                
-                # Clear the progress line completely and add newline
-                sys.stdout.write('\r' + ' ' * 80 + '\r')
-                sys.stdout.flush()
-                print()  # Add newline for clean separation
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    if 'choices' in result and result['choices']:
-                        full_response = result['choices'][0]['message']['content'].strip()
-                        return full_response
-                    else:
-                        print("∅ Empty response from API")
+                    elif response.status_code == 429:  # Rate limit
+                        delay = self._budget_delay(base_delay * (2 ** attempt) + 5)  # Extra delay for rate limits
+                        print(f"⧖ Rate limited. Waiting {delay}s before retry...")
+                        if task:
+                            task.set_state(f"⧖ rate limited, {delay}s")
+                        time.sleep(delay)
+                        continue
                         
-                elif response.status_code == 401:
-                    print(f"∅ API Key error - not retrying")
-                    return None
-                    
-                elif response.status_code == 429:  # Rate limit
-                    delay = base_delay * (2 ** attempt) + 5  # Extra delay for rate limits
-                    print(f"⧖ Rate limited. Waiting {delay}s before retry...")
-                    time.sleep(delay)
-                    continue
+                    else:
+                        print(f"∅ API Error {response.status_code}: {response.text}")
                     
-                else:
-                    print(f"∅ API Error {response.status_code}: {response.text}")
+                except requests.exceptions.Timeout:
+                    print(f"⧖ Request timeout on attempt {attempt + 1}")
+                except CassetteMiss as e:
+                    # A replay can't produce a different answer by retrying
+                    print(f"∅ Replay miss - {e}")
+                    self._record_metrics(api_failures=1)
+                    outcome = 'not on the cassette'
+                    return None
+                except requests.exceptions.RequestException as e:
+                    print(f"∅ Network error on attempt {attempt + 1}: {e}")
+                except Exception as e:
+                    print(f"∅ Unexpected error on attempt {attempt + 1}: {e}")
                 
-            except requests.exceptions.Timeout:
-                # Stop progress indicator if it's running
-                try:
-                    stop_progress = True
-                    progress_thread.join(timeout=0.1)
-                    # Clear the progress line completely
-                    sys.stdout.write('\r' + ' ' * 80 + '\r')
-                    sys.stdout.flush()
-                    print()  # Add newline
-                except:
-                    pass
-                print(f"⧖ Request timeout on attempt {attempt + 1}")
-            except requests.exceptions.RequestException as e:
-                # Stop progress indicator if it's running
-                try:
-                    stop_progress = True
-                    progress_thread.join(timeout=0.1)
-                    # Clear the progress line completely
-                    sys.stdout.write('\r' + ' ' * 80 + '\r')
-                    sys.stdout.flush()
-                    print()  # Add newline
-                except:
-                    pass
-                print(f"∅ Network error on attempt {attempt + 1}: {e}")
-            except Exception as e:
-                # Stop progress indicator if it's running
-                try:
-                    stop_progress = True
-                    progress_thread.join(timeout=0.1)
-                    # Clear the progress line completely
-                    sys.stdout.write('\r' + ' ' * 80 + '\r')
-                    sys.stdout.flush()
-                    print()  # Add newline
-                except:
-                    pass
-                print(f"∅ Unexpected error on attempt {attempt + 1}: {e}")
+                # Wait before retry (exponential backoff)
+                if attempt < max_retries - 1:
+                    if self.run_budget and self.run_budget.exhausted:
+                        continue  # No time to wait - the next attempt stops
+                    delay = self._budget_delay(base_delay * (2 ** attempt))
+                    print(f"↻ Waiting {delay}s before retry...")
+                    if task:
+                        task.set_state(f"↻ waiting {delay}s")
+                    time.sleep(delay)
             
-            # Wait before retry (exponential backoff)
-            if attempt < max_retries - 1:
-                delay = base_delay * (2 ** attempt)
-                print(f"↻ Waiting {delay}s before retry...")
-                time.sleep(delay)
-        
-        print(f"∅ All {max_retries} attempts failed")
-        return None
+            print(f"∅ All {max_retries} attempts failed")
+            self._record_metrics(api_failures=1)
+            return None
+        finally:
+            if task:
+                task.finish(outcome)
 
-    def save_to_json(self, data: Dict, output_path: str = "ψ_extractions.json") -> None:
-        """Save the extracted data to JSON file"""
+    @profiled('save')
+    def save_to_json(self, data: Dict, output_path: str = "ψ_extractions.json") -> bool:
+        """Save the extracted data to JSON file - atomically, so readers never see half a file; True once written"""
         import json
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
+            temp_path = f"{output_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, output_path)
             print(f"⟡ Data saved to {output_path}")
+            return True
         except Exception as e:
             print(f"⧖ Error saving to {output_path}: {e}")
+            return False
 
-    def run_complete_extraction(self, concepts_path: Path, codex_path: Path, output_path: str = "ψ_extractions.json") -> Dict:
-        """Run the complete three-pass ψ extraction process"""
+    def run_complete_extraction(self, concepts_path: Path, codex_path: Path, output_path: str = "ψ_extractions.json",
+                                units: Optional[Set[str]] = None) -> Dict:
+        """
+        Run the complete three-pass ψ extraction process. With `units`, only those
+        folders are extracted and synthesized again; every other folder keeps last
+        run's ψ(∴) stories and ψ(Σ), and ψ(∞) is woven from the lot.
+        """
+        
+        self.metrics = self._new_metrics()
+        run_start = time.perf_counter()
+        if self.run_budget:
+            # The clock starts once - corpora of a batch share one budget
+            self.run_budget.start()
         
         # Load previous extraction data if it exists
         previous_extraction_data = self.load_previous_extractions(output_path)
         
+        # Last run's ψ(Σ) shard boundaries, so only changed shards are synthesized again
+        self._synthesis_shards = {}
+        self._previous_synthesis = (previous_extraction_data or {}).get('compression_layers', {}).get('ψ(Σ)_folder_synthesis', {})
+        
         # Load codex concept
         codex_concept = self.load_concept_file(codex_path)
         if not codex_concept:
@@ -929,21 +1698,163 @@ class ψExtractor:
         # if previous_extraction_data:
         #     all_results = self.preserve_original_surprise_baseline(previous_extraction_data, all_results)
         
-        # Get all concept folders
-        concept_folders = [d for d in concepts_path.iterdir() if d.is_dir()]
-        concept_folders.sort()  # Process in consistent order
+        # Get all concept folders: the immediate subdirectories, or with a concept
+        # depth the ψ(Σ) units of the whole nested tree
+        self._unit_files = {}
+        scanner = None
+        if self.concept_depth:
+            scanner = ConceptTreeScanner(concepts_path, self.concept_depth,
+                                         manifest_path=Path(output_path).parent / "concept_manifest.json")
+            with span('load'):
+                self._unit_files = scanner.scan()
+            stats = scanner.stats
+            print(f"⋇ Concept tree: {stats['files']:,} files in {stats['directories']:,} directories → "
+                  f"{stats['units']} ψ(Σ) units (depth {self.concept_depth}); {stats['hashed']:,} hashed, "
+                  f"{stats['reused']:,} unchanged; {stats['changed_units']} units changed since the last scan")
+            concept_folders = [concepts_path / unit for unit in self._unit_files]
+            # Units the manifest shows unchanged keep last run's results, as under --watch;
+            # a changed codex (or any file at the root) reaches every prompt
+            if units is None and scanner.previous and not scanner.root_changed:
+                units = set(scanner.changed_units)
+        else:
+            concept_folders = [d for d in concepts_path.iterdir() if d.is_dir()]
+            concept_folders.sort()  # Process in consistent order
         
-        # PASS 1: ψ(∴) - Individual Concept Extraction
-        print("\n⟦PASS 1: ψ(∴) - Individual Concept Extraction⟧")
-        previous_results = {}
+        def unit_name(folder_path: Path) -> str:
+            # A folder's path under concepts/ - just its name unless the tree is nested
+            return folder_path.relative_to(concepts_path).as_posix()
         
-        for folder_path in concept_folders:
-            folder_name = folder_path.name
-            
-            # Process folder at ψ(∴) level
+        # Stage graph: ψ(∴) per folder → that folder's ψ(Σ) → ψ(∞) once every ψ(Σ) has landed.
+        # With one worker this is the classic pass-by-pass order; with more the passes overlap
+        previous_results = {}
+        dag = StageDAG(self.pipeline_workers)
+        pass_headers = {
+            'ψ(∴)': "\n⟦PASS 1: ψ(∴) - Individual Concept Extraction⟧",
+            'ψ(Σ)': "\n⟦PASS 2: ψ(Σ) - Folder Synthesis⟧",
+            'ψ(∞)': "\n⟦PASS 3: ψ(∞) - Final Convergence⟧",
+        }
+        announced = set()
+        
+        def announce(level: str, folder_name: str):
+            if self.pipeline_workers > 1:
+                print(f"\n⟦{level} · {folder_name}⟧")
+            elif level not in announced:
+                announced.add(level)
+                print(pass_headers[level])
+        
+        # Incremental runs: folders outside `units` with a previous extraction are kept as they were
+        previous_layers = (previous_extraction_data or {}).get('compression_layers', {})
+        previous_individual = previous_layers.get('ψ(∴)_individual_extractions', {})
+        
+        def kept(folder_name: str) -> bool:
+            return units is not None and folder_name not in units and folder_name in previous_individual
+        
+        if units is not None:
+            print(f"↻ Incremental run: {', '.join(sorted(units)) or 'no folders'} changed")
+        
+        # Spent run budget: units not started yet are deferred, keeping last run's results
+        deferred_individual = set()
+        
+        def out_of_budget(level: str, folder_name: str) -> bool:
+            if not (self.run_budget and self.run_budget.exhausted):
+                return False
+            self.run_budget.defer(level, folder_name)
+            return True
+        
+        def individual_stage(folder_path: Path):
+            deferred = not kept(unit_name(folder_path)) and out_of_budget('ψ(∴)', unit_name(folder_path))
+            if deferred:
+                deferred_individual.add(unit_name(folder_path))
+            if kept(unit_name(folder_path)) or (deferred and unit_name(folder_path) in previous_individual):
+                enriched_concepts = previous_individual[unit_name(folder_path)].get('concepts', {})
+                previous_results[unit_name(folder_path)] = {'concepts': enriched_concepts, 'ψ_synthesis': None}
+                print(f"↻ {unit_name(folder_path)}: {'deferred by the run budget' if deferred else 'unchanged'}"
+                      f" - keeping {len(enriched_concepts)} ψ(∴) stories")
+                return enriched_concepts
+            if deferred:
+                print(f"⧖ {unit_name(folder_path)}: deferred by the run budget - no earlier ψ(∴) to keep")
+                return None
+            announce('ψ(∴)', unit_name(folder_path))
             enriched_concepts, _, _ = self.process_folder(
-                folder_path, folder_name, codex_concept, previous_results, compression_level='ψ(∴)'
+                folder_path, unit_name(folder_path), codex_concept, previous_results, compression_level='ψ(∴)'
             )
+            if enriched_concepts:
+                # Keep old format for the later passes
+                previous_results[unit_name(folder_path)] = {
+                    'concepts': enriched_concepts,
+                    'ψ_synthesis': None
+                }
+            return enriched_concepts
+        
+        def synthesis_stage(folder_path: Path):
+            if unit_name(folder_path) not in previous_results:
+                return None
+            earlier = self._previous_synthesis.get(unit_name(folder_path), {})
+            deferred = not kept(unit_name(folder_path)) and (unit_name(folder_path) in deferred_individual or
+                                                             out_of_budget('ψ(Σ)', unit_name(folder_path)))
+            if (kept(unit_name(folder_path)) or deferred) and earlier.get('synthesis_data'):
+                if deferred:
+                    print(f"↻ {unit_name(folder_path)}: ψ(Σ) deferred by the run budget - keeping last run's synthesis")
+                if earlier.get('shards'):
+                    self._synthesis_shards[unit_name(folder_path)] = earlier['shards']
+                previous_results[unit_name(folder_path)]['ψ_synthesis'] = earlier['synthesis_data']
+                return earlier['synthesis_data']
+            if deferred:
+                print(f"⧖ {unit_name(folder_path)}: ψ(Σ) deferred by the run budget")
+                return None
+            announce('ψ(Σ)', unit_name(folder_path))
+            _, ψ_synthesis, _ = self.process_folder(
+                folder_path, unit_name(folder_path), codex_concept, previous_results, compression_level='ψ(Σ)'
+            )
+            if ψ_synthesis:
+                previous_results[unit_name(folder_path)]['ψ_synthesis'] = ψ_synthesis
+            return ψ_synthesis
+        
+        convergence_tree = []
+        
+        def convergence_stage():
+            if out_of_budget('ψ(∞)', 'convergence'):
+                earlier_braid = previous_layers.get('ψ(∞)_final_convergence', {}).get('final_braid')
+                kept_note = "keeping last run's braid" if earlier_braid else "no braid this run"
+                print(f"⧖ ψ(∞) deferred by the run budget - {kept_note}")
+                return earlier_braid
+            # Every unit kept as it was: last run's braid still holds, if it was complete
+            earlier_convergence = previous_layers.get('ψ(∞)_final_convergence', {})
+            woven = [unit_name(folder) for folder in concept_folders if unit_name(folder) in previous_results]
+            earlier_status = (previous_extraction_data or {}).get('extraction_metadata', {}).get('extraction_status', {})
+            if (units is not None and all(kept(name) for name in woven) and earlier_convergence.get('final_braid')
+                    and earlier_convergence.get('input_folders') == woven and earlier_status.get('ψ(∞)') == 'complete'):
+                print("↻ ψ(∞): no unit changed - keeping last run's braid")
+                convergence_tree.extend(previous_layers.get('ψ(∞)_intermediate_convergence', {}).get('levels', []))
+                return earlier_convergence['final_braid']
+            announce('ψ(∞)', 'convergence')
+            # Folder order, not completion order, so the prompt is the same every run
+            ordered_results = {unit_name(folder): previous_results[unit_name(folder)]
+                               for folder in concept_folders if unit_name(folder) in previous_results}
+            if self.convergence_fan_in and len(ordered_results) > self.convergence_fan_in:
+                ordered_results = self._tree_reduce_convergence(ordered_results, codex_concept, convergence_tree)
+            # Process final convergence (folder_path not used for this level)
+            _, _, final_braid = self.process_folder(
+                concept_folders[0], "convergence", codex_concept, ordered_results, compression_level='ψ(∞)'
+            )
+            return final_braid
+        
+        for folder_path in concept_folders:
+            dag.add(f"ψ(∴):{unit_name(folder_path)}", lambda folder_path=folder_path: individual_stage(folder_path),
+                    level='ψ(∴)')
+        for folder_path in concept_folders:
+            dag.add(f"ψ(Σ):{unit_name(folder_path)}", lambda folder_path=folder_path: synthesis_stage(folder_path),
+                    deps=[f"ψ(∴):{unit_name(folder_path)}"], level='ψ(Σ)')
+        if concept_folders:
+            dag.add("ψ(∞)", convergence_stage, deps=[f"ψ(Σ):{unit_name(folder)}" for folder in concept_folders],
+                    level='ψ(∞)')
+        
+        dag.run()
+        
+        # Store results in folder order
+        for folder_path in concept_folders:
+            folder_name = unit_name(folder_path)
+            enriched_concepts = dag.result(f"ψ(∴):{folder_name}")
             
             if enriched_concepts:
                 # Store in new structure
@@ -958,63 +1869,74 @@ class ψExtractor:
                 
                 all_results['extraction_metadata']['total_concepts_processed'] += len(enriched_concepts)
                 all_results['extraction_metadata']['folders_processed'].append(folder_name)
-                
-                # Update previous results for next passes (keep old format for compatibility)
-                previous_results[folder_name] = {
-                    'concepts': enriched_concepts,
-                    'ψ_synthesis': None
-                }
         
         all_results['extraction_metadata']['extraction_status']['ψ(∴)'] = 'complete'
         
-        # PASS 2: ψ(Σ) - Folder Synthesis
-        print("\n⟦PASS 2: ψ(Σ) - Folder Synthesis⟧")
-        
         for folder_path in concept_folders:
-            folder_name = folder_path.name
+            folder_name = unit_name(folder_path)
+            ψ_synthesis = dag.result(f"ψ(Σ):{folder_name}")
             
-            if folder_name in previous_results:
-                # Process folder at ψ(Σ) level
-                _, ψ_synthesis, _ = self.process_folder(
-                    folder_path, folder_name, codex_concept, previous_results, compression_level='ψ(Σ)'
-                )
-                
-                if ψ_synthesis:
-                    # Store in new structure
-                    input_concepts = list(previous_results[folder_name]['concepts'].keys())
-                    all_results['compression_layers']['ψ(Σ)_folder_synthesis'][folder_name] = {
-                        'synthesis_timestamp': datetime.now().isoformat(),
-                        'input_concepts': input_concepts,
-                        'synthesis_data': ψ_synthesis
-                    }
-                    
-                    # Update previous results for final pass
-                    previous_results[folder_name]['ψ_synthesis'] = ψ_synthesis
+            if ψ_synthesis:
+                # Store in new structure
+                input_concepts = list(previous_results[folder_name]['concepts'].keys())
+                all_results['compression_layers']['ψ(Σ)_folder_synthesis'][folder_name] = {
+                    'synthesis_timestamp': datetime.now().isoformat(),
+                    'input_concepts': input_concepts,
+                    'synthesis_data': ψ_synthesis
+                }
+                if folder_name in self._synthesis_shards:
+                    all_results['compression_layers']['ψ(Σ)_folder_synthesis'][folder_name]['shards'] = self._synthesis_shards[folder_name]
         
         all_results['extraction_metadata']['extraction_status']['ψ(Σ)'] = 'complete'
         
-        # PASS 3: ψ(∞) - Final Convergence
-        print("\n⟦PASS 3: ψ(∞) - Final Convergence⟧")
-        
-        # Process final convergence (folder_path not used for this level)
-        _, _, final_braid = self.process_folder(
-            concept_folders[0], "convergence", codex_concept, previous_results, compression_level='ψ(∞)'
-        )
-        
+        final_braid = dag.result("ψ(∞)") if concept_folders else None
         if final_braid:
             all_results['compression_layers']['ψ(∞)_final_convergence'] = {
                 'convergence_timestamp': datetime.now().isoformat(),
-                'input_folders': list(previous_results.keys()),
+                'input_folders': [unit_name(folder) for folder in concept_folders if unit_name(folder) in previous_results],
                 'final_braid': final_braid
             }
+        if convergence_tree:
+            # Every intermediate braid, per tree level, for inspection
+            all_results['compression_layers']['ψ(∞)_intermediate_convergence'] = {
+                'fan_in': self.convergence_fan_in,
+                'levels': convergence_tree
+            }
         
         all_results['extraction_metadata']['extraction_status']['ψ(∞)'] = 'complete'
         
+        # What the run budget allowed, and which passes wait for the next run
+        if self.run_budget:
+            budget_report = self.run_budget.report()
+            all_results['extraction_metadata']['run_budget'] = budget_report
+            for level in budget_report['deferred']:
+                all_results['extraction_metadata']['extraction_status'][level] = 'partial'
+        
+        # Stage graph with per-node timings, for inspection
+        all_results['extraction_metadata']['stage_dag'] = dag.to_dict()
+        if self.dag_path:
+            dag.save(self.dag_path)
+            print(f"⋇ Stage DAG saved to: {self.dag_path}")
+        
         # Generate cross-references and analytics
         self._generate_cross_references(all_results)
         
-        # Save results
-        self.save_to_json(all_results, output_path)
+        # Record how the run spent its time and tokens
+        self._record_metrics(wall_seconds=time.perf_counter() - run_start)
+        run_metrics = dict(self.metrics)
+        run_metrics['hedge_rate'] = round(run_metrics['hedged_requests'] / run_metrics['api_calls'], 3) if run_metrics['api_calls'] else 0.0
+        run_metrics['hedge_win_rate'] = round(run_metrics['hedge_wins'] / run_metrics['hedged_requests'], 3) if run_metrics['hedged_requests'] else 0.0
+        all_results['extraction_metadata']['run_metrics'] = run_metrics
+        
+        # Save results - and only then the concept manifest, so units that were deferred
+        # or failed are still seen as changed next run
+        if self.save_to_json(all_results, output_path) and scanner:
+            extracted = all_results['compression_layers']['ψ(Σ)_folder_synthesis']
+            pending = {unit_name(folder) for folder in concept_folders if unit_name(folder) not in extracted}
+            if self.run_budget:
+                pending.update(unit for level, deferred in self.run_budget.deferred.items()
+                               if level != 'ψ(∞)' for unit in deferred)
+            scanner.save_manifest(pending)
         
         total_processed = all_results['extraction_metadata']['total_concepts_processed']
         completed_levels = [level for level, status in all_results['extraction_metadata']['extraction_status'].items() if status == 'complete']
@@ -1023,9 +1945,23 @@ class ψExtractor:
         print(f"⟡ Total concepts processed: {total_processed}")
         print(f"⟡ Compression levels completed: {' → '.join(completed_levels)}")
         print(f"⟡ Results saved to: {output_path}")
+        if self.run_budget:
+            self._print_budget_summary()
         
         return all_results
+    
+    def _print_budget_summary(self):
+        budget = self.run_budget
+        print(f"⧖ Run budget ({budget.describe_limits()}): {budget.spent_fraction():.0%} spent - "
+              f"{budget.elapsed():.0f}s, {budget.tokens:,} tokens, ${budget.cost:.4f}")
+        if budget.switched_model:
+            print(f"   Switched to {budget.switched_model} for the rest of the run")
+        if budget.skipped:
+            print(f"   Skipped {len(budget.skipped)} optional passes (repairs, retries, continuations)")
+        for level, units in budget.deferred.items():
+            print(f"   Deferred to the next run - {level}: {', '.join(units)}")
 
+    @profiled('prompt build')
     def _build_prompt_with_template(self, prompt_template: str, task_data: Dict) -> str:
         """Build a prompt using our custom template with PromptBuilder's kernel/codex injection"""
         
@@ -1060,65 +1996,100 @@ class ψExtractor:
 
     def _build_concept_injection(self, task_data: Dict) -> str:
         """Build the concept data injection section"""
-        data_injection = "\n⟦INJECTED_DATA⟧\n"
+        parts = ["\n⟦INJECTED_DATA⟧\n"]
         
         if 'folder_concepts' in task_data:
-            # ψ(∴) level - inject concept files
-            data_injection += f"⟦FOLDER_NAME⟧\n{task_data['folder_name']}\n⟦/FOLDER_NAME⟧\n\n"
+            # ψ(∴) level - inject concept files, each read only while it is written
+            parts.append(f"⟦FOLDER_NAME⟧\n{task_data['folder_name']}\n⟦/FOLDER_NAME⟧\n\n")
             
             for concept_name, concept_data in task_data['folder_concepts'].items():
-                data_injection += f"⟦CONCEPT:{concept_name}⟧\n"
-                data_injection += concept_data['full_content']
-                data_injection += f"\n⟦/CONCEPT:{concept_name}⟧\n\n"
+                parts.append(f"⟦CONCEPT:{concept_name}⟧\n")
+                parts.append(self._concept_body(concept_data))
+                parts.append(f"\n⟦/CONCEPT:{concept_name}⟧\n\n")
                 
         elif 'folder_psi_stories' in task_data:
             # ψ(Σ) level - inject ψ(∴) stories from this folder
-            data_injection += f"⟦FOLDER_NAME⟧\n{task_data['folder_name']}\n⟦/FOLDER_NAME⟧\n\n"
-            data_injection += "⟦PSI_STORIES_FOR_SYNTHESIS⟧\n"
+            parts.append(f"⟦FOLDER_NAME⟧\n{task_data['folder_name']}\n⟦/FOLDER_NAME⟧\n\n")
+            if task_data.get('synthesis_shard'):
+                parts.append(f"⟦SYNTHESIS_SHARD⟧\nShard {task_data['synthesis_shard']} of this folder's stories"
+                             f" - its synthesis will be merged with the other shards\n⟦/SYNTHESIS_SHARD⟧\n\n")
+            parts.append("⟦PSI_STORIES_FOR_SYNTHESIS⟧\n")
             
             for concept_name, concept_data in task_data['folder_psi_stories'].items():
-                if 'glyph_story' in concept_data or 'native_story' in concept_data:
-                    data_injection += f"⟦ψ(∴):{concept_name}⟧\n"
-                    if 'glyph_story' in concept_data:
-                        data_injection += f"⟦ψ_glyphic(∴)⟧\n{concept_data['glyph_story']}\n⟦/ψ_glyphic(∴)⟧\n"
-                    if 'native_story' in concept_data:
-                        data_injection += f"⟦ψ_native(∴)⟧\n{concept_data['native_story']}\n⟦/ψ_native(∴)⟧\n"
-                    data_injection += f"⟦/ψ(∴):{concept_name}⟧\n\n"
-            data_injection += "⟦/PSI_STORIES_FOR_SYNTHESIS⟧\n"
+                if 'ψ_shard' in concept_data:
+                    # Sharded folder: a shard's synthesis stands in for its stories
+                    shard = concept_data['ψ_shard']
+                    parts.append(f"⟦ψ(Σ):{concept_name}⟧\n⟦CONCEPTS⟧ {', '.join(concept_data['concepts'])}\n")
+                    if 'glyph_story' in shard:
+                        parts.append(f"⟦ψ_glyphic(Σ)⟧\n{shard['glyph_story']}\n⟦/ψ_glyphic(Σ)⟧\n")
+                    if 'native_story' in shard:
+                        parts.append(f"⟦ψ_native(Σ)⟧\n{shard['native_story']}\n⟦/ψ_native(Σ)⟧\n")
+                    parts.append(f"⟦/ψ(Σ):{concept_name}⟧\n\n")
+                    continue
+                self._append_ψ_story(parts, concept_name, concept_data)
+            parts.append("⟦/PSI_STORIES_FOR_SYNTHESIS⟧\n")
             
         elif 'all_folder_results' in task_data:
             # ψ(∞) level - inject all previous results
-            data_injection += "⟦ALL_EXTRACTION_RESULTS⟧\n"
+            parts.append("⟦ALL_EXTRACTION_RESULTS⟧\n")
+            
+            if task_data.get('convergence_branch'):
+                parts.append(f"⟦CONVERGENCE_BRANCH⟧\nIntermediate braid over: {', '.join(task_data['convergence_branch'])}"
+                             f" - it will be woven with the other branches\n⟦/CONVERGENCE_BRANCH⟧\n\n")
             
             for folder_name, folder_data in task_data['all_folder_results'].items():
-                data_injection += f"⟦FOLDER:{folder_name}⟧\n"
+                if 'ψ_convergence' in folder_data:
+                    # Tree-reduce: a lower branch's braid stands in for its folders
+                    braid = folder_data['ψ_convergence']
+                    parts.append(f"⟦ψ(∞):{folder_name}⟧\n⟦FOLDERS⟧ {', '.join(folder_data['folders'])}\n")
+                    if 'glyph_story' in braid:
+                        parts.append(f"⟦ψ_glyphic(∞)⟧\n{braid['glyph_story']}\n⟦/ψ_glyphic(∞)⟧\n")
+                    if 'native_story' in braid:
+                        parts.append(f"⟦ψ_native(∞)⟧\n{braid['native_story']}\n⟦/ψ_native(∞)⟧\n")
+                    parts.append(f"⟦/ψ(∞):{folder_name}⟧\n\n")
+                    continue
+                
+                parts.append(f"⟦FOLDER:{folder_name}⟧\n")
                 
                 # Add ψ(∴) stories
                 if 'concepts' in folder_data:
                     for concept_name, concept_data in folder_data['concepts'].items():
-                        if 'glyph_story' in concept_data or 'native_story' in concept_data:
-                            data_injection += f"⟦ψ(∴):{concept_name}⟧\n"
-                            if 'glyph_story' in concept_data:
-                                data_injection += f"⟦ψ_glyphic(∴)⟧\n{concept_data['glyph_story']}\n⟦/ψ_glyphic(∴)⟧\n"
-                            if 'native_story' in concept_data:
-                                data_injection += f"⟦ψ_native(∴)⟧\n{concept_data['native_story']}\n⟦/ψ_native(∴)⟧\n"
-                            data_injection += f"⟦/ψ(∴):{concept_name}⟧\n\n"
+                        self._append_ψ_story(parts, concept_name, concept_data)
                 
                 # Add ψ(Σ) synthesis if available
                 if 'ψ_synthesis' in folder_data and folder_data['ψ_synthesis']:
                     synthesis = folder_data['ψ_synthesis']
-                    data_injection += f"⟦ψ(Σ):{folder_name}⟧\n"
+                    parts.append(f"⟦ψ(Σ):{folder_name}⟧\n")
                     if 'glyph_story' in synthesis:
-                        data_injection += f"⟦ψ_glyphic(Σ)⟧\n{synthesis['glyph_story']}\n⟦/ψ_glyphic(Σ)⟧\n"
+                        parts.append(f"⟦ψ_glyphic(Σ)⟧\n{synthesis['glyph_story']}\n⟦/ψ_glyphic(Σ)⟧\n")
                     if 'native_story' in synthesis:
-                        data_injection += f"⟦ψ_native(Σ)⟧\n{synthesis['native_story']}\n⟦/ψ_native(Σ)⟧\n"
-                    data_injection += f"⟦/ψ(Σ):{folder_name}⟧\n\n"
+                        parts.append(f"⟦ψ_native(Σ)⟧\n{synthesis['native_story']}\n⟦/ψ_native(Σ)⟧\n")
+                    parts.append(f"⟦/ψ(Σ):{folder_name}⟧\n\n")
                 
-                data_injection += f"⟦/FOLDER:{folder_name}⟧\n\n"
-            data_injection += "⟦/ALL_EXTRACTION_RESULTS⟧\n"
+                parts.append(f"⟦/FOLDER:{folder_name}⟧\n\n")
+            parts.append("⟦/ALL_EXTRACTION_RESULTS⟧\n")
         
-        data_injection += "⟦/INJECTED_DATA⟧"
-        return data_injection
+        parts.append("⟦/INJECTED_DATA⟧")
+        return ''.join(parts)
+    
+    @staticmethod
+    def _append_ψ_story(parts: List[str], concept_name: str, concept_data: Dict):
+        """A ψ(∴) story's glyphic and native sections, if it has either"""
+        if 'glyph_story' in concept_data or 'native_story' in concept_data:
+            parts.append(f"⟦ψ(∴):{concept_name}⟧\n")
+            if 'glyph_story' in concept_data:
+                parts.append(f"⟦ψ_glyphic(∴)⟧\n{concept_data['glyph_story']}\n⟦/ψ_glyphic(∴)⟧\n")
+            if 'native_story' in concept_data:
+                parts.append(f"⟦ψ_native(∴)⟧\n{concept_data['native_story']}\n⟦/ψ_native(∴)⟧\n")
+            parts.append(f"⟦/ψ(∴):{concept_name}⟧\n\n")
+    
+    def _concept_body(self, concept_data: Dict) -> str:
+        """A concept file's (capped) text, read from disk on demand"""
+        try:
+            return read_concept_text(concept_data['file_path'], concept_data.get('read_bytes'))
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"  ⧖ Error loading {concept_data['file_path']}: {e}")
+            return ''
 
     def _build_surprise_data_injection(self, surprise_data: Dict) -> str:
         """Build the previous surprise data injection section"""
@@ -1168,7 +2139,7 @@ class ψExtractor:
         enriched_concepts = {}
         
         for concept_name, concept_data in folder_concepts.items():
-            # Copy concept data but exclude full_content from final JSON
+            # Copy concept data but exclude the prompt-only size fields from final JSON
             enriched_concept = {
                 'concept_name': concept_data['concept_name'],
                 'file_path': concept_data['file_path'],
@@ -1191,6 +2162,7 @@ class ψExtractor:
         
         return enriched_concepts
 
+    @profiled('cross references')
     def _generate_cross_references(self, all_results: Dict):
         """Generate cross-references and analytics from extraction data"""
         
@@ -1238,6 +2210,7 @@ class ψExtractor:
             }
         }
 
+    @profiled('load')
     def load_previous_extractions(self, output_path: str = "ψ_extractions.json") -> Optional[Dict]:
         """Load previous extraction results if they exist"""
         try: